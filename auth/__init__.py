@@ -3,13 +3,15 @@ Authentication module for SAP AI Core LLM Proxy.
 
 This module provides authentication-related functionality including:
 - Token management with caching and thread-safety
+- Background token refresh
 - Request validation against configured tokens
 """
 
-from .token_manager import TokenManager
+from .token_manager import TokenManager, TokenRefresher
 from .request_validator import RequestValidator
 
 __all__ = [
     'TokenManager',
+    'TokenRefresher',
     'RequestValidator',
 ]
\ No newline at end of file
@@ -23,24 +23,33 @@ class RequestValidator:
     - Bearer token handling
     """
 
-    def __init__(self, valid_tokens: list[str]) -> None:
+    def __init__(
+        self, valid_tokens: list[str], allow_substring_match: bool = False
+    ) -> None:
         """Initialize validator with valid tokens.
 
         Args:
             valid_tokens: List of valid authentication tokens
+            allow_substring_match: Also accept request tokens that merely
+                contain a valid token (deprecated legacy behavior)
         """
         self.valid_tokens = valid_tokens
+        self.allow_substring_match = allow_substring_match
+        self._token_set = frozenset(valid_tokens)
 
-    def validate(self, request: Request) -> bool:
+    def validate(self, request: Request, token: str | None = None) -> bool:
         """Validate request authentication.
 
         Args:
             request: Request object with headers
+            token: Token already read from the request headers; extracted
+                from ``request`` when omitted
 
         Returns:
             True if request is authenticated, False otherwise
         """
-        token = RequestValidator._extract_token(request)
+        if token is None:
+            token = RequestValidator._extract_token(request)
 
         if not self.valid_tokens:
             logger.info("Authentication disabled - no tokens configured")
@@ -50,9 +59,13 @@ class RequestValidator:
             logger.error("Missing authentication token")
             return False
 
-        # Check if any valid token is in the request token
-        # Handles both "Bearer <token>" and just "<token>"
-        if not any(valid_token in token for valid_token in self.valid_tokens):
+        # "Bearer <token>" or "<token>" must match a valid token exactly; the
+        # legacy substring check only runs when explicitly enabled
+        raw_token = token[7:] if token.startswith("Bearer ") else token
+        if raw_token not in self._token_set and not (
+            self.allow_substring_match
+            and any(valid_token in token for valid_token in self.valid_tokens)
+        ):
             logger.error("Invalid authentication token")
             return False
 
@@ -70,6 +83,28 @@ class RequestValidator:
         return token
 
 
+# Validator for the configured token list, shared across requests. It is
+# rebuilt only when the config's token list object or match mode changes.
+_shared_validator: RequestValidator | None = None
+
+
+def _get_validator(
+    valid_tokens: list[str], allow_substring_match: bool = False
+) -> RequestValidator:
+    """Return the shared validator for ``valid_tokens``."""
+    global _shared_validator
+    validator = _shared_validator
+    if (
+        validator is None
+        or validator.valid_tokens is not valid_tokens
+        or validator.allow_substring_match != allow_substring_match
+    ):
+        validator = _shared_validator = RequestValidator(
+            valid_tokens, allow_substring_match
+        )
+    return validator
+
+
 def verify_request_token(
     request: Request,
     authorization: str | None = Header(default=None, alias="Authorization"),
@@ -79,9 +114,12 @@ def verify_request_token(
     if token:
         logger.debug("Token extracted: %s...", token[:15])
 
-    config = request.app.state.proxy_config
-    validator = RequestValidator(config.secret_authentication_tokens)
-    if not validator.validate(request):
+    proxy_config = request.app.state.proxy_config
+    validator = _get_validator(
+        proxy_config.secret_authentication_tokens,
+        proxy_config.allow_substring_token_match,
+    )
+    if not validator.validate(request, token):
         raise HTTPException(
             status_code=HTTP_401_UNAUTHORIZED,
             detail={
@@ -6,11 +6,12 @@ Features:
 - Thread-safe token caching
 - Automatic token refresh
 - Per-subaccount token management
+- Background refresh of tokens nearing expiry
 """
 
-import base64
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
 
 import requests
@@ -20,6 +21,13 @@ from utils.logging_utils import get_server_logger
 
 logger: Logger = get_server_logger(__name__)
 
+# How often the background refresher scans the token managers
+REFRESH_INTERVAL_SECONDS = 60.0
+# Tokens expiring within this window are refreshed ahead of time
+REFRESH_MARGIN_SECONDS = 600.0
+# How long stop() waits for the refresher thread before leaving it to die as a daemon
+STOP_JOIN_TIMEOUT_SECONDS = 1.0
+
 
 class TokenManager:
     """Manages authentication tokens for SAP AI Core subaccounts.
@@ -38,6 +46,9 @@ class TokenManager:
         """
         self.subaccount = subaccount
         self._lock = threading.Lock()
+        # (token, "Bearer <token>") pair so the header string is only rebuilt
+        # when the token changes
+        self._bearer: tuple[str, str] = ("", "")
 
     def get_token(self) -> str:
         """Get valid token, refreshing if necessary.
@@ -49,15 +60,43 @@ class TokenManager:
             ConnectionError: If token fetch fails
             ValueError: If token is empty
         """
+        # Fast path without the lock: a cached token is valid for hours, so
+        # almost every call returns here. Expiry is read before the token
+        # because _fetch_new_token stores the token first, so a fresh expiry
+        # always comes with its token.
+        token_info = self.subaccount.token_info
+        expiry = token_info.expiry
+        token: str | None = token_info.token
+        if token and time.time() < expiry:
+            return token
+
         with self._lock:
+            # Another thread may have refreshed while we waited for the lock
             if self._is_token_valid():
-                token: str | None = self.subaccount.token_info.token
+                token = self.subaccount.token_info.token
 
                 if token is not None:
                     return token
 
             return self._fetch_new_token()
 
+    def get_bearer_header(self) -> str:
+        """Get the Authorization header value for a valid token.
+
+        Returns:
+            ``Bearer <token>`` for the current token
+
+        Raises:
+            ConnectionError: If token fetch fails
+            ValueError: If token is empty
+        """
+        token = self.get_token()
+        cached_token, header = self._bearer
+        if token != cached_token:
+            header = f"Bearer {token}"
+            self._bearer = (token, header)
+        return header
+
     def _is_token_valid(self) -> bool:
         """Check if cached token is still valid."""
         if not self.subaccount.token_info.token:
@@ -66,6 +105,26 @@ class TokenManager:
         now = time.time()
         return now < self.subaccount.token_info.expiry
 
+    def refresh_if_expiring(self, margin: float = REFRESH_MARGIN_SECONDS) -> bool:
+        """Fetch a new token if the cached one expires within ``margin``.
+
+        Args:
+            margin: Seconds before expiry at which the token is refreshed
+
+        Returns:
+            True if a new token was fetched, False if the cached one was kept
+
+        Raises:
+            ConnectionError: If token fetch fails
+            ValueError: If token is empty
+        """
+        with self._lock:
+            token_info = self.subaccount.token_info
+            if token_info.token and time.time() < token_info.expiry - margin:
+                return False
+            self._fetch_new_token()
+            return True
+
     def invalidate_token(self) -> None:
         """Invalidate the cached token for this subaccount.
 
@@ -89,14 +148,12 @@ class TokenManager:
                 f"Service key not loaded for subaccount '{self.subaccount.name}'"
             )
 
-        auth_string = f"{service_key.client_id}:{service_key.client_secret}"
-        encoded_auth = base64.b64encode(auth_string.encode()).decode()
-
-        token_url = f"{service_key.auth_url}/oauth/token?grant_type=client_credentials"
-        headers = {"Authorization": f"Basic {encoded_auth}"}
+        headers = {"Authorization": service_key.basic_auth_header}
 
         try:
-            response = requests.post(token_url, headers=headers, timeout=15)
+            response = requests.post(
+                service_key.token_url, headers=headers, timeout=15
+            )
             # Check HTTP status
             response.raise_for_status()
 
@@ -130,3 +187,76 @@ class TokenManager:
         except Exception as err:
             logger.error(f"Unexpected error fetching token: {err}", exc_info=True)
             raise RuntimeError(f"Unexpected error: {err}") from err
+
+
+class TokenRefresher:
+    """Refreshes subaccount tokens in the background before they expire.
+
+    A daemon thread scans the token managers every ``interval`` seconds and
+    refreshes those expiring within ``margin`` in parallel, so request
+    handlers read a cached token instead of blocking on the token endpoint.
+    The first scan runs immediately to prime the tokens at startup.
+    """
+
+    def __init__(
+        self,
+        token_managers: dict[str, TokenManager],
+        interval: float = REFRESH_INTERVAL_SECONDS,
+        margin: float = REFRESH_MARGIN_SECONDS,
+    ) -> None:
+        """Initialize the refresher.
+
+        Args:
+            token_managers: Token managers keyed by subaccount name
+            interval: Seconds between scans
+            margin: Seconds before expiry at which tokens are refreshed
+        """
+        self.token_managers = token_managers
+        self.interval = interval
+        self.margin = margin
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the background refresh thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="token-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=STOP_JOIN_TIMEOUT_SECONDS)
+            self._thread = None
+
+    def refresh_all(self) -> None:
+        """Refresh every token nearing expiry, one fetch per subaccount in parallel."""
+        managers = list(self.token_managers.items())
+        if not managers:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(managers)) as executor:
+            futures = {
+                name: executor.submit(manager.refresh_if_expiring, self.margin)
+                for name, manager in managers
+            }
+            for name, future in futures.items():
+                try:
+                    future.result()
+                except Exception as err:
+                    # The request path fetches on demand, so a failed
+                    # background refresh is retried there or on the next scan
+                    logger.warning(
+                        "Background token refresh failed for '%s': %s", name, err
+                    )
+
+    def _run(self) -> None:
+        while True:
+            self.refresh_all()
+            if self._stop_event.wait(self.interval):
+                break
@@ -17,6 +17,7 @@ def parse_arguments():
             - config (str): Path to configuration file (default: "config.json")
             - debug (bool): Enable debug mode
             - port (int | None): Port number to run the server on
+            - workers (int): Number of server worker processes
             - refresh_cache (bool): Force refresh deployment cache
     """
     version_string = get_version_string()
@@ -46,6 +47,13 @@ def parse_arguments():
         default=None,
         help="Port number to run the server on (overrides config file)",
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of server worker processes (default: 1)",
+    )
     parser.add_argument(
         "--refresh-cache",
         action="store_true",
@@ -8,6 +8,8 @@ See the comment block in config_parser.py for a detailed explanation of why we
 maintain both Pydantic models (for JSON validation) and dataclasses (for runtime state).
 """
 
+import base64
+import functools
 import threading
 from dataclasses import dataclass, field
 from logging import Logger
@@ -45,6 +47,21 @@ class ServiceKey:
     identity_zone_id: str
     api_url: str
 
+    @functools.cached_property
+    def token_url(self) -> str:
+        """OAuth client-credentials token endpoint, built once on first use."""
+        return f"{self.auth_url}/oauth/token?grant_type=client_credentials"
+
+    @functools.cached_property
+    def basic_auth_header(self) -> str:
+        """Basic Authorization header value for the token endpoint.
+
+        Built once on first use instead of re-encoding the client credentials
+        on every token refresh.
+        """
+        auth_string = f"{self.client_id}:{self.client_secret}"
+        return "Basic " + base64.b64encode(auth_string.encode()).decode()
+
 
 @dataclass
 class TokenInfo:
@@ -67,6 +84,19 @@ class SubAccountConfig:
     token_info: TokenInfo = field(default_factory=TokenInfo)
     model_to_deployment_ids: dict[str, list[str]] = field(default_factory=dict)
 
+    @functools.cached_property
+    def header_template(self) -> dict[str, str]:
+        """Static backend request headers for this subaccount.
+
+        Built once on first use; callers copy it and add the Authorization
+        header per request.
+        """
+        return {
+            "AI-Resource-Group": self.resource_group,
+            "Content-Type": "application/json",
+            "AI-Tenant-Id": self.service_key.identity_zone_id,
+        }
+
 
 @dataclass
 class ProxyConfig:
@@ -77,6 +107,13 @@ class ProxyConfig:
     port: int = 3001
     host: str = "127.0.0.1"
     model_filters: Optional[ModelFilters] = None
+    # Text delta coalescing for /v1/messages streams (0 bytes disables it)
+    stream_flush_bytes: int = 256
+    stream_flush_ms: int = 20
+    # Maximum bytes of a request/response body written to the logs (0 = all)
+    log_body_max_bytes: int = 4096
+    # Deprecated: accept request tokens that merely contain a configured token
+    allow_substring_token_match: bool = False
     # Global model to subaccount mapping for load balancing
     model_to_subaccounts: dict[str, list[str]] = field(default_factory=dict)
 
@@ -6,6 +6,7 @@ This module handles loading and parsing configuration from JSON files.
 
 import json
 import re
+import sys
 from logging import Logger
 
 from typing import Optional
@@ -77,6 +78,10 @@ class ProxyConfigSchema(BaseModel):
     port: int = 3001
     host: str = "127.0.0.1"
     model_filters: Optional[ModelFiltersSchema] = Field(default=None)
+    stream_flush_bytes: int = Field(default=256, ge=0)
+    stream_flush_ms: int = Field(default=20, ge=0)
+    log_body_max_bytes: int = Field(default=4096, ge=0)
+    allow_substring_token_match: bool = False
     subAccounts: dict[str, SubAccountConfigSchema] = Field(default_factory=dict)
 
 
@@ -228,6 +233,10 @@ def load_proxy_config(file_path: str) -> ProxyConfig:
         port=config_schema.port,
         host=config_schema.host,
         model_filters=model_filters,
+        stream_flush_bytes=config_schema.stream_flush_bytes,
+        stream_flush_ms=config_schema.stream_flush_ms,
+        log_body_max_bytes=config_schema.log_body_max_bytes,
+        allow_substring_token_match=config_schema.allow_substring_token_match,
     )
 
     # Parse each subAccount
@@ -263,6 +272,7 @@ def load_proxy_config(file_path: str) -> ProxyConfig:
                     f"Subaccount '{sub_name}': All models filtered out (zero models remaining)"
                 )
 
+        sub_name = sys.intern(sub_name)
         sub_account_config: SubAccountConfig = SubAccountConfig(
             name=sub_name,
             resource_group=sub_config_schema.resource_group,
@@ -278,13 +288,18 @@ def load_proxy_config(file_path: str) -> ProxyConfig:
         _build_mapping_for_subaccount(sub_account_config)
         _dump_subaccount_config(sub_account_config)
 
-    # Build model to subaccounts mapping
+    # Build model to subaccounts mapping. Model names are interned so the
+    # per-request lookups in load_balancer compare keys by identity.
     proxy_config.model_to_subaccounts = {}
     for subaccount_name, subaccount in proxy_config.subaccounts.items():
-        for model in subaccount.model_to_deployment_urls.keys():
-            if model not in proxy_config.model_to_subaccounts:
-                proxy_config.model_to_subaccounts[model] = []
-            proxy_config.model_to_subaccounts[model].append(subaccount_name)
+        subaccount.model_to_deployment_urls = {
+            sys.intern(model): urls
+            for model, urls in subaccount.model_to_deployment_urls.items()
+        }
+        for model in subaccount.model_to_deployment_urls:
+            proxy_config.model_to_subaccounts.setdefault(model, []).append(
+                subaccount_name
+            )
 
     # Log configuration
     logger.info(
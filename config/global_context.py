@@ -43,6 +43,7 @@ class ProxyGlobalContext:
         self.token_managers = {}
         for sub_name, sub_config in config.subaccounts.items():
             self.token_managers[sub_name] = TokenManager(sub_config)
+        self.token_refresher = None
         logger.info(
             "ProxyGlobalContext initialized with %d subaccounts",
             len(config.subaccounts),
@@ -60,19 +61,39 @@ class ProxyGlobalContext:
         Raises:
             KeyError: If subaccount not found
         """
-        if subaccount_name not in self.token_managers:
-            if subaccount_name not in self.config.subaccounts:
-                raise KeyError(f"Subaccount '{subaccount_name}' not found in config")
-            # Lazy create token manager
-            from auth.token_manager import TokenManager
+        # Hot path: managers are created in initialize(), so this is one lookup
+        token_manager = self.token_managers.get(subaccount_name)
+        if token_manager is not None:
+            return token_manager
+
+        if subaccount_name not in self.config.subaccounts:
+            raise KeyError(f"Subaccount '{subaccount_name}' not found in config")
+        # Lazy create token manager; setdefault keeps a single manager (and
+        # token cache) if two requests race here
+        from auth.token_manager import TokenManager
+
+        return self.token_managers.setdefault(
+            subaccount_name, TokenManager(self.config.subaccounts[subaccount_name])
+        )
+
+    def start_token_refresher(self) -> None:
+        """Start refreshing subaccount tokens in the background.
+
+        Called by the server at startup so request handlers find a valid
+        cached token instead of fetching one on the request path.
+        """
+        from auth.token_manager import TokenRefresher
 
-            self.token_managers[subaccount_name] = TokenManager(
-                self.config.subaccounts[subaccount_name]
-            )
-        return self.token_managers[subaccount_name]
+        if self.token_refresher is None:
+            self.token_refresher = TokenRefresher(self.token_managers)
+            self.token_refresher.start()
 
     def shutdown(self):
         """Shutdown the global context and cleanup resources."""
+        token_refresher = getattr(self, "token_refresher", None)
+        if token_refresher is not None:
+            token_refresher.stop()
+            self.token_refresher = None
         # Cleanup token managers if needed
         self.token_managers.clear()
         logger.info("ProxyGlobalContext shutdown complete")
@@ -18,7 +18,7 @@ bedrock_retry = unified_retry
 
 
 @bedrock_retry
-def invoke_bedrock_streaming(bedrock_client, body_json: str):
+def invoke_bedrock_streaming(bedrock_client, body_json: bytes | str):
     """
     Invoke Bedrock streaming API with retry logic for rate limits.
 
@@ -27,7 +27,7 @@ def invoke_bedrock_streaming(bedrock_client, body_json: str):
 
     Args:
         bedrock_client: The Bedrock client wrapper
-        body_json: JSON string of the request body
+        body_json: JSON-encoded request body
 
     Returns:
         The streaming response from Bedrock
@@ -36,13 +36,13 @@ def invoke_bedrock_streaming(bedrock_client, body_json: str):
 
 
 @bedrock_retry
-def invoke_bedrock_non_streaming(bedrock_client, body_json: str):
+def invoke_bedrock_non_streaming(bedrock_client, body_json: bytes | str):
     """
     Invoke Bedrock non-streaming API with retry logic for rate limits.
 
     Args:
         bedrock_client: The Bedrock client wrapper
-        body_json: JSON string of the request body
+        body_json: JSON-encoded request body
 
     Returns:
         The response from Bedrock
@@ -50,22 +50,19 @@ def invoke_bedrock_non_streaming(bedrock_client, body_json: str):
     return bedrock_client.invoke_model(body=body_json)
 
 
-def read_response_body_stream(response_body) -> str:
+def read_response_body_stream(response_body) -> bytes:
     """
-    Read response body stream and return as string.
+    Read response body stream and return the raw bytes.
+
+    The bytes are left undecoded so they can go straight to orjson.loads.
 
     Args:
         response_body: The streaming response body from AWS SDK
 
     Returns:
-        String containing the full response data
+        Bytes containing the full response data
     """
-    chunk_data = ""
-
-    chunk_data = ""
-    for event in response_body:
-        if isinstance(event, bytes):
-            chunk_data += event.decode("utf-8")
-        else:
-            chunk_data += str(event)
-    return chunk_data
+    return b"".join(
+        event if isinstance(event, bytes) else str(event).encode("utf-8")
+        for event in response_body
+    )
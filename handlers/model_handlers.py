@@ -7,6 +7,10 @@ This module contains handlers for routing requests to different model backends:
 - Default (OpenAI-compatible, e.g., GPT models)
 """
 
+import functools
+import re
+from typing import Callable
+
 from load_balancer import load_balance_url
 from proxy_helpers import Converters, Detector
 from utils.logging_utils import get_server_logger
@@ -17,9 +21,41 @@ logger = get_server_logger(__name__)
 API_VERSION_2023_05_15 = "2023-05-15"
 API_VERSION_2024_12_01_PREVIEW = "2024-12-01-preview"
 
+# Models served through the preview API version (substring match on the model
+# name; "o3" also covers "o3-mini")
+_PREVIEW_API_MODELS_RE = re.compile(r"o3|o4-mini|gpt-5")
+
 # Default model constants
 DEFAULT_GPT_MODEL = "gpt-4.1"
 
+# Chat completions endpoint path per API version
+_CHAT_COMPLETIONS_PATHS = {
+    version: f"/chat/completions?api-version={version}"
+    for version in (API_VERSION_2023_05_15, API_VERSION_2024_12_01_PREVIEW)
+}
+
+# Bedrock endpoint paths (streaming, non-streaming) and OpenAI payload
+# converter for Claude models, keyed by Detector.is_claude_37_or_4(model):
+# 3.7/4+ models use the Converse API, older ones InvokeModel.
+_CLAUDE_DISPATCH = {
+    True: ("/converse-stream", "/converse", Converters.convert_openai_to_claude37),
+    False: (
+        "/invoke-with-response-stream",
+        "/invoke",
+        Converters.convert_openai_to_claude,
+    ),
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _endpoint_url(deployment_url: str, endpoint_path: str) -> str:
+    """Append an endpoint path to a deployment URL.
+
+    Deployment URLs and paths come from small fixed sets, so each endpoint URL
+    is built once rather than on every request.
+    """
+    return f"{deployment_url.rstrip('/')}{endpoint_path}"
+
 
 def handle_claude_request(payload, model, proxy_config):
     """Handle Claude model request with multi-subAccount support.
@@ -47,27 +83,14 @@ def handle_claude_request(payload, model, proxy_config):
         )
         raise ValueError(f"No valid Claude model found for '{model}' in any subAccount")
 
-    # Determine the endpoint path based on model and streaming settings
-    if stream:
-        # Check if the model is Claude 3.7 or 4 for streaming endpoint
-        if Detector.is_claude_37_or_4(model):
-            endpoint_path = "/converse-stream"
-        else:
-            endpoint_path = "/invoke-with-response-stream"
-    else:
-        # Check if the model is Claude 3.7 or 4
-        if Detector.is_claude_37_or_4(model):
-            endpoint_path = "/converse"
-        else:
-            endpoint_path = "/invoke"
-
-    endpoint_url = f"{selected_url.rstrip('/')}{endpoint_path}"
+    # Pick the endpoint path and payload format for the model's API family
+    stream_path, non_stream_path, convert_payload = _CLAUDE_DISPATCH[
+        Detector.is_claude_37_or_4(model)
+    ]
+    endpoint_path = stream_path if stream else non_stream_path
 
-    # Convert the payload to the right format
-    if Detector.is_claude_37_or_4(model):
-        modified_payload = Converters.convert_openai_to_claude37(payload)
-    else:
-        modified_payload = Converters.convert_openai_to_claude(payload)
+    endpoint_url = _endpoint_url(selected_url, endpoint_path)
+    modified_payload = convert_payload(payload)
 
     logger.info(
         f"handle_claude_request: {endpoint_url} (subAccount: {subaccount_name})"
@@ -113,7 +136,7 @@ def handle_gemini_request(payload, model, proxy_config):
     else:
         endpoint_path = f"/models/{model_endpoint_name}:generateContent"
 
-    endpoint_url = f"{selected_url.rstrip('/')}{endpoint_path}"
+    endpoint_url = _endpoint_url(selected_url, endpoint_path)
 
     # Convert the payload to Gemini format
     modified_payload = Converters.convert_openai_to_gemini(payload)
@@ -139,7 +162,7 @@ def handle_default_request(payload, model, proxy_config):
     selected_url, subaccount_name, _, model = load_balance_url(model, proxy_config)
 
     # Determine API version based on model
-    if any(m in model for m in ["o3", "o4-mini", "o3-mini", "gpt-5"]):
+    if _PREVIEW_API_MODELS_RE.search(model):
         api_version = API_VERSION_2024_12_01_PREVIEW
         # Remove unsupported parameters for o3-mini
         modified_payload = payload.copy()
@@ -151,11 +174,29 @@ def handle_default_request(payload, model, proxy_config):
         api_version = API_VERSION_2023_05_15
         modified_payload = payload
 
-    endpoint_url = (
-        f"{selected_url.rstrip('/')}/chat/completions?api-version={api_version}"
-    )
+    endpoint_url = _endpoint_url(selected_url, _CHAT_COMPLETIONS_PATHS[api_version])
 
     logger.info(
         f"handle_default_request: {endpoint_url} (subAccount: {subaccount_name})"
     )
     return endpoint_url, modified_payload, subaccount_name
+
+
+@functools.lru_cache(maxsize=256)
+def select_request_handler(model: str) -> Callable:
+    """Return the request handler for the model family of ``model``.
+
+    Results are cached per model name, so the Claude/Gemini detection runs
+    once per model rather than on every request.
+
+    Args:
+        model: The requested model name
+
+    Returns:
+        handle_claude_request, handle_gemini_request or handle_default_request
+    """
+    if Detector.is_claude_model(model):
+        return handle_claude_request
+    if Detector.is_gemini_model(model):
+        return handle_gemini_request
+    return handle_default_request
@@ -6,29 +6,119 @@ responses from various LLM backends (Bedrock, Claude, Gemini, OpenAI).
 Phase 6d: Streaming generators extraction
 """
 
-import ast
 import asyncio
+import itertools
 import json
 import logging
-import random
+import os
+import re
+import socket
+import threading
 import time
-from typing import Any, AsyncGenerator, Generator
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Generator, Iterable
 
 import httpx
-import requests
+import orjson
 from fastapi import Request
+from fastapi.concurrency import iterate_in_threadpool
 
+from load_balancer import begin_request, end_request
 from proxy_helpers import Converters, Detector
 from handlers.streaming_handler import (
     get_claude_stop_reason_from_gemini_chunk,
     get_claude_stop_reason_from_openai_chunk,
 )
 from utils.auth_retry import AUTH_RETRY_MAX, log_auth_error_retry
+from utils.logging_utils import LazyJson, client_log_identity, traceback_allowed
 
 logger = logging.getLogger(__name__)
 transport_logger = logging.getLogger("transport")
 token_usage_logger = logging.getLogger("token_usage")
 
+# ------------------------
+# Shared HTTP client for the synchronous streaming generators
+# ------------------------
+# Reusing one client keeps upstream connections (and their TLS sessions) alive
+# across streams. Responses are consumed with iter_raw(), so compression is
+# disabled to keep the raw bytes plain SSE text.
+SYNC_STREAM_CHUNK_SIZE = 65536
+_sync_stream_client_lock = threading.Lock()
+_sync_stream_client: httpx.Client | None = None
+
+
+def _get_sync_stream_client() -> httpx.Client:
+    """Lazily initialize and return the process-wide streaming httpx.Client.
+
+    Returns:
+        httpx.Client with TCP_NODELAY enabled and a 600s timeout
+    """
+    global _sync_stream_client
+    if _sync_stream_client is None:
+        with _sync_stream_client_lock:
+            if _sync_stream_client is None:
+                transport = httpx.HTTPTransport(
+                    socket_options=[(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+                )
+                _sync_stream_client = httpx.Client(
+                    transport=transport,
+                    timeout=httpx.Timeout(600),
+                    headers={"Accept-Encoding": "identity"},
+                )
+    return _sync_stream_client
+
+
+# Shared HTTP client for the async streaming generators
+# ------------------------
+# Creating an AsyncClient per stream rebuilds its SSL context and drops the
+# upstream connection afterwards. Pooled connections belong to the event loop
+# that opened them, so one client is kept per running loop (in practice one
+# per uvicorn worker).
+_async_stream_client: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
+
+
+def _get_async_stream_client() -> httpx.AsyncClient:
+    """Return the streaming httpx.AsyncClient for the running event loop.
+
+    Returns:
+        httpx.AsyncClient with a 600s timeout and no connection cap
+    """
+    global _async_stream_client
+    loop = asyncio.get_running_loop()
+    cached = _async_stream_client
+    if cached is None or cached[0] is not loop:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(600),
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=64),
+        )
+        cached = _async_stream_client = (loop, client)
+    return cached[1]
+
+
+def _iter_raw_lines(chunks: Iterable[bytes]) -> Generator[bytes, None, None]:
+    """Split a raw byte stream into non-empty lines without decoding.
+
+    Partial lines are kept in a buffer until the next chunk completes them.
+
+    Args:
+        chunks: Iterable of raw byte chunks from the upstream response
+
+    Yields:
+        Each non-empty line with the trailing newline (and CR) removed
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line = bytes(buffer[start:end]).rstrip(b"\r")
+            start = end + 1
+            if line:
+                yield line
+        del buffer[:start]
+    line = bytes(buffer).rstrip(b"\r")
+    if line:
+        yield line
+
 
 def is_gemini_2_5_pro_format(chunk: dict[str, Any]) -> bool:
     """Detect if a chunk matches Gemini-2.5-pro's streaming format.
@@ -80,25 +170,233 @@ def is_gemini_2_5_pro_format(chunk: dict[str, Any]) -> bool:
     return "text" in part
 
 
-def _format_sse_event(event_type: str, payload: dict[str, Any]) -> str:
-    return f"event: {event_type}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+# Response ids are a per-process prefix (start time in nanoseconds and pid)
+# plus a monotonic counter, which is cheaper than random.randint(). The pid
+# keeps worker processes started in the same instant from sharing ids.
+_ID_PREFIX = f"{time.time_ns():x}_{os.getpid():x}"
+_id_counter = itertools.count(1)
+
+
+def _next_id() -> str:
+    """Return a process-unique suffix for generated response ids."""
+    return f"{_ID_PREFIX}_{next(_id_counter):x}"
+
+
+# Pre-encoded event names for the Claude Messages API stream
+_EV_MESSAGE_START = b"message_start"
+_EV_CONTENT_BLOCK_START = b"content_block_start"
+_EV_CONTENT_BLOCK_DELTA = b"content_block_delta"
+_EV_CONTENT_BLOCK_STOP = b"content_block_stop"
+_EV_MESSAGE_DELTA = b"message_delta"
+_EV_MESSAGE_STOP = b"message_stop"
+
+
+def _sse(event_name: bytes, body: bytes) -> bytes:
+    """Build an SSE frame directly as bytes.
+
+    Args:
+        event_name: Pre-encoded SSE event name
+        body: JSON-encoded event payload (e.g. from orjson.dumps)
+
+    Returns:
+        The complete ``event:``/``data:`` frame terminated by a blank line
+    """
+    return b"".join((b"event: ", event_name, b"\ndata: ", body, b"\n\n"))
+
+
+# Only the message id and model vary between message_start frames, so the
+# frame is serialized once and the two placeholders are substituted per stream.
+_MESSAGE_START_TEMPLATE = _sse(
+    _EV_MESSAGE_START,
+    b'{"type":"message_start","message":{"id":"__ID__","type":"message",'
+    b'"role":"assistant","content":[],"model":__MODEL__,"stop_reason":null,'
+    b'"stop_sequence":null,"usage":{"input_tokens":0,"output_tokens":0}}}',
+)
+
+
+def _message_start_frame(model: str) -> bytes:
+    """Render the message_start SSE frame for a new Claude stream.
+
+    Args:
+        model: Model name reported back to the client
+
+    Returns:
+        The encoded message_start frame
+    """
+    message_id = f"msg_{_next_id()}".encode()
+    return _MESSAGE_START_TEMPLATE.replace(b"__ID__", message_id).replace(
+        b"__MODEL__", orjson.dumps(model)
+    )
+
+
+_CONTENT_BLOCK_START_FRAME = _sse(
+    _EV_CONTENT_BLOCK_START,
+    orjson.dumps(
+        {
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {"type": "text", "text": ""},
+        }
+    ),
+)
+_CONTENT_BLOCK_STOP_FRAME = _sse(
+    _EV_CONTENT_BLOCK_STOP, orjson.dumps({"type": "content_block_stop", "index": 0})
+)
+_MESSAGE_STOP_FRAME = _sse(_EV_MESSAGE_STOP, orjson.dumps({"type": "message_stop"}))
+
+# Default coalescing window for text deltas in the Bedrock Claude stream
+# (ProxyConfig.stream_flush_bytes/stream_flush_ms). Adjacent deltas are merged
+# until this many characters are pending or the oldest pending delta is this
+# many milliseconds old; 0 bytes disables it.
+_FLUSH_BYTES = 256
+_FLUSH_MS = 20
+
+
+_TEXT_DELTA_PREFIX = (
+    b'{"type":"content_block_delta","index":0,' b'"delta":{"type":"text_delta","text":"'
+)
+# Everything before and after the delta text in a text_delta frame, so each
+# frame is assembled with a single join instead of nested concatenations.
+_TEXT_DELTA_FRAME_HEAD = (
+    b"event: " + _EV_CONTENT_BLOCK_DELTA + b"\ndata: " + _TEXT_DELTA_PREFIX
+)
+_TEXT_DELTA_FRAME_TAIL = b'"}}\n\n'
+
+
+def _text_delta_frame(text_json: bytes) -> bytes:
+    """Build a content_block_delta frame carrying a text delta.
+
+    Args:
+        text_json: The delta text as a JSON string body, escaped but unquoted
+
+    Returns:
+        The encoded content_block_delta frame
+    """
+    return b"".join((_TEXT_DELTA_FRAME_HEAD, text_json, _TEXT_DELTA_FRAME_TAIL))
+
+
+# A plain Claude backend text delta, e.g.
+# {"contentBlockDelta":{"delta":{"text":"Hi"},"contentBlockIndex":0}}.
+# Group 1 is the JSON string body, which can be copied into the outgoing
+# frame as-is without decoding and re-encoding the chunk.
+_CLAUDE_TEXT_DELTA_RE = re.compile(
+    r'\{"contentBlockDelta":\{"delta":\{"text":"((?:[^"\\]++|\\.)*+)"\}'
+    r'(?:,"contentBlockIndex":\d+)?\}\}'
+)
+
+
+def _claude_text_delta_fast_path(data_content: str) -> bytes | None:
+    """Extract the escaped text of a plain contentBlockDelta without parsing JSON.
+
+    Args:
+        data_content: The ``data:`` payload of a Claude backend SSE line
+
+    Returns:
+        The JSON-escaped delta text, or None if the payload has any other shape
+    """
+    match = _CLAUDE_TEXT_DELTA_RE.fullmatch(data_content)
+    return match.group(1).encode() if match else None
+
+
+# Extra headers for SSE responses: keep caches and buffering reverse proxies
+# (nginx honours X-Accel-Buffering) from holding back events.
+SSE_RESPONSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+# Bedrock Claude chunks are already Anthropic Messages events and serialize
+# their "type" first, so the event name is read without parsing the chunk.
+_BEDROCK_CHUNK_TYPE_RE = re.compile(rb'\{\s*"type"\s*:\s*"([a-z_]+)"')
+_BEDROCK_EVENT_NAMES = {
+    name: name.encode()
+    for name in (
+        "message_start",
+        "content_block_start",
+        "content_block_delta",
+        "content_block_stop",
+        "message_delta",
+        "message_stop",
+        "error",
+    )
+}
+
+
+# A plain Bedrock text delta as serialized by the backend. Group 1 is the
+# block index and group 2 the JSON string body of the text; other delta
+# shapes are passed through without coalescing.
+_BEDROCK_TEXT_DELTA_RE = re.compile(
+    rb'\{"type":"content_block_delta","index":(\d+),'
+    rb'"delta":\{"type":"text_delta","text":"((?:[^"\\]++|\\.)*+)"\}\}'
+)
+
+
+def _bedrock_text_delta_frame(index: bytes, text_json: bytes) -> bytes:
+    """Build a content_block_delta frame for a (merged) Bedrock text delta.
+
+    Args:
+        index: The content block index as JSON digits
+        text_json: The delta text as a JSON string body, escaped but unquoted
+
+    Returns:
+        The encoded content_block_delta frame
+    """
+    return b"".join(
+        (
+            b'event: content_block_delta\ndata: {"type":"content_block_delta",'
+            b'"index":',
+            index,
+            b',"delta":{"type":"text_delta","text":"',
+            text_json,
+            _TEXT_DELTA_FRAME_TAIL,
+        )
+    )
+
+
+def _bedrock_chunk_type(raw: bytes) -> str | None:
+    """Return the ``type`` of a raw Bedrock Claude chunk.
+
+    Args:
+        raw: JSON-encoded chunk bytes from the EventStream
+
+    Returns:
+        The chunk type, or None if the chunk has none
+    """
+    match = _BEDROCK_CHUNK_TYPE_RE.match(raw)
+    if match:
+        return match.group(1).decode()
+    chunk_type = orjson.loads(raw).get("type")
+    return chunk_type if isinstance(chunk_type, str) else None
 
 
 async def generate_bedrock_streaming_response(
     response_body: Any,
     tid: str,
-) -> AsyncGenerator[str, None]:
+    subaccount_name: str | None = None,
+    flush_bytes: int = _FLUSH_BYTES,
+    flush_ms: int = _FLUSH_MS,
+) -> AsyncGenerator[bytes, None]:
     """Generate streaming response from Bedrock SDK EventStream.
 
-    This generator converts AWS Bedrock EventStream responses into Server-Sent
-    Events (SSE) format compatible with the Anthropic Claude Messages API.
+    Bedrock already emits Anthropic Claude Messages events, so each chunk's
+    JSON is passed through unchanged as the SSE ``data`` payload, except that
+    adjacent text deltas of a content block are coalesced. They are held back
+    until ``flush_bytes`` characters are pending or the oldest one is
+    ``flush_ms`` old, and then sent as a single content_block_delta. The age
+    limit is a deadline: while text is pending, the wait for the next event is
+    bounded by it, so a pause upstream does not hold text back. Pending text
+    is always flushed before any other event.
+
+    The EventStream is a blocking iterator, so events are read in the
+    threadpool.
 
     Args:
         response_body: AWS Bedrock EventStream iterator yielding chunk events
         tid: Trace UUID for logging correlation
+        subaccount_name: SubAccount serving the stream; when given, the stream
+            counts as an in-flight request for load balancing
+        flush_bytes: Pending text size that triggers a flush; 0 disables coalescing
+        flush_ms: Maximum age in milliseconds of pending text
 
     Yields:
-        SSE-formatted response strings (event + data lines)
+        SSE-formatted response frames (event + data lines) as bytes
 
     SSE Event Types:
         - message_start: Initial message metadata
@@ -109,57 +407,111 @@ async def generate_bedrock_streaming_response(
         - message_stop: End of message stream
         - error: Error information
     """
+    coalesce = flush_bytes > 0
+    flush_window = flush_ms / 1000
+    # Pending text is kept JSON-escaped, exactly as Bedrock serialized it
+    pending_index = b""
+    pending_text: list[bytes] = []
+    pending_len = 0
+    pending_since = 0.0
+
+    def take_pending() -> bytes:
+        nonlocal pending_len
+        frame = _bedrock_text_delta_frame(pending_index, b"".join(pending_text))
+        pending_text.clear()
+        pending_len = 0
+        transport_logger.info("CHUNK: tid=%s, %s", tid, frame[:200])
+        return frame
+
+    events = aiter(iterate_in_threadpool(response_body))
+    # Fetched as a task only while text is pending, so the wait for the next
+    # event can be bounded by the flush deadline
+    next_event: asyncio.Future[Any] | None = None
+
+    if subaccount_name is not None:
+        begin_request(subaccount_name)
     try:
-        for event in response_body:
-            chunk = json.loads(event["chunk"]["bytes"])
-            logger.debug("Streaming chunk: %s", chunk)
-
-            # Log raw chunk from Bedrock
-            transport_logger.info("CHUNK: tid=%s, %s", tid, json.dumps(chunk)[:200])
+        while True:
+            if pending_text:
+                if next_event is None:
+                    next_event = asyncio.ensure_future(anext(events))
+                remaining = flush_window - (time.monotonic() - pending_since)
+                if remaining > 0:
+                    await asyncio.wait((next_event,), timeout=remaining)
+                if not next_event.done():
+                    # The backend paused: send the pending text by its deadline
+                    yield take_pending()
+            try:
+                if next_event is not None:
+                    event = await next_event
+                else:
+                    event = await anext(events)
+            except StopAsyncIteration:
+                break
+            finally:
+                next_event = None
+
+            raw = event["chunk"]["bytes"]
+            if isinstance(raw, str):
+                raw = raw.encode()
+            logger.debug("Streaming chunk: %s", raw)
+
+            if coalesce:
+                text_match = _BEDROCK_TEXT_DELTA_RE.fullmatch(raw)
+                if text_match is not None:
+                    index, text_json = text_match.groups()
+                    if pending_text and index != pending_index:
+                        yield take_pending()
+                    if not pending_text:
+                        pending_index = index
+                        pending_since = time.monotonic()
+                    pending_text.append(text_json)
+                    pending_len += len(text_json)
+                    if (
+                        pending_len >= flush_bytes
+                        or time.monotonic() - pending_since >= flush_window
+                    ):
+                        yield take_pending()
+                    continue
+
+            chunk_type = _bedrock_chunk_type(raw)
+            event_name = _BEDROCK_EVENT_NAMES.get(chunk_type)
+            if event_name is None:
+                continue
 
-            chunk_type = chunk.get("type")
+            if pending_text:
+                yield take_pending()
 
-            # Handle different chunk types according to Claude streaming format
-            if chunk_type == "message_start":
-                response_line = _format_sse_event("message_start", chunk)
-                transport_logger.info("CHUNK: tid=%s, %s", tid, response_line[:200])
-                yield response_line
-            elif chunk_type == "content_block_start":
-                response_line = _format_sse_event("content_block_start", chunk)
-                transport_logger.info("CHUNK: tid=%s, %s", tid, response_line[:200])
-                yield response_line
-            elif chunk_type == "content_block_delta":
-                response_line = _format_sse_event("content_block_delta", chunk)
-                transport_logger.info("CHUNK: tid=%s, %s", tid, response_line[:200])
-                yield response_line
-            elif chunk_type == "content_block_stop":
-                response_line = _format_sse_event("content_block_stop", chunk)
-                transport_logger.info("CHUNK: tid=%s, %s", tid, response_line[:200])
-                yield response_line
-            elif chunk_type == "message_delta":
-                response_line = _format_sse_event("message_delta", chunk)
-                transport_logger.info("CHUNK: tid=%s, %s", tid, response_line[:200])
-                yield response_line
-            elif chunk_type == "message_stop":
-                response_line = _format_sse_event("message_stop", chunk)
-                transport_logger.info("CHUNK: tid=%s, %s", tid, response_line[:200])
-                yield response_line
-                transport_logger.info("DONE: tid=%s, Stream finished successfully", tid)
-                yield "data: [DONE]\n\n"
-                break
-            elif chunk_type == "error":
-                response_line = _format_sse_event("error", chunk)
+            response_line = _sse(event_name, raw)
+            if chunk_type == "error":
                 transport_logger.info("ERR: tid=%s, %s", tid, response_line[:200])
                 yield response_line
                 break
 
+            transport_logger.info("CHUNK: tid=%s, %s", tid, response_line[:200])
+            yield response_line
+            if chunk_type == "message_stop":
+                transport_logger.info("DONE: tid=%s, Stream finished successfully", tid)
+                yield b"data: [DONE]\n\n"
+                break
+
+        if pending_text:
+            yield take_pending()
+
     except Exception as e:
-        logger.error("Error during streaming: %s", e, exc_info=True)
+        logger.error("Error during streaming: %s", e, exc_info=traceback_allowed(e))
+        if pending_text:
+            yield take_pending()
         error_chunk = {
             "type": "error",
             "error": {"type": "api_error", "message": str(e)},
         }
-        yield _format_sse_event("error", error_chunk)
+        yield _sse(_BEDROCK_EVENT_NAMES["error"], orjson.dumps(error_chunk))
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+        if subaccount_name is not None:
+            end_request(subaccount_name)
 
 
 def _sync_iter_async_generator(
@@ -199,7 +551,8 @@ async def generate_streaming_response(
         headers: HTTP headers to forward to backend
         payload: Request payload to send to backend
         model: Model name (used for format detection/conversion)
-        subaccount_name: Name of the selected subAccount (for logging)
+        subaccount_name: Name of the selected subAccount (for logging and
+            in-flight request tracking)
         tid: Trace UUID for logging correlation
 
     Yields:
@@ -230,20 +583,25 @@ async def generate_streaming_response(
         - Generic errors: Yields error payload with proxy_error type
 
     Notes:
-        - Uses httpx.AsyncClient for async streaming (replaces requests library)
+        - Uses the shared per-loop httpx.AsyncClient, so upstream connections are reused
         - Stream-specific timeout: 600 seconds (10 minutes)
         - Avoids duplicate [DONE] signals using done_sent flag
         - Token usage logged to token_usage_logger at stream end
         - Cannot change HTTP status once streaming starts
-        - Proper async generator cleanup handled by httpx context manager
+        - The upstream response is closed by the client.stream() context manager
     """
-    payload_json_str: str = json.dumps(payload)
-    transport_logger.info(
-        "OUT_REQ_CHAT_ST: tid=%s, url=%s], body=%s",
-        tid,
-        url,
-        payload_json_str,
-    )
+    # Serialized once with orjson: the bytes are both logged and sent, rather
+    # than letting httpx encode ``json=`` again with the stdlib encoder
+    payload_bytes = orjson.dumps(payload)
+    if transport_logger.isEnabledFor(logging.INFO):
+        transport_logger.info(
+            "OUT_REQ_CHAT_ST: tid=%s, url=%s], body=%s",
+            tid,
+            url,
+            payload_bytes.decode(),
+        )
+    if "Content-Type" not in headers:
+        headers = {**headers, "Content-Type": "application/json"}
 
     buffer = ""
     total_tokens = 0
@@ -252,182 +610,166 @@ async def generate_streaming_response(
     claude_metadata: dict[str, Any] = {}
     done_sent = False
 
-    timeout_config = httpx.Timeout(600)
-    async with httpx.AsyncClient(timeout=timeout_config) as client:
-        try:
-            async with client.stream(
-                "POST", url, headers=headers, json=payload
-            ) as response:
-                response.raise_for_status()
+    # Resolved once up front; the older-Claude branch consults it per chunk
+    is_claude = Detector.is_claude_model(model)
 
-                # --- Claude 3.7/4 Streaming Logic ---
-                if Detector.is_claude_model(model) and Detector.is_claude_37_or_4(
-                    model
-                ):
-                    logger.info(
-                        "Using Claude 3.7/4 streaming for subAccount '%s'",
-                        subaccount_name,
-                    )
-                    stop_reason_received = None
-                    stream_id = f"chatcmpl-claude-{random.randint(10000000, 99999999)}"
-
-                    async for line in response.aiter_lines():
-                        if not line:
-                            continue
-                        if line.startswith("data: "):
-                            line_content = line.replace("data: ", "").strip()
-                            try:
-                                try:
-                                    claude_dict_chunk = json.loads(line_content)
-                                except json.JSONDecodeError:
-                                    claude_dict_chunk = ast.literal_eval(line_content)
-
-                                if "messageStart" in claude_dict_chunk:
-                                    message_id = (
-                                        claude_dict_chunk.get("messageStart", {})
-                                        .get("message", {})
-                                        .get("id", "")
-                                    )
-                                    if message_id:
-                                        stream_id = f"chatcmpl-claude-{message_id}"
-                                        logger.info(
-                                            "Extracted stream ID from messageStart: %s",
-                                            stream_id,
-                                        )
-
-                                if "messageStop" in claude_dict_chunk:
-                                    stop_reason_received = claude_dict_chunk.get(
-                                        "messageStop", {}
-                                    ).get("stopReason", "end_turn")
+    client = _get_async_stream_client()
+    begin_request(subaccount_name)
+    try:
+        async with client.stream(
+            "POST", url, headers=headers, content=payload_bytes
+        ) as response:
+            response.raise_for_status()
+
+            # --- Claude 3.7/4 Streaming Logic ---
+            if is_claude and Detector.is_claude_37_or_4(model):
+                logger.info(
+                    "Using Claude 3.7/4 streaming for subAccount '%s'",
+                    subaccount_name,
+                )
+                stop_reason_received = None
+                stream_id = f"chatcmpl-claude-{_next_id()}"
+
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    if line.startswith("data: "):
+                        line_content = line.replace("data: ", "").strip()
+                        try:
+                            claude_dict_chunk = orjson.loads(line_content)
+
+                            if "messageStart" in claude_dict_chunk:
+                                message_id = (
+                                    claude_dict_chunk.get("messageStart", {})
+                                    .get("message", {})
+                                    .get("id", "")
+                                )
+                                if message_id:
+                                    stream_id = f"chatcmpl-claude-{message_id}"
                                     logger.info(
-                                        "Received messageStop with stopReason: %s",
-                                        stop_reason_received,
+                                        "Extracted stream ID from messageStart: %s",
+                                        stream_id,
                                     )
-                                    continue
 
-                                if "metadata" in claude_dict_chunk:
-                                    claude_metadata = claude_dict_chunk.get(
-                                        "metadata", {}
-                                    )
-                                    logger.info("CHAT_RSP_ST_META: %s", claude_metadata)
-                                    if isinstance(claude_metadata.get("usage"), dict):
-                                        total_tokens = claude_metadata["usage"].get(
-                                            "totalTokens", 0
-                                        )
-                                        prompt_tokens = claude_metadata["usage"].get(
-                                            "inputTokens", 0
-                                        )
-                                        completion_tokens = claude_metadata[
-                                            "usage"
-                                        ].get("outputTokens", 0)
-                                        logger.info(
-                                            "Extracted token usage from metadata: prompt=%s, completion=%s, total=%s",
-                                            prompt_tokens,
-                                            completion_tokens,
-                                            total_tokens,
-                                        )
-                                    continue
-
-                                openai_sse_chunk_str = (
-                                    Converters.convert_claude37_chunk_to_openai(
-                                        claude_dict_chunk, model, stream_id
-                                    )
+                            if "messageStop" in claude_dict_chunk:
+                                stop_reason_received = claude_dict_chunk.get(
+                                    "messageStop", {}
+                                ).get("stopReason", "end_turn")
+                                logger.info(
+                                    "Received messageStop with stopReason: %s",
+                                    stop_reason_received,
                                 )
+                                continue
 
-                                if openai_sse_chunk_str:
-                                    logger.info(
-                                        "CHUNK: tid=%s, %s",
-                                        tid,
-                                        openai_sse_chunk_str[:200],
+                            if "metadata" in claude_dict_chunk:
+                                claude_metadata = claude_dict_chunk.get("metadata", {})
+                                logger.info("CHAT_RSP_ST_META: %s", claude_metadata)
+                                if isinstance(claude_metadata.get("usage"), dict):
+                                    total_tokens = claude_metadata["usage"].get(
+                                        "totalTokens", 0
                                     )
-                                    transport_logger.info(
-                                        "CHUNK: tid=%s, %s", tid, openai_sse_chunk_str
+                                    prompt_tokens = claude_metadata["usage"].get(
+                                        "inputTokens", 0
                                     )
-                                    yield openai_sse_chunk_str
-                            except Exception as e:
-                                logger.error(
-                                    "Error processing Claude 3.7 chunk from '%s': %s",
-                                    subaccount_name,
-                                    e,
-                                    exc_info=True,
+                                    completion_tokens = claude_metadata["usage"].get(
+                                        "outputTokens", 0
+                                    )
+                                    logger.info(
+                                        "Extracted token usage from metadata: prompt=%s, completion=%s, total=%s",
+                                        prompt_tokens,
+                                        completion_tokens,
+                                        total_tokens,
+                                    )
+                                continue
+
+                            openai_sse_chunk_str = (
+                                Converters.convert_claude37_chunk_to_openai(
+                                    claude_dict_chunk, model, stream_id
                                 )
-                                error_payload = {
-                                    "id": f"chatcmpl-error-{random.randint(10000000, 99999999)}",
-                                    "object": "chat.completion.chunk",
-                                    "created": int(time.time()),
-                                    "model": model,
-                                    "choices": [
-                                        {
-                                            "index": 0,
-                                            "delta": {
-                                                "content": "[PROXY ERROR: Failed to process upstream data]"
-                                            },
-                                            "finish_reason": "stop",
-                                        }
-                                    ],
-                                }
-                                yield f"{json.dumps(error_payload)}\n\n"
-
-                    if total_tokens > 0 or prompt_tokens > 0 or completion_tokens > 0:
-                        stop_reason_map = {
-                            "end_turn": "stop",
-                            "max_tokens": "length",
-                            "stop_sequence": "stop",
-                            "tool_use": "tool_calls",
-                        }
-                        stop_reason_key = (
-                            stop_reason_received
-                            if isinstance(stop_reason_received, str)
-                            else "end_turn"
-                        )
-                        finish_reason = stop_reason_map.get(stop_reason_key, "stop")
-                        final_usage_chunk = {
-                            "id": stream_id,
-                            "object": "chat.completion.chunk",
-                            "created": int(time.time()),
-                            "model": model,
-                            "choices": [
-                                {
-                                    "index": 0,
-                                    "delta": {},
-                                    "finish_reason": finish_reason,
-                                }
-                            ],
-                            "usage": {
-                                "prompt_tokens": prompt_tokens,
-                                "completion_tokens": completion_tokens,
-                                "total_tokens": total_tokens,
-                            },
-                        }
-                        final_usage_chunk_str = (
-                            f"data: {json.dumps(final_usage_chunk)}\n\n"
-                        )
-                        logger.info(
-                            "Sending final chunk with finish_reason=%s and usage: %s...",
-                            finish_reason,
-                            final_usage_chunk_str[:200],
-                        )
-                        yield final_usage_chunk_str
-                        logger.info(
-                            "Sent final chunk: finish_reason=%s, prompt=%s, completion=%s, total=%s",
-                            finish_reason,
-                            prompt_tokens,
-                            completion_tokens,
-                            total_tokens,
-                        )
+                            )
 
-                        user_id = (
-                            request.headers.get("Authorization", "unknown")
-                            if request
-                            else "unknown"
-                        )
-                        if user_id and len(user_id) > 20:
-                            user_id = f"{user_id[:20]}..."
-                        ip_address = (
-                            request.client.host
-                            if request and request.client
-                            else "unknown_ip"
-                        )
+                            if openai_sse_chunk_str:
+                                logger.info(
+                                    "CHUNK: tid=%s, %s",
+                                    tid,
+                                    openai_sse_chunk_str[:200],
+                                )
+                                transport_logger.info(
+                                    "CHUNK: tid=%s, %s", tid, openai_sse_chunk_str
+                                )
+                                yield openai_sse_chunk_str
+                        except Exception as e:
+                            logger.error(
+                                "Error processing Claude 3.7 chunk from '%s': %s: %s",
+                                subaccount_name,
+                                type(e).__name__,
+                                e,
+                            )
+                            error_payload = {
+                                "id": f"chatcmpl-error-{_next_id()}",
+                                "object": "chat.completion.chunk",
+                                "created": int(time.time()),
+                                "model": model,
+                                "choices": [
+                                    {
+                                        "index": 0,
+                                        "delta": {
+                                            "content": "[PROXY ERROR: Failed to process upstream data]"
+                                        },
+                                        "finish_reason": "stop",
+                                    }
+                                ],
+                            }
+                            yield f"{orjson.dumps(error_payload).decode()}\n\n"
+
+                if total_tokens > 0 or prompt_tokens > 0 or completion_tokens > 0:
+                    stop_reason_map = {
+                        "end_turn": "stop",
+                        "max_tokens": "length",
+                        "stop_sequence": "stop",
+                        "tool_use": "tool_calls",
+                    }
+                    stop_reason_key = (
+                        stop_reason_received
+                        if isinstance(stop_reason_received, str)
+                        else "end_turn"
+                    )
+                    finish_reason = stop_reason_map.get(stop_reason_key, "stop")
+                    final_usage_chunk = {
+                        "id": stream_id,
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "delta": {},
+                                "finish_reason": finish_reason,
+                            }
+                        ],
+                        "usage": {
+                            "prompt_tokens": prompt_tokens,
+                            "completion_tokens": completion_tokens,
+                            "total_tokens": total_tokens,
+                        },
+                    }
+                    final_usage_chunk_str = f"data: {orjson.dumps(final_usage_chunk).decode()}\n\n"
+                    logger.info(
+                        "Sending final chunk with finish_reason=%s and usage: %s...",
+                        finish_reason,
+                        final_usage_chunk_str[:200],
+                    )
+                    yield final_usage_chunk_str
+                    logger.info(
+                        "Sent final chunk: finish_reason=%s, prompt=%s, completion=%s, total=%s",
+                        finish_reason,
+                        prompt_tokens,
+                        completion_tokens,
+                        total_tokens,
+                    )
+
+                    if token_usage_logger.isEnabledFor(logging.INFO):
+                        user_id, ip_address = client_log_identity(request)
                         token_usage_logger.info(
                             "User: %s, IP: %s, Model: %s, SubAccount: %s, PromptTokens: %s, CompletionTokens: %s, TotalTokens: %s (Streaming)",
                             user_id,
@@ -439,172 +781,149 @@ async def generate_streaming_response(
                             total_tokens,
                         )
 
-                # --- Gemini Streaming Logic ---
-                elif Detector.is_gemini_model(model):
-                    logger.info(
-                        "Using Gemini streaming for subAccount '%s'",
-                        subaccount_name,
-                    )
-                    total_tokens = 0
-                    prompt_tokens = 0
-                    completion_tokens = 0
-                    async for line in response.aiter_lines():
-                        if not line:
-                            continue
-                        logger.info("Gemini raw line received: %s", line)
-
-                        line_content = ""
-                        if line.startswith("data: "):
-                            line_content = line.replace("data: ", "").strip()
-                            logger.info("Gemini data line content: %s", line_content)
-                        elif line.strip():
-                            line_content = line.strip()
+            # --- Gemini Streaming Logic ---
+            elif Detector.is_gemini_model(model):
+                logger.info(
+                    "Using Gemini streaming for subAccount '%s'",
+                    subaccount_name,
+                )
+                total_tokens = 0
+                prompt_tokens = 0
+                completion_tokens = 0
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    logger.info("Gemini raw line received: %s", line)
+
+                    line_content = ""
+                    if line.startswith("data: "):
+                        line_content = line.replace("data: ", "").strip()
+                        logger.info("Gemini data line content: %s", line_content)
+                    elif line.strip():
+                        line_content = line.strip()
+                        logger.info("Gemini line content (no prefix): %s", line_content)
+
+                    if line_content and line_content != "[DONE]":
+                        try:
+                            gemini_chunk = orjson.loads(line_content)
                             logger.info(
-                                "Gemini line content (no prefix): %s", line_content
+                                "Gemini parsed chunk: %s",
+                                LazyJson(gemini_chunk),
                             )
 
-                        if line_content and line_content != "[DONE]":
-                            try:
-                                gemini_chunk = json.loads(line_content)
-                                logger.info(
-                                    "Gemini parsed chunk: %s",
-                                    json.dumps(gemini_chunk, indent=2),
-                                )
+                            if is_gemini_2_5_pro_format(gemini_chunk):
+                                logger.info("Detected Gemini-2.5-pro streaming format")
 
-                                if is_gemini_2_5_pro_format(gemini_chunk):
-                                    logger.info(
-                                        "Detected Gemini-2.5-pro streaming format"
-                                    )
-
-                                openai_sse_chunk_str = (
-                                    Converters.convert_gemini_chunk_to_openai(
-                                        gemini_chunk, model
-                                    )
+                            openai_sse_chunk_str = (
+                                Converters.convert_gemini_chunk_to_openai(
+                                    gemini_chunk, model
                                 )
-                                if openai_sse_chunk_str:
-                                    logger.info(
-                                        "Gemini converted to OpenAI chunk: %s",
-                                        openai_sse_chunk_str,
-                                    )
-                                    if not openai_sse_chunk_str.startswith("data: "):
-                                        logger.error(
-                                            "ERROR: Converter returned chunk without 'data: ' prefix: %s",
-                                            openai_sse_chunk_str[:100],
-                                        )
-                                    yield openai_sse_chunk_str.encode("utf-8")
-                                else:
-                                    logger.info("Gemini chunk conversion returned None")
-
-                                if "usageMetadata" in gemini_chunk:
-                                    usage_metadata = gemini_chunk["usageMetadata"]
-                                    total_tokens = usage_metadata.get(
-                                        "totalTokenCount", 0
-                                    )
-                                    prompt_tokens = usage_metadata.get(
-                                        "promptTokenCount", 0
-                                    )
-                                    completion_tokens = usage_metadata.get(
-                                        "candidatesTokenCount", 0
-                                    )
-                                    logger.info(
-                                        "Gemini token usage: prompt=%s, completion=%s, total=%s",
-                                        prompt_tokens,
-                                        completion_tokens,
-                                        total_tokens,
+                            )
+                            if openai_sse_chunk_str:
+                                logger.info(
+                                    "Gemini converted to OpenAI chunk: %s",
+                                    openai_sse_chunk_str,
+                                )
+                                if not openai_sse_chunk_str.startswith("data: "):
+                                    logger.error(
+                                        "ERROR: Converter returned chunk without 'data: ' prefix: %s",
+                                        openai_sse_chunk_str[:100],
                                     )
+                                yield openai_sse_chunk_str.encode("utf-8")
+                            else:
+                                logger.info("Gemini chunk conversion returned None")
 
-                            except json.JSONDecodeError as e:
-                                logger.error(
-                                    "Error parsing Gemini chunk from '%s': %s",
-                                    subaccount_name,
-                                    e,
-                                    exc_info=True,
+                            if "usageMetadata" in gemini_chunk:
+                                usage_metadata = gemini_chunk["usageMetadata"]
+                                total_tokens = usage_metadata.get("totalTokenCount", 0)
+                                prompt_tokens = usage_metadata.get(
+                                    "promptTokenCount", 0
                                 )
-                                logger.error(
-                                    "Problematic line content: %s", line_content
+                                completion_tokens = usage_metadata.get(
+                                    "candidatesTokenCount", 0
                                 )
-                                continue
-                            except Exception as e:
-                                logger.error(
-                                    "Error processing Gemini chunk from '%s': %s",
-                                    subaccount_name,
-                                    e,
-                                    exc_info=True,
-                                )
-                                logger.error(
-                                    "Problematic chunk: %s",
-                                    locals().get("gemini_chunk", "Failed to parse"),
-                                )
-                                error_payload = {
-                                    "id": f"chatcmpl-error-{random.randint(10000000, 99999999)}",
-                                    "object": "chat.completion.chunk",
-                                    "created": int(time.time()),
-                                    "model": model,
-                                    "choices": [
-                                        {
-                                            "index": 0,
-                                            "delta": {
-                                                "content": "[PROXY ERROR: Failed to process upstream data]"
-                                            },
-                                            "finish_reason": "stop",
-                                        }
-                                    ],
-                                }
-                                yield f"data: {json.dumps(error_payload)}\n\n".encode(
-                                    "utf-8"
+                                logger.info(
+                                    "Gemini token usage: prompt=%s, completion=%s, total=%s",
+                                    prompt_tokens,
+                                    completion_tokens,
+                                    total_tokens,
                                 )
-                        elif line_content == "[DONE]":
-                            done_sent = True
-                            logger.info("Received [DONE] signal from Gemini backend")
-
-                    if total_tokens > 0 or prompt_tokens > 0 or completion_tokens > 0:
-                        final_usage_chunk = {
-                            "id": f"chatcmpl-gemini-{random.randint(10000000, 99999999)}",
-                            "object": "chat.completion.chunk",
-                            "created": int(time.time()),
-                            "model": model,
-                            "choices": [
-                                {"index": 0, "delta": {}, "finish_reason": None}
-                            ],
-                            "usage": {
-                                "prompt_tokens": prompt_tokens,
-                                "completion_tokens": completion_tokens,
-                                "total_tokens": total_tokens,
-                            },
-                        }
-                        final_usage_chunk_str = (
-                            f"data: {json.dumps(final_usage_chunk)}\n\n"
-                        )
-                        logger.info(
-                            "[FIXED] Sending final Gemini usage chunk with data prefix: %s bytes, starts with: %s",
-                            len(final_usage_chunk_str),
-                            final_usage_chunk_str[:50],
-                        )
-                        if not final_usage_chunk_str.startswith("data: "):
+
+                        except json.JSONDecodeError as e:
+                            logger.warning(
+                                "Error parsing Gemini chunk from '%s': %s",
+                                subaccount_name,
+                                e,
+                            )
+                            logger.warning("Problematic line content: %s", line_content)
+                            continue
+                        except Exception as e:
                             logger.error(
-                                "ERROR: Final usage chunk does not start with 'data: ': %s",
-                                final_usage_chunk_str[:100],
+                                "Error processing Gemini chunk from '%s': %s: %s",
+                                subaccount_name,
+                                type(e).__name__,
+                                e,
                             )
-                        yield final_usage_chunk_str.encode("utf-8")
-                        logger.info(
-                            "Sent final Gemini usage chunk: prompt=%s, completion=%s, total=%s",
-                            prompt_tokens,
-                            completion_tokens,
-                            total_tokens,
+                            logger.error(
+                                "Problematic chunk: %s",
+                                locals().get("gemini_chunk", "Failed to parse"),
+                            )
+                            error_payload = {
+                                "id": f"chatcmpl-error-{_next_id()}",
+                                "object": "chat.completion.chunk",
+                                "created": int(time.time()),
+                                "model": model,
+                                "choices": [
+                                    {
+                                        "index": 0,
+                                        "delta": {
+                                            "content": "[PROXY ERROR: Failed to process upstream data]"
+                                        },
+                                        "finish_reason": "stop",
+                                    }
+                                ],
+                            }
+                            yield f"data: {orjson.dumps(error_payload).decode()}\n\n".encode(
+                                "utf-8"
+                            )
+                    elif line_content == "[DONE]":
+                        done_sent = True
+                        logger.info("Received [DONE] signal from Gemini backend")
+
+                if total_tokens > 0 or prompt_tokens > 0 or completion_tokens > 0:
+                    final_usage_chunk = {
+                        "id": f"chatcmpl-gemini-{_next_id()}",
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {}, "finish_reason": None}],
+                        "usage": {
+                            "prompt_tokens": prompt_tokens,
+                            "completion_tokens": completion_tokens,
+                            "total_tokens": total_tokens,
+                        },
+                    }
+                    final_usage_chunk_str = f"data: {orjson.dumps(final_usage_chunk).decode()}\n\n"
+                    logger.info(
+                        "[FIXED] Sending final Gemini usage chunk with data prefix: %s bytes, starts with: %s",
+                        len(final_usage_chunk_str),
+                        final_usage_chunk_str[:50],
+                    )
+                    if not final_usage_chunk_str.startswith("data: "):
+                        logger.error(
+                            "ERROR: Final usage chunk does not start with 'data: ': %s",
+                            final_usage_chunk_str[:100],
                         )
+                    yield final_usage_chunk_str.encode("utf-8")
+                    logger.info(
+                        "Sent final Gemini usage chunk: prompt=%s, completion=%s, total=%s",
+                        prompt_tokens,
+                        completion_tokens,
+                        total_tokens,
+                    )
 
-                        user_id = (
-                            request.headers.get("Authorization", "unknown")
-                            if request
-                            else "unknown"
-                        )
-                        if user_id and len(user_id) > 20:
-                            user_id = f"{user_id[:20]}..."
-                        ip_address = (
-                            request.client.host
-                            if request and request.client
-                            else "unknown_ip"
-                        )
+                    if token_usage_logger.isEnabledFor(logging.INFO):
+                        user_id, ip_address = client_log_identity(request)
                         token_usage_logger.info(
                             "User: %s, IP: %s, Model: %s, SubAccount: %s, PromptTokens: %s, CompletionTokens: %s, TotalTokens: %s (Streaming)",
                             user_id,
@@ -616,153 +935,140 @@ async def generate_streaming_response(
                             total_tokens,
                         )
 
-                # --- Other Models (including older Claude) ---
-                else:
-                    async for chunk in response.aiter_bytes():
-                        if chunk:
-                            if Detector.is_claude_model(model):
-                                buffer += chunk.decode("utf-8")
-                                while "data: " in buffer:
+            # --- Other Models (including older Claude) ---
+            else:
+                async for chunk in response.aiter_bytes():
+                    if chunk:
+                        if is_claude:
+                            buffer += chunk.decode("utf-8")
+                            while "data: " in buffer:
+                                try:
+                                    start = buffer.index("data: ") + len("data: ")
+                                    end = buffer.index("\n\n", start)
+                                    json_chunk_str = buffer[start:end].strip()
+                                    buffer = buffer[end + 2 :]
+
+                                    openai_sse_chunk_str = (
+                                        Converters.convert_claude_chunk_to_openai(
+                                            json_chunk_str, model
+                                        )
+                                    )
+                                    yield openai_sse_chunk_str.encode("utf-8")
+
                                     try:
-                                        start = buffer.index("data: ") + len("data: ")
-                                        end = buffer.index("\n\n", start)
-                                        json_chunk_str = buffer[start:end].strip()
-                                        buffer = buffer[end + 2 :]
-
-                                        openai_sse_chunk_str = (
-                                            Converters.convert_claude_chunk_to_openai(
-                                                json_chunk_str, model
+                                        claude_data = orjson.loads(json_chunk_str)
+                                        if "usage" in claude_data:
+                                            prompt_tokens = claude_data["usage"].get(
+                                                "input_tokens", 0
                                             )
-                                        )
-                                        yield openai_sse_chunk_str.encode("utf-8")
-
-                                        try:
-                                            claude_data = json.loads(json_chunk_str)
-                                            if "usage" in claude_data:
-                                                prompt_tokens = claude_data[
-                                                    "usage"
-                                                ].get("input_tokens", 0)
-                                                completion_tokens = claude_data[
-                                                    "usage"
-                                                ].get("output_tokens", 0)
-                                                total_tokens = (
-                                                    prompt_tokens + completion_tokens
-                                                )
-                                        except json.JSONDecodeError as e:
-                                            logger.warning(
-                                                "Failed to parse Claude usage metadata from chunk, tid=%s: %s",
-                                                tid,
-                                                e,
+                                            completion_tokens = claude_data[
+                                                "usage"
+                                            ].get("output_tokens", 0)
+                                            total_tokens = (
+                                                prompt_tokens + completion_tokens
                                             )
-                                            # Continue with last known token values
-                                    except (ValueError, KeyError, TypeError) as e:
-                                        logger.error(
-                                            "Error processing claude chunk structure: %s",
-                                            e,
-                                            exc_info=True,
-                                        )
-                                        # Send error event to client before breaking
-                                        error_payload = {
-                                            "id": f"chatcmpl-error-{random.randint(10000000, 99999999)}",
-                                            "object": "chat.completion.chunk",
-                                            "created": int(time.time()),
-                                            "model": model,
-                                            "choices": [
-                                                {
-                                                    "index": 0,
-                                                    "delta": {
-                                                        "content": "[PROXY ERROR: Failed to process response chunk]"
-                                                    },
-                                                    "finish_reason": "stop",
-                                                }
-                                            ],
-                                        }
-                                        yield f"data: {json.dumps(error_payload)}\n\n"
-                                        break
-                                    except Exception as e:
-                                        logger.error(
-                                            "Unexpected error processing claude chunk: %s",
+                                    except json.JSONDecodeError as e:
+                                        logger.warning(
+                                            "Failed to parse Claude usage metadata from chunk, tid=%s: %s",
+                                            tid,
                                             e,
-                                            exc_info=True,
                                         )
-                                        # Send critical error event before terminating
-                                        error_payload = {
-                                            "id": f"chatcmpl-error-{random.randint(10000000, 99999999)}",
-                                            "object": "chat.completion.chunk",
-                                            "created": int(time.time()),
-                                            "model": model,
-                                            "choices": [
-                                                {
-                                                    "index": 0,
-                                                    "delta": {
-                                                        "content": "[PROXY ERROR: Critical streaming error]"
-                                                    },
-                                                    "finish_reason": "stop",
-                                                }
-                                            ],
-                                        }
-                                        yield f"data: {json.dumps(error_payload)}\n\n"
-                                        break
-                            else:
-                                yield chunk
-                                try:
-                                    chunk_text = chunk.decode("utf-8")
-                                    if "[DONE]" in chunk_text:
-                                        done_sent = True
-                                    if '"finish_reason":' in chunk_text:
-                                        for line in chunk_text.strip().split("\n"):
-                                            if (
-                                                line.startswith("data: ")
-                                                and line[6:].strip() != "[DONE]"
-                                            ):
-                                                try:
-                                                    data = json.loads(line[6:])
-                                                    if "usage" in data:
-                                                        total_tokens = data[
-                                                            "usage"
-                                                        ].get("total_tokens", 0)
-                                                        prompt_tokens = data[
-                                                            "usage"
-                                                        ].get("prompt_tokens", 0)
-                                                        completion_tokens = data[
-                                                            "usage"
-                                                        ].get("completion_tokens", 0)
-                                                except json.JSONDecodeError as e:
-                                                    logger.warning(
-                                                        "Failed to parse token usage from SSE chunk, tid=%s: %s",
-                                                        tid,
-                                                        e,
-                                                    )
-                                except UnicodeDecodeError as e:
-                                    logger.warning(
-                                        "Failed to decode chunk as UTF-8, tid=%s: %s",
-                                        tid,
+                                        # Continue with last known token values
+                                except (ValueError, KeyError, TypeError) as e:
+                                    logger.error(
+                                        "Error processing claude chunk structure: %s: %s",
+                                        type(e).__name__,
                                         e,
                                     )
+                                    # Send error event to client before breaking
+                                    error_payload = {
+                                        "id": f"chatcmpl-error-{_next_id()}",
+                                        "object": "chat.completion.chunk",
+                                        "created": int(time.time()),
+                                        "model": model,
+                                        "choices": [
+                                            {
+                                                "index": 0,
+                                                "delta": {
+                                                    "content": "[PROXY ERROR: Failed to process response chunk]"
+                                                },
+                                                "finish_reason": "stop",
+                                            }
+                                        ],
+                                    }
+                                    yield f"data: {orjson.dumps(error_payload).decode()}\n\n"
+                                    break
                                 except Exception as e:
                                     logger.error(
-                                        "Unexpected error parsing token usage, tid=%s: %s",
-                                        tid,
+                                        "Unexpected error processing claude chunk: %s: %s",
+                                        type(e).__name__,
                                         e,
-                                        exc_info=True,
                                     )
+                                    # Send critical error event before terminating
+                                    error_payload = {
+                                        "id": f"chatcmpl-error-{_next_id()}",
+                                        "object": "chat.completion.chunk",
+                                        "created": int(time.time()),
+                                        "model": model,
+                                        "choices": [
+                                            {
+                                                "index": 0,
+                                                "delta": {
+                                                    "content": "[PROXY ERROR: Critical streaming error]"
+                                                },
+                                                "finish_reason": "stop",
+                                            }
+                                        ],
+                                    }
+                                    yield f"data: {orjson.dumps(error_payload).decode()}\n\n"
+                                    break
+                        else:
+                            yield chunk
+                            try:
+                                chunk_text = chunk.decode("utf-8")
+                                if "[DONE]" in chunk_text:
+                                    done_sent = True
+                                if '"finish_reason":' in chunk_text:
+                                    for line in chunk_text.strip().split("\n"):
+                                        if (
+                                            line.startswith("data: ")
+                                            and line[6:].strip() != "[DONE]"
+                                        ):
+                                            try:
+                                                data = orjson.loads(line[6:])
+                                                if "usage" in data:
+                                                    total_tokens = data["usage"].get(
+                                                        "total_tokens", 0
+                                                    )
+                                                    prompt_tokens = data["usage"].get(
+                                                        "prompt_tokens", 0
+                                                    )
+                                                    completion_tokens = data[
+                                                        "usage"
+                                                    ].get("completion_tokens", 0)
+                                            except json.JSONDecodeError as e:
+                                                logger.warning(
+                                                    "Failed to parse token usage from SSE chunk, tid=%s: %s",
+                                                    tid,
+                                                    e,
+                                                )
+                            except UnicodeDecodeError as e:
+                                logger.warning(
+                                    "Failed to decode chunk as UTF-8, tid=%s: %s",
+                                    tid,
+                                    e,
+                                )
+                            except Exception as e:
+                                logger.error(
+                                    "Unexpected error parsing token usage, tid=%s: %s: %s",
+                                    tid,
+                                    type(e).__name__,
+                                    e,
+                                )
 
-                if not (
-                    Detector.is_claude_model(model)
-                    and Detector.is_claude_37_or_4(model)
-                ):
-                    user_id = (
-                        request.headers.get("Authorization", "unknown")
-                        if request
-                        else "unknown"
-                    )
-                    if user_id and len(user_id) > 20:
-                        user_id = f"{user_id[:20]}..."
-                    ip_address = (
-                        request.client.host
-                        if request and request.client
-                        else "unknown_ip"
-                    )
+            if not (is_claude and Detector.is_claude_37_or_4(model)):
+                if token_usage_logger.isEnabledFor(logging.INFO):
+                    user_id, ip_address = client_log_identity(request)
 
                     token_usage_logger.info(
                         "User: %s, IP: %s, Model: %s, SubAccount: %s, PromptTokens: %s, CompletionTokens: %s, TotalTokens: %s (Streaming)",
@@ -775,187 +1081,356 @@ async def generate_streaming_response(
                         total_tokens,
                     )
 
-                transport_logger.info("DONE: tid=%s, Streaming completed", tid)
-                if not done_sent:
-                    yield "data: [DONE]\n\n"
-
-        except httpx.HTTPStatusError as http_err:
-            logger.error(
-                "HTTP Error in streaming response:(%s): %s",
-                model,
-                http_err,
-                exc_info=True,
-            )
+            transport_logger.info("DONE: tid=%s, Streaming completed", tid)
+            if not done_sent:
+                yield "data: [DONE]\n\n"
 
-            error_content: str = ""
+    except httpx.HTTPStatusError as http_err:
+        logger.error(
+            "HTTP Error in streaming response:(%s): %s",
+            model,
+            http_err,
+        )
 
-            if http_err.response is not None:
-                status_code = http_err.response.status_code
-                error_content = http_err.response.text
+        error_content: str = ""
+
+        if http_err.response is not None:
+            status_code = http_err.response.status_code
+            error_content = http_err.response.text
+
+            if status_code == 429:
+                error_payload = {
+                    "id": f"error-{_next_id()}",
+                    "object": "error",
+                    "created": int(time.time()),
+                    "model": model,
+                    "error": {
+                        "message": error_content,
+                        "type": "rate_limit_error",
+                        "code": status_code,
+                        "subaccount": subaccount_name,
+                    },
+                }
+                yield f"data: {orjson.dumps(error_payload).decode()}\n\n"
+                yield "data: [DONE]\n\n"
+                return
 
-                if status_code == 429:
-                    error_payload = {
-                        "id": f"error-{random.randint(10000000, 99999999)}",
-                        "object": "error",
-                        "created": int(time.time()),
-                        "model": model,
-                        "error": {
-                            "message": error_content,
-                            "type": "rate_limit_error",
-                            "code": status_code,
-                            "subaccount": subaccount_name,
-                        },
-                    }
-                    yield f"data: {json.dumps(error_payload)}\n\n"
-                    yield "data: [DONE]\n\n"
-                    return
+            logger.error("Error response status: %s", http_err.response.status_code)
+            logger.error("Error response headers: %s", dict(http_err.response.headers))
 
-                logger.error("Error response status: %s", http_err.response.status_code)
+            # Log error response body (avoid duplicates, limit size)
+            try:
+                error_json = http_err.response.json()
                 logger.error(
-                    "Error response headers: %s", dict(http_err.response.headers)
+                    "Error response body (JSON): %s",
+                    LazyJson(error_json, limit=1000),
                 )
+            except json.JSONDecodeError:
+                logger.error(
+                    "Error response body (text): %s", http_err.response.text[:1000]
+                )
+            except Exception as e:
+                logger.error("Could not read error response: %s", e)
+        else:
+            status_code = 500
+            error_content = str(http_err)
+
+        error_payload = {
+            "id": f"error-{_next_id()}",
+            "object": "error",
+            "created": int(time.time()),
+            "model": model,
+            "error": {
+                "message": error_content,
+                "type": "http_error",
+                "code": status_code,
+                "subaccount": subaccount_name,
+            },
+        }
+        yield f"data: {orjson.dumps(error_payload).decode()}\n\n"
+        yield "data: [DONE]\n\n"
 
-                # Log error response body (avoid duplicates, limit size)
-                try:
-                    error_json = http_err.response.json()
-                    logger.error(
-                        "Error response body (JSON): %s",
-                        json.dumps(error_json, indent=2)[:1000],
-                    )
-                except json.JSONDecodeError:
-                    logger.error(
-                        "Error response body (text): %s", http_err.response.text[:1000]
-                    )
-                except Exception as e:
-                    logger.error("Could not read error response: %s", e)
-            else:
-                status_code = 500
-                error_content = str(http_err)
-
-            error_payload = {
-                "id": f"error-{random.randint(10000000, 99999999)}",
-                "object": "error",
-                "created": int(time.time()),
-                "model": model,
-                "error": {
-                    "message": error_content,
-                    "type": "http_error",
-                    "code": status_code,
-                    "subaccount": subaccount_name,
-                },
-            }
-            yield f"data: {json.dumps(error_payload)}\n\n"
-            yield "data: [DONE]\n\n"
-
-        except httpx.TimeoutException as timeout_err:
-            logger.error(
-                "Timeout during streaming for model '%s': %s",
-                model,
-                timeout_err,
-                exc_info=True,
-            )
-            error_payload = {
-                "id": f"error-{random.randint(10000000, 99999999)}",
-                "object": "error",
-                "created": int(time.time()),
-                "model": model,
-                "error": {
-                    "message": "Request timed out after 600 seconds",
-                    "type": "timeout_error",
-                    "code": 504,
-                    "subaccount": subaccount_name,
-                },
-            }
-            yield f"data: {json.dumps(error_payload)}\n\n"
-            yield "data: [DONE]\n\n"
-
-        except httpx.ConnectError as conn_err:
-            logger.error(
-                "Connection failed for model '%s': %s",
-                model,
-                conn_err,
-                exc_info=True,
-            )
-            error_payload = {
-                "id": f"error-{random.randint(10000000, 99999999)}",
-                "object": "error",
-                "created": int(time.time()),
-                "model": model,
-                "error": {
-                    "message": f"Failed to connect to backend: {str(conn_err)}",
-                    "type": "connection_error",
-                    "code": 503,
-                    "subaccount": subaccount_name,
+    except httpx.TimeoutException as timeout_err:
+        logger.error(
+            "Timeout during streaming for model '%s': %s",
+            model,
+            timeout_err,
+        )
+        error_payload = {
+            "id": f"error-{_next_id()}",
+            "object": "error",
+            "created": int(time.time()),
+            "model": model,
+            "error": {
+                "message": "Request timed out after 600 seconds",
+                "type": "timeout_error",
+                "code": 504,
+                "subaccount": subaccount_name,
+            },
+        }
+        yield f"data: {orjson.dumps(error_payload).decode()}\n\n"
+        yield "data: [DONE]\n\n"
+
+    except httpx.ConnectError as conn_err:
+        logger.error(
+            "Connection failed for model '%s': %s",
+            model,
+            conn_err,
+        )
+        error_payload = {
+            "id": f"error-{_next_id()}",
+            "object": "error",
+            "created": int(time.time()),
+            "model": model,
+            "error": {
+                "message": f"Failed to connect to backend: {str(conn_err)}",
+                "type": "connection_error",
+                "code": 503,
+                "subaccount": subaccount_name,
+            },
+        }
+        yield f"data: {orjson.dumps(error_payload).decode()}\n\n"
+        yield "data: [DONE]\n\n"
+
+    except httpx.ReadError as read_err:
+        logger.error(
+            "Connection dropped during streaming for model '%s': %s",
+            model,
+            read_err,
+        )
+        error_payload = {
+            "id": f"error-{_next_id()}",
+            "object": "error",
+            "created": int(time.time()),
+            "model": model,
+            "error": {
+                "message": "Connection lost during streaming",
+                "type": "connection_error",
+                "code": 502,
+                "subaccount": subaccount_name,
+            },
+        }
+        yield f"data: {orjson.dumps(error_payload).decode()}\n\n"
+        yield "data: [DONE]\n\n"
+
+    except httpx.RequestError as request_err:
+        logger.error(
+            "Request error for model '%s': %s",
+            model,
+            request_err,
+        )
+        error_payload = {
+            "id": f"error-{_next_id()}",
+            "object": "error",
+            "created": int(time.time()),
+            "model": model,
+            "error": {
+                "message": f"Network request failed: {str(request_err)}",
+                "type": "network_error",
+                "code": 503,
+                "subaccount": subaccount_name,
+            },
+        }
+        yield f"data: {orjson.dumps(error_payload).decode()}\n\n"
+        yield "data: [DONE]\n\n"
+
+    except Exception as unexpected_err:
+        logger.error(
+            "Error in streaming response from '%s': %s",
+            subaccount_name,
+            unexpected_err,
+            exc_info=traceback_allowed(unexpected_err),
+        )
+        error_payload = {
+            "id": f"error-{_next_id()}",
+            "object": "error",
+            "created": int(time.time()),
+            "model": model,
+            "error": {
+                "message": "An unexpected error occurred",
+                "type": "proxy_error",
+                "code": 500,
+                "subaccount": subaccount_name,
+            },
+        }
+        yield f"data: {orjson.dumps(error_payload).decode()}\n\n"
+        yield "data: [DONE]\n\n"
+
+    finally:
+        end_request(subaccount_name)
+
+
+# Parsers receive one decoded backend chunk plus its raw ``data:`` payload and
+# return (content_block_delta payload, stop reason, output tokens); any element
+# may be None.
+ClaudeChunkParser = Callable[
+    [dict[str, Any], str], tuple[dict[str, Any] | None, str | None, int | None]
+]
+
+
+def _parse_claude_backend_chunk(
+    parsed_data: dict[str, Any],
+    data_content: str,
+) -> tuple[dict[str, Any] | None, str | None, int | None]:
+    """Parse a Bedrock-style Claude chunk (contentBlockDelta/messageStop/metadata).
+
+    Keys are indexed directly: they are present on virtually every chunk, and
+    a try/except is cheaper than .get() chains with throwaway ``{}`` defaults.
+    """
+    if "contentBlockDelta" in parsed_data:
+        try:
+            text_content = parsed_data["contentBlockDelta"]["delta"]["text"]
+        except KeyError:
+            text_content = ""
+        if text_content:
+            return (
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "text_delta", "text": text_content},
                 },
-            }
-            yield f"data: {json.dumps(error_payload)}\n\n"
-            yield "data: [DONE]\n\n"
-
-        except httpx.ReadError as read_err:
-            logger.error(
-                "Connection dropped during streaming for model '%s': %s",
-                model,
-                read_err,
-                exc_info=True,
+                None,
+                None,
             )
-            error_payload = {
-                "id": f"error-{random.randint(10000000, 99999999)}",
-                "object": "error",
-                "created": int(time.time()),
-                "model": model,
-                "error": {
-                    "message": "Connection lost during streaming",
-                    "type": "connection_error",
-                    "code": 502,
-                    "subaccount": subaccount_name,
-                },
-            }
-            yield f"data: {json.dumps(error_payload)}\n\n"
-            yield "data: [DONE]\n\n"
-
-        except httpx.RequestError as request_err:
-            logger.error(
-                "Request error for model '%s': %s",
-                model,
-                request_err,
-                exc_info=True,
+    elif "messageStop" in parsed_data:
+        try:
+            return None, parsed_data["messageStop"]["stopReason"], None
+        except KeyError:
+            return None, "end_turn", None
+    elif "metadata" in parsed_data:
+        try:
+            return None, None, parsed_data["metadata"]["usage"]["outputTokens"]
+        except KeyError:
+            return None, None, 0
+    return None, None, None
+
+
+def _make_converted_chunk_parser(model: str) -> ClaudeChunkParser:
+    """Build the parser for Gemini/OpenAI chunks that are converted to Claude deltas.
+
+    The backend family is resolved here, once per stream, rather than per chunk.
+    """
+    if Detector.is_gemini_model(model):
+        convert_chunk = Converters.convert_gemini_chunk_to_claude_delta
+        get_stop_reason = get_claude_stop_reason_from_gemini_chunk
+        stop_marker = '"finishReason"'
+    else:
+        convert_chunk = Converters.convert_openai_chunk_to_claude_delta
+        get_stop_reason = get_claude_stop_reason_from_openai_chunk
+        stop_marker = '"finish_reason"'
+    stop_found = False
+
+    def parse_chunk(
+        parsed_data: dict[str, Any],
+        data_content: str,
+    ) -> tuple[dict[str, Any] | None, str | None, int | None]:
+        nonlocal stop_found
+        stop_reason = None
+        # A stream carries a single finish reason: only look for it until it is
+        # found, and only in chunks whose raw payload mentions the field at all.
+        if not stop_found and stop_marker in data_content:
+            stop_reason = get_stop_reason(parsed_data)
+            stop_found = stop_reason is not None
+        return convert_chunk(parsed_data), stop_reason, None
+
+    return parse_chunk
+
+
+async def _emit_claude_stream(
+    model: str,
+    lines: AsyncIterator[str],
+    parse_chunk: ClaudeChunkParser,
+    is_debug: bool,
+    text_fast_path: Callable[[str], bytes | None] | None = None,
+) -> AsyncGenerator[bytes, None]:
+    """Emit a Claude Messages API event stream from backend SSE lines.
+
+    Args:
+        model: Model name reported in message_start
+        lines: Backend SSE lines
+        parse_chunk: Parser for one decoded ``data:`` payload
+        is_debug: Whether debug logging is enabled
+        text_fast_path: Optional extractor returning the escaped text of a plain
+            text delta payload, bypassing JSON parsing; returns None otherwise
+
+    Yields:
+        message_start, content_block_start, the content_block_delta events,
+        then content_block_stop, message_delta and message_stop
+    """
+    message_start_event = _message_start_frame(model)
+    if is_debug:
+        logger.debug("Sending message_start event: %s", message_start_event)
+    yield message_start_event
+    if is_debug:
+        logger.debug(
+            "Sending content_block_start event: %s", _CONTENT_BLOCK_START_FRAME
+        )
+    yield _CONTENT_BLOCK_START_FRAME
+
+    chunk_count = 0
+    stop_reason = None
+    output_tokens = None
+
+    async for line in lines:
+        chunk_count += 1
+        if not line:
+            continue
+
+        line_str = line.strip()
+        if is_debug:
+            logger.debug(
+                "Streaming chunk %s for model '%s': %s", chunk_count, model, line_str
             )
-            error_payload = {
-                "id": f"error-{random.randint(10000000, 99999999)}",
-                "object": "error",
-                "created": int(time.time()),
-                "model": model,
-                "error": {
-                    "message": f"Network request failed: {str(request_err)}",
-                    "type": "network_error",
-                    "code": 503,
-                    "subaccount": subaccount_name,
-                },
-            }
-            yield f"data: {json.dumps(error_payload)}\n\n"
-            yield "data: [DONE]\n\n"
-
-        except Exception as unexpected_err:
-            logger.error(
-                "Error in streaming response from '%s': %s",
-                subaccount_name,
-                unexpected_err,
-                exc_info=True,
+
+        if not line_str.startswith("data: "):
+            continue
+        data_content = line_str[6:].strip()
+        if data_content == "[DONE]":
+            break
+
+        text_json = text_fast_path(data_content) if text_fast_path else None
+        delta = None
+        if text_json is None:
+            try:
+                parsed_data = orjson.loads(data_content)
+            except json.JSONDecodeError as e:
+                logger.warning(
+                    "Could not parse backend stream data: %s, error: %s",
+                    data_content,
+                    e,
+                )
+                continue
+
+            delta, chunk_stop_reason, chunk_output_tokens = parse_chunk(
+                parsed_data, data_content
             )
-            error_payload = {
-                "id": f"error-{random.randint(10000000, 99999999)}",
-                "object": "error",
-                "created": int(time.time()),
-                "model": model,
-                "error": {
-                    "message": "An unexpected error occurred",
-                    "type": "proxy_error",
-                    "code": 500,
-                    "subaccount": subaccount_name,
-                },
-            }
-            yield f"data: {json.dumps(error_payload)}\n\n"
-            yield "data: [DONE]\n\n"
+            if chunk_stop_reason:
+                stop_reason = chunk_stop_reason
+            if chunk_output_tokens is not None:
+                output_tokens = chunk_output_tokens
+            if delta:
+                delta_body = delta.get("delta") or {}
+                if delta_body.get("type") == "text_delta":
+                    text_json = orjson.dumps(delta_body["text"])[1:-1]
+
+        if text_json:
+            yield _text_delta_frame(text_json)
+        elif delta and text_json is None:
+            yield _sse(_EV_CONTENT_BLOCK_DELTA, orjson.dumps(delta))
+
+    logger.info("Claude stream conversion completed with %s chunks", chunk_count)
+
+    yield _CONTENT_BLOCK_STOP_FRAME
+
+    message_delta_data: dict[str, Any] = {
+        "type": "message_delta",
+        "delta": {"stop_reason": stop_reason or "end_turn", "stop_sequence": None},
+    }
+    if output_tokens is not None:
+        message_delta_data["usage"] = {"output_tokens": output_tokens}
+    yield _sse(_EV_MESSAGE_DELTA, orjson.dumps(message_delta_data))
+
+    yield _MESSAGE_STOP_FRAME
 
 
 async def generate_claude_streaming_response(
@@ -972,338 +1447,84 @@ async def generate_claude_streaming_response(
         model,
         subaccount_name,
     )
-    logger.debug(
-        "Forwarding payload to API (Claude streaming): %s",
-        json.dumps(payload, indent=2),
-    )
-    logger.debug("Request URL: %s", url)
-    logger.debug("Request headers: %s", headers)
-
-    timeout_config = httpx.Timeout(600)
+    # Captured once: the per-chunk debug lines below would otherwise build
+    # their arguments (including the serialized payload) on every call.
+    is_debug = logger.isEnabledFor(logging.DEBUG)
+    if is_debug:
+        logger.debug(
+            "Forwarding payload to API (Claude streaming): %s",
+            LazyJson(payload),
+        )
+        logger.debug("Request URL: %s", url)
+        logger.debug("Request headers: %s", headers)
 
     if Detector.is_claude_model(model):
         logger.info(
             "Backend is Claude model, converting response format for '%s'",
             model,
         )
-        try:
-            success = False
-            for attempt in range(AUTH_RETRY_MAX + 1):
-                async with httpx.AsyncClient(timeout=timeout_config) as client:
-                    async with client.stream(
-                        "POST", url, headers=headers, json=payload
-                    ) as http_response:
-                        if http_response.status_code in [401, 403]:
-                            if attempt == 0 and token_manager is not None:
-                                logger.warning(
-                                    log_auth_error_retry(
-                                        http_response.status_code,
-                                        f"model '{model}'",
-                                    )
-                                )
-                                token_manager.invalidate_token()
-                                new_token = token_manager.get_token()
-                                headers["Authorization"] = f"Bearer {new_token}"
-                                continue
-                            logger.error(
-                                log_auth_error_retry(
-                                    http_response.status_code,
-                                    f"model '{model}'",
-                                )
-                            )
-                            http_response.raise_for_status()
-
-                        http_response.raise_for_status()
-                        logger.debug(
-                            "Claude backend response status: %s",
-                            http_response.status_code,
-                        )
-
-                        message_start_data = {
-                            "type": "message_start",
-                            "message": {
-                                "id": f"msg_{random.randint(10000000, 99999999)}",
-                                "type": "message",
-                                "role": "assistant",
-                                "content": [],
-                                "model": model,
-                                "stop_reason": None,
-                                "stop_sequence": None,
-                                "usage": {"input_tokens": 0, "output_tokens": 0},
-                            },
-                        }
-                        message_start_event = f"event: message_start\ndata: {json.dumps(message_start_data)}\n\n"
-                        yield message_start_event.encode("utf-8")
-
-                        content_block_start_data = {
-                            "type": "content_block_start",
-                            "index": 0,
-                            "content_block": {"type": "text", "text": ""},
-                        }
-                        content_block_start_event = f"event: content_block_start\ndata: {json.dumps(content_block_start_data)}\n\n"
-                        yield content_block_start_event.encode("utf-8")
-
-                        chunk_count = 0
-                        stop_reason = None
-
-                        async for line in http_response.aiter_lines():
-                            chunk_count += 1
-                            if not line:
-                                continue
-
-                            line_str = line.strip()
-                            logger.debug(
-                                "Claude backend chunk %s: %s", chunk_count, line_str
-                            )
-
-                            if line_str.startswith("data: "):
-                                data_content = line_str[6:].strip()
-
-                                if data_content == "[DONE]":
-                                    break
+        parse_chunk: ClaudeChunkParser = _parse_claude_backend_chunk
+        text_fast_path = _claude_text_delta_fast_path
+    else:
+        logger.info("Converting non-Claude model '%s' stream to Claude format", model)
+        parse_chunk = _make_converted_chunk_parser(model)
+        text_fast_path = None
 
-                                try:
-                                    try:
-                                        parsed_data = json.loads(data_content)
-                                    except json.JSONDecodeError:
-                                        parsed_data = ast.literal_eval(data_content)
-
-                                    if "contentBlockDelta" in parsed_data:
-                                        text_content = parsed_data["contentBlockDelta"][
-                                            "delta"
-                                        ].get("text", "")
-                                        if text_content:
-                                            delta_data = {
-                                                "type": "content_block_delta",
-                                                "index": 0,
-                                                "delta": {
-                                                    "type": "text_delta",
-                                                    "text": text_content,
-                                                },
-                                            }
-                                            delta_event = f"event: content_block_delta\ndata: {json.dumps(delta_data)}\n\n"
-                                            yield delta_event.encode("utf-8")
-
-                                    elif "contentBlockStop" in parsed_data:
-                                        content_block_stop_data = {
-                                            "type": "content_block_stop",
-                                            "index": parsed_data[
-                                                "contentBlockStop"
-                                            ].get("contentBlockIndex", 0),
-                                        }
-                                        content_block_stop_event = f"event: content_block_stop\ndata: {json.dumps(content_block_stop_data)}\n\n"
-                                        yield content_block_stop_event.encode("utf-8")
-
-                                    elif "messageStop" in parsed_data:
-                                        stop_reason = parsed_data["messageStop"].get(
-                                            "stopReason", "end_turn"
-                                        )
-
-                                    elif "metadata" in parsed_data:
-                                        usage_info = parsed_data.get(
-                                            "metadata", {}
-                                        ).get("usage", {})
-                                        message_delta_data = {
-                                            "type": "message_delta",
-                                            "delta": {
-                                                "stop_reason": stop_reason
-                                                or "end_turn",
-                                                "stop_sequence": None,
-                                            },
-                                            "usage": {
-                                                "output_tokens": usage_info.get(
-                                                    "outputTokens", 0
-                                                )
-                                            },
-                                        }
-                                        message_delta_event = f"event: message_delta\ndata: {json.dumps(message_delta_data)}\n\n"
-                                        yield message_delta_event.encode("utf-8")
-
-                                        message_stop_event = f"event: message_stop\ndata: {json.dumps({'type': 'message_stop'})}\n\n"
-                                        yield message_stop_event.encode("utf-8")
-
-                                except (
-                                    json.JSONDecodeError,
-                                    ValueError,
-                                    SyntaxError,
-                                ) as e:
-                                    logger.warning(
-                                        "Could not parse Claude backend data: %s, error: %s",
-                                        data_content,
-                                        e,
-                                    )
-                                    continue
-
-                        logger.info(
-                            "Claude backend conversion completed with %s chunks",
-                            chunk_count,
-                        )
-                        success = True
-                        break
-
-            if not success:
-                raise Exception("Failed to get valid response for Claude streaming")
-        except Exception as e:
-            logger.error(
-                "Error in Claude backend conversion for '%s': %s",
-                model,
-                e,
-                exc_info=True,
-            )
-            raise
-        return
-
-    logger.info("Converting non-Claude model '%s' stream to Claude format", model)
-
-    message_start_data = {
-        "type": "message_start",
-        "message": {
-            "id": f"msg_{random.randint(10000000, 99999999)}",
-            "type": "message",
-            "role": "assistant",
-            "content": [],
-            "model": model,
-            "stop_reason": None,
-            "stop_sequence": None,
-            "usage": {"input_tokens": 0, "output_tokens": 0},
-        },
-    }
-    message_start_event = (
-        f"event: message_start\ndata: {json.dumps(message_start_data)}\n\n"
-    )
-    logger.debug("Sending message_start event: %s", message_start_event)
-    yield message_start_event.encode("utf-8")
-
-    content_block_start_data = {
-        "type": "content_block_start",
-        "index": 0,
-        "content_block": {"type": "text", "text": ""},
-    }
-    content_block_start_event = (
-        f"event: content_block_start\ndata: {json.dumps(content_block_start_data)}\n\n"
-    )
-    logger.debug("Sending content_block_start event: %s", content_block_start_event)
-    yield content_block_start_event.encode("utf-8")
-
-    stop_reason = None
-    chunk_count = 0
+    client = _get_async_stream_client()
 
     try:
         success = False
         for attempt in range(AUTH_RETRY_MAX + 1):
-            async with httpx.AsyncClient(timeout=timeout_config) as client:
-                async with client.stream(
-                    "POST", url, headers=headers, json=payload
-                ) as http_response:
-                    if http_response.status_code in [401, 403]:
-                        if attempt == 0 and token_manager is not None:
-                            logger.warning(
-                                log_auth_error_retry(
-                                    http_response.status_code, f"model '{model}'"
-                                )
-                            )
-                            token_manager.invalidate_token()
-                            new_token = token_manager.get_token()
-                            headers["Authorization"] = f"Bearer {new_token}"
-                            continue
-                        logger.error(
+            async with client.stream(
+                "POST", url, headers=headers, json=payload
+            ) as http_response:
+                if http_response.status_code in [401, 403]:
+                    if attempt == 0 and token_manager is not None:
+                        logger.warning(
                             log_auth_error_retry(
                                 http_response.status_code, f"model '{model}'"
                             )
                         )
-                        http_response.raise_for_status()
-
-                    http_response.raise_for_status()
-
-                    async for line in http_response.aiter_lines():
-                        chunk_count += 1
-                        if not line:
-                            continue
-
-                        line_str = line.strip()
-                        logger.debug(
-                            "Streaming chunk %s for model '%s': %s",
-                            chunk_count,
-                            model,
-                            line_str,
+                        token_manager.invalidate_token()
+                        headers["Authorization"] = token_manager.get_bearer_header()
+                        continue
+                    logger.error(
+                        log_auth_error_retry(
+                            http_response.status_code, f"model '{model}'"
                         )
+                    )
+                    http_response.raise_for_status()
 
-                        if line_str.startswith("data: "):
-                            data_content = line_str[6:].strip()
-                            if data_content == "[DONE]":
-                                break
-
-                            try:
-                                parsed_data = json.loads(data_content)
-                            except json.JSONDecodeError:
-                                logger.warning(
-                                    "Failed to parse chunk as JSON: %s", data_content
-                                )
-                                continue
-
-                            if Detector.is_gemini_model(model):
-                                delta_chunk = (
-                                    Converters.convert_gemini_chunk_to_claude_delta(
-                                        parsed_data
-                                    )
-                                )
-                            else:
-                                delta_chunk = (
-                                    Converters.convert_openai_chunk_to_claude_delta(
-                                        parsed_data
-                                    )
-                                )
-
-                            if delta_chunk:
-                                delta_event = f"event: content_block_delta\ndata: {json.dumps(delta_chunk)}\n\n"
-                                yield delta_event.encode("utf-8")
+                http_response.raise_for_status()
+                if is_debug:
+                    logger.debug(
+                        "Backend response status: %s", http_response.status_code
+                    )
 
-                            if Detector.is_gemini_model(model):
-                                stop_reason = get_claude_stop_reason_from_gemini_chunk(
-                                    parsed_data
-                                )
-                            else:
-                                stop_reason = get_claude_stop_reason_from_openai_chunk(
-                                    parsed_data
-                                )
+                async for frame in _emit_claude_stream(
+                    model,
+                    http_response.aiter_lines(),
+                    parse_chunk,
+                    is_debug,
+                    text_fast_path,
+                ):
+                    yield frame
 
-                    success = True
-                    break
+                success = True
+                break
 
         if not success:
             raise Exception("Failed to get valid response for Claude streaming")
     except Exception as e:
         logger.error(
-            "Error in streaming response from '%s': %s",
+            "Error in Claude streaming response from '%s' for '%s': %s",
             subaccount_name,
+            model,
             e,
-            exc_info=True,
+            exc_info=traceback_allowed(e),
         )
         raise
 
-    content_block_stop_data = {"type": "content_block_stop", "index": 0}
-    content_block_stop_event = (
-        f"event: content_block_stop\ndata: {json.dumps(content_block_stop_data)}\n\n"
-    )
-    yield content_block_stop_event.encode("utf-8")
-
-    message_delta_data = {
-        "type": "message_delta",
-        "delta": {
-            "stop_reason": stop_reason or "end_turn",
-            "stop_sequence": None,
-        },
-    }
-    message_delta_event = (
-        f"event: message_delta\ndata: {json.dumps(message_delta_data)}\n\n"
-    )
-    yield message_delta_event.encode("utf-8")
-
-    message_stop_event = (
-        f"event: message_stop\ndata: {json.dumps({'type': 'message_stop'})}\n\n"
-    )
-    yield message_stop_event.encode("utf-8")
-
 
 def generate_streaming_response_sync(
     url: str,
@@ -1313,17 +1534,12 @@ def generate_streaming_response_sync(
     subaccount_name: str,
     tid: str,
 ) -> Generator[str | bytes, None, None]:
-    with requests.post(
-        url, headers=headers, json=payload, stream=True, timeout=600
+    with _get_sync_stream_client().stream(
+        "POST", url, headers=headers, json=payload
     ) as response:
         response.raise_for_status()
-        for line in response.iter_lines():
-            if not line:
-                continue
-            if isinstance(line, bytes):
-                yield line + b"\n"
-            else:
-                yield f"{line}\n"
+        for line in _iter_raw_lines(response.iter_raw(SYNC_STREAM_CHUNK_SIZE)):
+            yield line + b"\n"
 
 
 def generate_claude_streaming_response_sync(
@@ -1334,22 +1550,17 @@ def generate_claude_streaming_response_sync(
     subaccount_name: str,
     token_manager=None,
 ) -> Generator[bytes, None, None]:
-    with requests.post(
-        url, headers=headers, json=payload, stream=True, timeout=600
+    with _get_sync_stream_client().stream(
+        "POST", url, headers=headers, json=payload
     ) as response:
         response.raise_for_status()
-        for line in response.iter_lines():
-            if not line:
-                continue
-            if isinstance(line, bytes):
-                yield line + b"\n"
-            else:
-                yield f"{line}\n".encode("utf-8")
+        for line in _iter_raw_lines(response.iter_raw(SYNC_STREAM_CHUNK_SIZE)):
+            yield line + b"\n"
 
 
 def generate_bedrock_streaming_response_sync(
     response_body: Any,
     tid: str,
-) -> Generator[str, None, None]:
+) -> Generator[bytes, None, None]:
     async_gen = generate_bedrock_streaming_response(response_body, tid)
     return _sync_iter_async_generator(async_gen)
@@ -8,12 +8,17 @@ Phase 6a: Helper functions extraction
 Phase 6b: Non-streaming request helper
 """
 
-import json
 import logging
 import random
+import threading
 from dataclasses import dataclass
+from http.cookiejar import DefaultCookiePolicy
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
+from utils.logging_utils import traceback_allowed, truncate_body
 
 # Stop reason mapping constants
 STOP_REASON_MAP = {
@@ -48,6 +53,41 @@ STOP_REASON_MAP = {
 logger = logging.getLogger(__name__)
 transport_logger = logging.getLogger("transport")
 
+# Keep-alive pool for non-streaming backend calls: one pool per backend host,
+# each holding up to BACKEND_POOL_MAXSIZE idle connections.
+BACKEND_POOL_CONNECTIONS = 32
+BACKEND_POOL_MAXSIZE = 128
+
+_backend_session_lock = threading.Lock()
+_backend_session: requests.Session | None = None
+
+
+def _get_backend_session() -> requests.Session:
+    """Lazily create the process-wide Session used for backend requests.
+
+    Reusing one Session keeps TCP/TLS connections to SAP AI Core alive across
+    requests. Retries stay with the callers, and cookies are not persisted so
+    requests remain independent of each other as with ``requests.post``.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _backend_session
+    if _backend_session is None:
+        with _backend_session_lock:
+            if _backend_session is None:
+                session = requests.Session()
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(
+                    pool_connections=BACKEND_POOL_CONNECTIONS,
+                    pool_maxsize=BACKEND_POOL_MAXSIZE,
+                    max_retries=0,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _backend_session = session
+    return _backend_session
+
 
 def get_claude_stop_reason_from_gemini_chunk(gemini_chunk: dict) -> str | None:
     """Extract and map the stop reason from a final Gemini chunk.
@@ -92,9 +132,7 @@ def parse_sse_response_to_claude_json(response_text: str) -> dict:
         dict: Claude JSON response format with id, type, role, content,
               model, stop_reason, stop_sequence, and usage fields
     """
-    import ast
-
-    content = ""
+    text_parts: list[str] = []
     usage = {}
     stop_reason = "end_turn"
 
@@ -105,21 +143,18 @@ def parse_sse_response_to_claude_json(response_text: str) -> dict:
             if not data_str or data_str == "[DONE]":
                 continue
             try:
-                # Handle both JSON and Python dict literal formats
-                if data_str.startswith("{"):
-                    data = json.loads(data_str)
-                else:
-                    data = ast.literal_eval(data_str)
+                data = orjson.loads(data_str)
 
                 if "contentBlockDelta" in data:
-                    delta_text = data["contentBlockDelta"]["delta"].get("text", "")
-                    content += delta_text
+                    text_parts.append(
+                        data["contentBlockDelta"]["delta"].get("text", "")
+                    )
                 elif "metadata" in data:
                     usage = data["metadata"].get("usage", {})
                 elif "messageStop" in data:
                     stop_reason = data["messageStop"].get("stopReason", "end_turn")
 
-            except (json.JSONDecodeError, ValueError, SyntaxError) as e:
+            except orjson.JSONDecodeError as e:
                 logger.warning(f"Failed to parse SSE data line: {data_str}, error: {e}")
                 continue
 
@@ -128,7 +163,7 @@ def parse_sse_response_to_claude_json(response_text: str) -> dict:
         "id": f"msg_{random.randint(10000000, 99999999)}",
         "type": "message",
         "role": "assistant",
-        "content": [{"type": "text", "text": content}],
+        "content": [{"type": "text", "text": "".join(text_parts)}],
         "model": "claude-3-5-sonnet-20241022",  # Default, will be overridden
         "stop_reason": stop_reason,
         "stop_sequence": None,
@@ -152,6 +187,7 @@ class BackendRequestResult:
         status_code: HTTP status code
         is_sse_response: Whether the response was in SSE format
         headers: Response headers (optional)
+        body: Raw JSON body as received, for callers that forward it unchanged
     """
 
     success: bool
@@ -160,6 +196,7 @@ class BackendRequestResult:
     status_code: int = 200
     is_sse_response: bool = False
     headers: dict | None = None
+    body: bytes | None = None
 
 
 def make_backend_request(
@@ -170,6 +207,8 @@ def make_backend_request(
     tid: str,
     is_claude_model_fn,
     timeout: int = 600,
+    log_body_limit: int = 0,
+    parse_json: bool = True,
 ) -> BackendRequestResult:
     """Make a generic backend request with standardized error handling and logging.
 
@@ -181,14 +220,24 @@ def make_backend_request(
         tid: Trace ID
         is_claude_model_fn: Function to check if model is a Claude model
         timeout: Request timeout in seconds
+        log_body_limit: Maximum bytes of the response body to log (0 = all)
+        parse_json: Parse a JSON body into ``response_data``; callers that
+            only forward ``body`` pass False to skip the parse
 
     Returns:
         BackendRequestResult object
     """
     logger.info(f"OUT_REQ: tid={tid}, model={model}, url={url}")
 
+    # Serialize with orjson and send raw bytes rather than letting requests
+    # encode ``json=`` with the stdlib encoder.
+    if "Content-Type" not in headers:
+        headers = {**headers, "Content-Type": "application/json"}
+
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=timeout)
+        response = _get_backend_session().post(
+            url, headers=headers, data=orjson.dumps(payload), timeout=timeout
+        )
 
         # Log basic response info
         logger.info(
@@ -208,6 +257,7 @@ def make_backend_request(
 
         # Handle SSE processing for Claude models if needed
         response_data = None
+        body = None
         is_sse = False
         response_headers = dict(response.headers)
 
@@ -219,8 +269,17 @@ def make_backend_request(
             is_sse = True
         else:
             # Standard JSON response
-            logger.info(f"OUT_RSP_BODY: tid={tid}, body={response.text}")
-            response_data = response.json()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "OUT_RSP_BODY: tid=%s, body=%s",
+                    tid,
+                    truncate_body(response.content, log_body_limit),
+                )
+            body = response.content
+            if parse_json:
+                # Parse the body bytes directly instead of response.json(),
+                # which decodes them to text before parsing
+                response_data = orjson.loads(body)
 
         return BackendRequestResult(
             success=True,
@@ -228,24 +287,24 @@ def make_backend_request(
             status_code=response.status_code,
             is_sse_response=is_sse,
             headers=response_headers,
+            body=body,
         )
 
     except requests.exceptions.HTTPError as http_err:
-        status_code = http_err.response.status_code if http_err.response else 500
+        # A requests.Response is falsy for error statuses, so test for None
+        error_response = http_err.response
+        has_response = error_response is not None
+        status_code = error_response.status_code if has_response else 500
         error_msg = str(http_err)
-        response_headers = (
-            dict(http_err.response.headers) if http_err.response else None
-        )
+        response_headers = dict(error_response.headers) if has_response else None
 
-        logger.error(
-            f"HTTP error in backend request({model}): {http_err}", exc_info=True
-        )
+        logger.error(f"HTTP error in backend request({model}): {http_err}")
 
         # Try to parse error body as JSON
         response_data = None
         try:
-            if http_err.response:
-                response_data = http_err.response.json()
+            if has_response:
+                response_data = error_response.json()
         except Exception:
             pass
 
@@ -266,7 +325,10 @@ def make_backend_request(
         )
 
     except Exception as err:
-        logger.error(f"Error in backend request({model}): {err}", exc_info=True)
+        logger.error(
+            f"Error in backend request({model}): {err}",
+            exc_info=traceback_allowed(err),
+        )
         return BackendRequestResult(
             success=False,
             error_message=str(err),
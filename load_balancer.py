@@ -2,9 +2,16 @@
 Load balancing and model resolution for SAP AI Core LLM Proxy.
 
 This module handles model name resolution (including fallbacks) and
-round-robin load balancing across subaccounts.
+least-outstanding-requests load balancing across subaccounts, with
+round-robin among equally loaded subaccounts and deployment URLs.
 """
 
+import contextlib
+import itertools
+import sys
+import threading
+from collections.abc import Iterator
+
 from proxy_helpers import Detector
 from utils.logging_utils import get_server_logger
 
@@ -15,8 +22,71 @@ DEFAULT_CLAUDE_MODEL = "anthropic--claude-4.5-sonnet"
 DEFAULT_GEMINI_MODEL = "gemini-2.5-pro"
 DEFAULT_GPT_MODEL = "gpt-4.1"
 
-# Module-level counter storage for load balancing
-_load_balance_counters: dict = {}
+# Module-level round-robin counters, keyed by model name (subAccount choice)
+# and by (subAccount, model) (URL choice). next() on an itertools.count is a
+# single atomic step, so concurrent requests never race on a shared int.
+_load_balance_counters: dict[str | tuple[str, str], itertools.count] = {}
+
+
+def _next_index(key: str | tuple[str, str], size: int) -> int:
+    """Return the next round-robin index for ``key`` over ``size`` entries."""
+    counter = _load_balance_counters.get(key)
+    if counter is None:
+        counter = _load_balance_counters.setdefault(key, itertools.count())
+    return next(counter) % size
+
+
+# Backend requests currently in flight per subAccount, maintained through
+# begin_request/end_request around each upstream call. Reads during
+# selection are lock-free; only updates take the lock.
+_in_flight: dict[str, int] = {}
+_in_flight_lock = threading.Lock()
+
+
+def begin_request(subaccount_name: str) -> None:
+    """Count a backend request to ``subaccount_name`` as in flight."""
+    with _in_flight_lock:
+        _in_flight[subaccount_name] = _in_flight.get(subaccount_name, 0) + 1
+
+
+def end_request(subaccount_name: str) -> None:
+    """Mark a backend request started with begin_request as finished."""
+    with _in_flight_lock:
+        _in_flight[subaccount_name] = _in_flight.get(subaccount_name, 1) - 1
+
+
+@contextlib.contextmanager
+def track_request(subaccount_name: str) -> Iterator[None]:
+    """Count the backend request made inside the block as in flight."""
+    begin_request(subaccount_name)
+    try:
+        yield
+    finally:
+        end_request(subaccount_name)
+
+
+def _select_subaccount(model_name: str, subaccount_names: list[str]) -> str:
+    """Pick the subAccount with the fewest in-flight requests for a model.
+
+    Candidates are scanned starting at the model's round-robin position, so
+    ties (including the idle case) rotate exactly as plain round-robin did.
+    """
+    count = len(subaccount_names)
+    start = _next_index(model_name, count)
+    if count == 1:
+        return subaccount_names[0]
+
+    in_flight = _in_flight
+    selected = subaccount_names[start]
+    lowest = in_flight.get(selected, 0)
+    for offset in range(1, count):
+        if not lowest:
+            break
+        candidate = subaccount_names[(start + offset) % count]
+        load = in_flight.get(candidate, 0)
+        if load < lowest:
+            selected, lowest = candidate, load
+    return selected
 
 
 def resolve_model_name(model_name: str, proxy_config) -> str | None:
@@ -33,6 +103,10 @@ def resolve_model_name(model_name: str, proxy_config) -> str | None:
     Returns:
         The resolved model name that exists in configuration, or None
     """
+    # Config keys are interned at load time; interning the request value
+    # lets the dict lookups below match by identity.
+    model_name = sys.intern(model_name)
+
     # Check if model already exists in config
     if model_name in proxy_config.model_to_subaccounts:
         return model_name
@@ -96,7 +170,7 @@ def load_balance_url(selected_model_name: str, proxy_config) -> tuple[str, str,
     Raises:
         ValueError: If no subAccounts have the requested model
     """
-    global _load_balance_counters
+    selected_model_name = sys.intern(selected_model_name)
 
     # Get list of subAccounts that have this model
     if (
@@ -189,18 +263,10 @@ def load_balance_url(selected_model_name: str, proxy_config) -> tuple[str, str,
 
     subaccount_names = proxy_config.model_to_subaccounts[selected_model_name]
 
-    # Create counter for this model if it doesn't exist
-    if selected_model_name not in _load_balance_counters:
-        _load_balance_counters[selected_model_name] = 0
-
-    # Select subAccount using round-robin
-    subaccount_index = _load_balance_counters[selected_model_name] % len(
-        subaccount_names
+    # Select the least loaded subAccount, round-robin among ties
+    selected_subaccount: str = _select_subaccount(
+        selected_model_name, subaccount_names
     )
-    selected_subaccount: str = subaccount_names[subaccount_index]
-
-    # Increment counter for next request
-    _load_balance_counters[selected_model_name] += 1
 
     # Get the model URL list from the selected subAccount
     subaccount = proxy_config.subaccounts[selected_subaccount]
@@ -215,21 +281,18 @@ def load_balance_url(selected_model_name: str, proxy_config) -> tuple[str, str,
         )
 
     # Select URL using round-robin within the subAccount
-    url_counter_key = f"{selected_subaccount}:{selected_model_name}"
-    if url_counter_key not in _load_balance_counters:
-        _load_balance_counters[url_counter_key] = 0
-
-    url_index = _load_balance_counters[url_counter_key] % len(url_list)
-    selected_url: str = url_list[url_index]
-
-    # Increment URL counter for next request
-    _load_balance_counters[url_counter_key] += 1
+    selected_url: str = url_list[
+        _next_index((selected_subaccount, selected_model_name), len(url_list))
+    ]
 
     # Get resource group for the selected subAccount
     selected_resource_group: str = subaccount.resource_group
 
     logger.info(
-        f"Selected subAccount '{selected_subaccount}' and URL '{selected_url}' for model '{selected_model_name}'"
+        "Selected subAccount '%s' and URL '%s' for model '%s'",
+        selected_subaccount,
+        selected_url,
+        selected_model_name,
     )
     return (
         selected_url,
@@ -241,10 +304,18 @@ def load_balance_url(selected_model_name: str, proxy_config) -> tuple[str, str,
 
 def reset_counters():
     """Reset all load balancing counters. Useful for testing."""
-    global _load_balance_counters
     _load_balance_counters.clear()
+    _in_flight.clear()
+
 
+def get_counters() -> dict[str | tuple[str, str], int]:
+    """Get the current load balancing counter values. Useful for testing and debugging.
 
-def get_counters() -> dict:
-    """Get the current load balancing counters. Useful for testing and debugging."""
-    return _load_balance_counters.copy()
+    Each value is the number of selections made so far for its key; reading
+    it does not advance the counter.
+    """
+    # itertools.count has no accessor for its value; its repr is "count(N)"
+    return {
+        key: int(repr(counter)[6:-1])
+        for key, counter in _load_balance_counters.items()
+    }
@@ -1,8 +1,10 @@
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 import logging
+import os
 
 from fastapi import FastAPI, Request, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
@@ -13,6 +15,15 @@ from utils.logging_utils import init_logging
 
 logger = logging.getLogger(__name__)
 
+# Idle keep-alive window for client connections. uvicorn's 5s default makes
+# agentic clients, which pause between turns, reconnect (and redo TLS at any
+# fronting proxy) for most requests.
+SERVER_KEEP_ALIVE_TIMEOUT = 75
+
+# Environment variable carrying the config path to worker processes, which
+# import and build their own app via create_app_from_env().
+CONFIG_PATH_ENV = "SAP_AI_PROXY_CONFIG"
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -21,10 +32,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     init_logging(debug=True)
     context = ProxyGlobalContext()
     context.initialize(config)
+    context.start_token_refresher()
     app.state.proxy_config = config
     app.state.proxy_context = context
     yield
-    context.shutdown()
+    # shutdown() joins the token refresher thread; keep it off the event loop
+    await run_in_threadpool(context.shutdown)
 
 
 def create_app(config_path: str) -> FastAPI:
@@ -121,19 +134,49 @@ def create_app(config_path: str) -> FastAPI:
     return app
 
 
+def create_app_from_env() -> FastAPI:
+    """Create the app from the config path in ``CONFIG_PATH_ENV``.
+
+    Used as the uvicorn app factory when serving with multiple worker
+    processes.
+
+    Returns:
+        Configured FastAPI application instance
+    """
+    return create_app(os.environ.get(CONFIG_PATH_ENV, "config.json"))
+
+
 def main() -> None:
     import uvicorn
 
     args = parse_arguments()
     config_path: str = args.config
     init_logging(debug=args.debug)
-    app = create_app(config_path)
     proxy_config = load_proxy_config(config_path)
     host = proxy_config.host
     port = proxy_config.port
     if args.port is not None:
         port = args.port
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # uvicorn is already a production ASGI server; asyncio transports set
+    # TCP_NODELAY on accepted sockets, so only the keep-alive window is tuned.
+    server_options = {
+        "host": host,
+        "port": port,
+        "log_level": "info",
+        "timeout_keep_alive": SERVER_KEEP_ALIVE_TIMEOUT,
+    }
+    if args.workers > 1:
+        # Each worker holds its own token cache, SDK clients and load
+        # balancing counters.
+        os.environ[CONFIG_PATH_ENV] = config_path
+        uvicorn.run(
+            "main:create_app_from_env",
+            factory=True,
+            workers=args.workers,
+            **server_options,
+        )
+    else:
+        uvicorn.run(create_app(config_path), **server_options)
 
 
 def get_proxy_config(app: FastAPI) -> ProxyConfig:
@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 import re
@@ -5,7 +6,9 @@ from logging import Logger
 import random
 import time
 
-from utils.logging_utils import get_server_logger
+import orjson
+
+from utils.logging_utils import LazyJson, get_server_logger
 
 logger: Logger = get_server_logger(__name__)
 
@@ -32,8 +35,48 @@ def load_model_aliases():
 MODEL_ALIASES = load_model_aliases()
 
 
+# Model family keywords as single compiled alternations. Claude matching is
+# case-sensitive, as the original keyword list was ("clau" and "sonn" cover
+# their longer spellings).
+_CLAUDE_MODEL_RE = re.compile(r"clau|sonn|haiku|opus|CLAUDE|SONNET|OPUS")
+_GEMINI_MODEL_RE = re.compile(r"gemini", re.IGNORECASE)
+# Normalized version markers of pre-3.7 Claude models
+_LEGACY_CLAUDE_VERSIONS = ("3-5", "3-opus")
+# Model family keywords compared by validate_model_mapping
+_MODEL_FAMILIES = ("claude", "gpt", "gemini", "text-embedding")
+_DIGITS_RE = re.compile(r"\d+")
+
+# Claude 3.7/4 /converse stopReason to OpenAI finish_reason
+_CLAUDE37_FINISH_REASONS = {
+    "end_turn": "stop",
+    "max_tokens": "length",
+    "stop_sequence": "stop",
+    "tool_use": "tool_calls",
+}
+# Message roles forwarded to the Claude /converse endpoint
+_CONVERSE_ROLES = frozenset({"user", "assistant"})
+# Content block keys kept by _sanitize_content_block; others are metadata
+_TEXT_BLOCK_KEYS = frozenset({"type", "text"})
+# Request fields copied unchanged into a Bedrock Claude payload
+_BEDROCK_COPIED_FIELDS = (
+    "model",
+    "max_tokens",
+    "temperature",
+    "top_p",
+    "top_k",
+    "stop_sequences",
+)
+# Claude 3.7/4 stream events with no OpenAI chunk equivalent
+_IGNORED_CLAUDE37_CHUNK_TYPES = frozenset(
+    {"contentBlockStart", "contentBlockStop", "metadata", "messageStop"}
+)
+
+
 class Detector:
+    # The is_* classifiers depend only on the model string and are called
+    # several times per request, so their results are memoized per model.
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def is_claude_37_or_4(model: str):
         """
         Check if the Claude model uses Converse API format (True) or InvokeModel format (False).
@@ -59,30 +102,17 @@ class Detector:
             or "opus-4" in model_lower  # Detect opus-4.x models
             or (
                 "claude" in model_lower
-                and not any(v in model_lower for v in ["3-5", "3-opus"])
+                and not any(v in model_lower for v in _LEGACY_CLAUDE_VERSIONS)
             )
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def is_claude_model(model):
-        return any(
-            keyword in model
-            for keyword in [
-                "haiku",
-                "claude",
-                "clau",
-                "claud",
-                "sonnet",
-                "sonne",
-                "sonn",
-                "opus",
-                "CLAUDE",
-                "SONNET",
-                "OPUS",
-            ]
-        )
+        return _CLAUDE_MODEL_RE.search(model) is not None
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def is_gemini_model(model):
         """
         Check if the model is a Gemini model.
@@ -93,12 +123,7 @@ class Detector:
         Returns:
             bool: True if the model is a Gemini model, False otherwise
         """
-        return any(
-            keyword in model.lower()
-            for keyword in [
-                "gemini",
-            ]
-        )
+        return _GEMINI_MODEL_RE.search(model) is not None
 
     @staticmethod
     def extract_version(name):
@@ -123,7 +148,7 @@ class Detector:
         Returns:
             str: The extracted version (e.g., "4", "3-5", "4-5") or None
         """
-        matches = list(re.finditer(r"\d+", name))
+        matches = list(_DIGITS_RE.finditer(name))
 
         if not matches:
             return None
@@ -230,9 +255,8 @@ class Detector:
         b_norm = backend_model.lower().replace(".", "-")
 
         # 1. Family Check
-        families = ["claude", "gpt", "gemini", "text-embedding"]
-        c_family = next((f for f in families if f in c_norm), None)
-        b_family = next((f for f in families if f in b_norm), None)
+        c_family = next((f for f in _MODEL_FAMILIES if f in c_norm), None)
+        b_family = next((f for f in _MODEL_FAMILIES if f in b_norm), None)
 
         if c_family and b_family and c_family != b_family:
             return (
@@ -327,7 +351,7 @@ class Converters:
             return None
 
         # Check if we're stripping any metadata
-        metadata_fields = [k for k in content_item.keys() if k not in ["type", "text"]]
+        metadata_fields = [k for k in content_item if k not in _TEXT_BLOCK_KEYS]
         if metadata_fields:
             logger.warning(
                 f"Stripping metadata from content block during Claude 3.7 conversion: {metadata_fields}. "
@@ -377,7 +401,8 @@ class Converters:
         system_message = ""
         messages = payload["messages"]
         if messages and messages[0]["role"] == "system":
-            raw_system_content = messages.pop(0)["content"]
+            raw_system_content = messages[0]["content"]
+            messages = messages[1:]
             # Extract text from content, handling nested arrays and stripping metadata
             system_message = Converters._extract_text_from_content(raw_system_content)
 
@@ -427,14 +452,16 @@ class Converters:
         - Tools arrays in OpenAI format (kept as-is for forwarding to SAP)
         """
         logger.debug(
-            f"Original OpenAI payload for Claude 3.7 conversion: {json.dumps(payload, indent=2)}"
+            "Original OpenAI payload for Claude 3.7 conversion: %s",
+            LazyJson(payload, indent=2),
         )
 
         # Extract system message if present, handling both string and nested array formats
         system_message = ""
         messages = payload.get("messages", [])
         if messages and messages[0].get("role") == "system":
-            raw_system_content = messages.pop(0).get("content", "")
+            raw_system_content = messages[0].get("content", "")
+            messages = messages[1:]
             # Extract text from content, handling nested arrays and stripping metadata
             system_message = Converters._extract_text_from_content(raw_system_content)
 
@@ -472,10 +499,13 @@ class Converters:
                     f"Unsupported type or content for 'stop' parameter: {stop_sequences}. Ignoring."
                 )
 
-        # Convert messages format
-        converted_messages = []
-        # The loop now iterates through the original messages list,
-        # potentially including the system message if it wasn't removed earlier.
+        # Convert messages format; the system message, if any, goes first as a
+        # user message
+        converted_messages = (
+            [{"role": "user", "content": [{"text": system_message}]}]
+            if system_message
+            else []
+        )
         for msg in messages:
             role = msg.get("role")
             content = msg.get("content")
@@ -484,7 +514,7 @@ class Converters:
             # Note: While the top-level 'system' parameter is standard for Claude /converse,
             # this modification includes the system message in the 'messages' array as requested.
             # This might deviate from the expected API usage.
-            if role in ["user", "assistant"]:
+            if role in _CONVERSE_ROLES:
                 if content:
                     if isinstance(content, str):
                         # Convert string content to the required list of blocks format
@@ -532,12 +562,6 @@ class Converters:
                 )
                 continue
 
-        # add the system_message to the converted_messages as the first element
-        if system_message:
-            converted_messages.insert(
-                0, {"role": "user", "content": [{"text": system_message}]}
-            )
-
         # Construct the final Claude 3.7 payload
         claude_payload = {"messages": converted_messages}
 
@@ -559,7 +583,7 @@ class Converters:
         # claude_payload["system"] = [{"text": system_message}]
 
         logger.debug(
-            f"Converted Claude 3.7 payload: {json.dumps(claude_payload, indent=2)}"
+            "Converted Claude 3.7 payload: %s", LazyJson(claude_payload, indent=2)
         )
         return claude_payload
 
@@ -567,7 +591,8 @@ class Converters:
     def convert_claude_request_to_openai(payload):
         """Converts a Claude Messages API request to an OpenAI Chat Completion request."""
         logger.debug(
-            f"Original Claude payload for OpenAI conversion: {json.dumps(payload, indent=2)}"
+            "Original Claude payload for OpenAI conversion: %s",
+            LazyJson(payload, indent=2),
         )
 
         openai_messages = []
@@ -606,7 +631,7 @@ class Converters:
             logger.debug(f"Converted {len(openai_tools)} tools for OpenAI format")
 
         logger.debug(
-            f"Converted OpenAI payload: {json.dumps(openai_payload, indent=2)}"
+            "Converted OpenAI payload: %s", LazyJson(openai_payload, indent=2)
         )
         return openai_payload
 
@@ -614,7 +639,8 @@ class Converters:
     def convert_claude_request_to_gemini(payload):
         """Converts a Claude Messages API request to a Google Gemini request."""
         logger.debug(
-            f"Original Claude payload for Gemini conversion: {json.dumps(payload, indent=2)}"
+            "Original Claude payload for Gemini conversion: %s",
+            LazyJson(payload, indent=2),
         )
 
         gemini_contents = []
@@ -687,7 +713,7 @@ class Converters:
             logger.debug(f"Converted {len(gemini_tools)} tools for Gemini format")
 
         logger.debug(
-            f"Converted Gemini payload: {json.dumps(gemini_payload, indent=2)}"
+            "Converted Gemini payload: %s", LazyJson(gemini_payload, indent=2)
         )
         return gemini_payload
 
@@ -698,20 +724,14 @@ class Converters:
         Handle tool conversion for Bedrock compatibility.
         """
         logger.debug(
-            f"Original Claude payload for Bedrock conversion: {json.dumps(payload, indent=2)}"
+            "Original Claude payload for Bedrock conversion: %s",
+            LazyJson(payload, indent=2),
         )
 
         bedrock_payload = {}
 
         # Copy basic fields
-        for field in [
-            "model",
-            "max_tokens",
-            "temperature",
-            "top_p",
-            "top_k",
-            "stop_sequences",
-        ]:
+        for field in _BEDROCK_COPIED_FIELDS:
             if field in payload:
                 bedrock_payload[field] = payload[field]
 
@@ -761,7 +781,7 @@ class Converters:
             bedrock_payload["anthropic_version"] = "bedrock-2023-05-31"
 
         logger.debug(
-            f"Converted Bedrock Claude payload: {json.dumps(bedrock_payload, indent=2)}"
+            "Converted Bedrock Claude payload: %s", LazyJson(bedrock_payload, indent=2)
         )
         return bedrock_payload
 
@@ -778,8 +798,8 @@ class Converters:
         logger.info(f"Using standard Claude conversion for model '{model}'.")
 
         try:
-            logger.info(
-                f"Raw response from Claude API: {json.dumps(response, indent=4)}"
+            logger.debug(
+                "Raw response from Claude API: %s", LazyJson(response, indent=4)
             )
 
             # Ensure the response contains the expected structure
@@ -794,6 +814,10 @@ class Converters:
                     "Invalid response structure: 'content[0].text' is missing"
                 )
 
+            usage = response.get("usage", {})
+            input_tokens = usage.get("input_tokens", 0)
+            output_tokens = usage.get("output_tokens", 0)
+
             # Conversion logic from Claude API to OpenAI format
             openai_response = {
                 "choices": [
@@ -811,16 +835,14 @@ class Converters:
                 "model": response.get("model", "claude-v1"),
                 "object": "chat.completion",
                 "usage": {
-                    "completion_tokens": response.get("usage", {}).get(
-                        "output_tokens", 0
-                    ),
-                    "prompt_tokens": response.get("usage", {}).get("input_tokens", 0),
-                    "total_tokens": response.get("usage", {}).get("input_tokens", 0)
-                    + response.get("usage", {}).get("output_tokens", 0),
+                    "completion_tokens": output_tokens,
+                    "prompt_tokens": input_tokens,
+                    "total_tokens": input_tokens + output_tokens,
                 },
             }
             logger.debug(
-                f"Converted response to OpenAI format: {json.dumps(openai_response, indent=4)}"
+                "Converted response to OpenAI format: %s",
+                LazyJson(openai_response, indent=4),
             )
             return openai_response
         except Exception as e:
@@ -835,7 +857,7 @@ class Converters:
         """
         try:
             logger.debug(
-                f"Raw response from Claude 3.7/4 API: {json.dumps(response, indent=2)}"
+                "Raw response from Claude 3.7/4 API: %s", LazyJson(response, indent=2)
             )
 
             # Validate the overall response structure
@@ -889,7 +911,7 @@ class Converters:
                 # Decide how to handle non-text blocks. For now, raise error if no text found.
                 # Find the first text block if available?
                 content_text = None
-                for block in content_list:
+                for block_index, block in enumerate(content_list):
                     if (
                         isinstance(block, dict)
                         and block.get("type") == "text"
@@ -897,7 +919,7 @@ class Converters:
                     ):
                         content_text = block["text"]
                         logger.info(
-                            f"Found text content in block at index {content_list.index(block)}"
+                            f"Found text content in block at index {block_index}"
                         )
                         break
                 if content_text is None:
@@ -931,23 +953,17 @@ class Converters:
                 prompt_tokens_details["cached_tokens"] = usage.get(
                     "cacheReadInputTokens", 0
                 )
-                if usage.get("cacheCreationInputTokens", 0) > 0:
-                    prompt_tokens_details["cache_creation_tokens"] = usage.get(
-                        "cacheCreationInputTokens", 0
+                cache_creation_tokens = usage.get("cacheCreationInputTokens", 0)
+                if cache_creation_tokens > 0:
+                    prompt_tokens_details["cache_creation_tokens"] = (
+                        cache_creation_tokens
                     )
 
             # --- Map Claude stopReason to OpenAI finish_reason ---
-            stop_reason_map = {
-                "end_turn": "stop",
-                "max_tokens": "length",
-                "stop_sequence": "stop",
-                "tool_use": "tool_calls",  # Map tool use if needed
-                # Add other potential Claude stop reasons if they arise
-            }
-            claude_stop_reason = response.get("stopReason")
-            finish_reason = stop_reason_map.get(
-                claude_stop_reason, "stop"
-            )  # Default to 'stop' if unknown or missing
+            # Default to 'stop' if unknown or missing
+            finish_reason = _CLAUDE37_FINISH_REASONS.get(
+                response.get("stopReason"), "stop"
+            )
 
             # --- Construct the OpenAI response ---
             openai_response = {
@@ -976,11 +992,13 @@ class Converters:
                     prompt_tokens_details
                 )
                 logger.debug(
-                    f"Added prompt_tokens_details to response: {prompt_tokens_details}"
+                    "Added prompt_tokens_details to response: %s",
+                    prompt_tokens_details,
                 )
 
             logger.debug(
-                f"Converted response to OpenAI format: {json.dumps(openai_response, indent=2)}"
+                "Converted response to OpenAI format: %s",
+                LazyJson(openai_response, indent=2),
             )
             return openai_response
 
@@ -992,7 +1010,8 @@ class Converters:
             )
             # Log the problematic response structure that caused the error
             logger.error(
-                f"Problematic Claude response structure: {json.dumps(response, indent=2)}"
+                "Problematic Claude response structure: %s",
+                LazyJson(response, indent=2),
             )
             # Return an error structure compliant with OpenAI format
             return {
@@ -1013,7 +1032,7 @@ class Converters:
     def convert_claude_chunk_to_openai(chunk, model):
         try:
             # Parse the Claude chunk
-            data = json.loads(chunk.replace("data: ", "").strip())
+            data = orjson.loads(chunk.replace("data: ", "").strip())
 
             # Initialize the OpenAI chunk structure
             openai_chunk = {
@@ -1034,7 +1053,7 @@ class Converters:
             ):
                 openai_chunk["choices"][0]["finish_reason"] = "stop"
 
-            return f"data: {json.dumps(openai_chunk)}\n\n"
+            return f"data: {orjson.dumps(openai_chunk).decode()}\n\n"
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error: {e}")
             return 'data: {"error": "Invalid JSON format"}\n\n'
@@ -1079,7 +1098,7 @@ class Converters:
             # Parse chunk if it's a string
             if isinstance(claude_chunk, str):
                 try:
-                    claude_chunk = json.loads(claude_chunk)
+                    claude_chunk = orjson.loads(claude_chunk)
                 except json.JSONDecodeError as e:
                     logger.error(f"JSON decode error: {e}")
                     return None
@@ -1096,7 +1115,7 @@ class Converters:
                 # Extract role, default to assistant if not present
                 role = claude_chunk.get("messageStart", {}).get("role", "assistant")
                 openai_chunk_payload["choices"][0]["delta"]["role"] = role
-                logger.debug(f"Converted messageStart chunk: {openai_chunk_payload}")
+                logger.debug("Converted messageStart chunk: %s", openai_chunk_payload)
 
             elif chunk_type == "contentBlockDelta":
                 # Extract text delta
@@ -1110,12 +1129,12 @@ class Converters:
                 ):  # Send even if empty string delta? OpenAI usually does.
                     openai_chunk_payload["choices"][0]["delta"]["content"] = text_delta
                     logger.debug(
-                        f"Converted contentBlockDelta chunk: {openai_chunk_payload}"
+                        "Converted contentBlockDelta chunk: %s", openai_chunk_payload
                     )
                 else:
                     # If delta or text is missing, maybe log but don't send?
                     logger.debug(
-                        f"Ignoring contentBlockDelta without text: {claude_chunk}"
+                        "Ignoring contentBlockDelta without text: %s", claude_chunk
                     )
                     return None  # Don't send chunk if no actual text delta
 
@@ -1123,21 +1142,14 @@ class Converters:
                 # Extract stop reason
                 stop_reason = claude_chunk.get("messageStop", {}).get("stopReason")
                 # Map Claude stopReason to OpenAI finish_reason
-                stop_reason_map = {
-                    "end_turn": "stop",
-                    "max_tokens": "length",
-                    "stop_sequence": "stop",
-                    "tool_use": "tool_calls",  # Map tool use if needed
-                    # Add other potential Claude stop reasons if they arise
-                }
-                finish_reason = stop_reason_map.get(stop_reason)
+                finish_reason = _CLAUDE37_FINISH_REASONS.get(stop_reason)
                 if finish_reason:
                     openai_chunk_payload["choices"][0]["finish_reason"] = finish_reason
                     # Delta should be empty or null for the final chunk with finish_reason
                     openai_chunk_payload["choices"][0][
                         "delta"
                     ] = {}  # Ensure delta is empty
-                    logger.debug(f"Converted messageStop chunk: {openai_chunk_payload}")
+                    logger.debug("Converted messageStop chunk: %s", openai_chunk_payload)
                 else:
                     logger.warning(
                         f"Unmapped or missing stopReason in messageStop: {stop_reason}. Chunk: {claude_chunk}"
@@ -1146,12 +1158,7 @@ class Converters:
                     # Sending with finish_reason=null might be confusing. Let's ignore.
                     return None
 
-            elif chunk_type in [
-                "contentBlockStart",
-                "contentBlockStop",
-                "metadata",
-                "messageStop",
-            ]:
+            elif chunk_type in _IGNORED_CLAUDE37_CHUNK_TYPES:
                 # These Claude events don't have a direct OpenAI chunk equivalent
                 # containing message delta or finish reason. Ignore them for streaming output.
                 # Metadata chunk should be handled separately in the calling function (`generate`)
@@ -1168,7 +1175,7 @@ class Converters:
                 return None
 
             # Format as SSE string if a valid payload was constructed
-            sse_string = f"data: {json.dumps(openai_chunk_payload)}\n\n"
+            sse_string = f"data: {orjson.dumps(openai_chunk_payload).decode()}\n\n"
             return sse_string
 
         except Exception as e:
@@ -1177,7 +1184,7 @@ class Converters:
                 exc_info=True,
             )
             logger.error(
-                f"Problematic Claude chunk: {json.dumps(claude_chunk, indent=2)}"
+                "Problematic Claude chunk: %s", LazyJson(claude_chunk, indent=2)
             )
             # Optionally return an error chunk in SSE format to the client
             error_payload = {
@@ -1195,7 +1202,7 @@ class Converters:
                     }
                 ],
             }
-            return f"data: {json.dumps(error_payload)}\n\n"
+            return f"data: {orjson.dumps(error_payload).decode()}\n\n"
 
     @staticmethod
     def convert_openai_to_gemini(payload):
@@ -1203,15 +1210,17 @@ class Converters:
         Converts an OpenAI API request payload to the format expected by the
         Google Vertex AI Gemini generateContent endpoint.
         """
-        logger.info(
-            f"Original OpenAI payload for Gemini conversion: {json.dumps(payload, indent=2)}"
+        logger.debug(
+            "Original OpenAI payload for Gemini conversion: %s",
+            LazyJson(payload, indent=2),
         )
 
         # Extract system message if present
         system_message = ""
         messages = payload.get("messages", [])
         if messages and messages[0].get("role") == "system":
-            system_message = messages.pop(0).get("content", "")
+            system_message = messages[0].get("content", "")
+            messages = messages[1:]
 
         # Build generation config
         generation_config = {}
@@ -1340,7 +1349,7 @@ class Converters:
         gemini_payload["safety_settings"] = safety_settings
 
         logger.debug(
-            f"Converted Gemini payload: {json.dumps(gemini_payload, indent=2)}"
+            "Converted Gemini payload: %s", LazyJson(gemini_payload, indent=2)
         )
         return gemini_payload
 
@@ -1352,7 +1361,7 @@ class Converters:
         """
         try:
             logger.debug(
-                f"Raw response from Gemini API: {json.dumps(response, indent=2)}"
+                "Raw response from Gemini API: %s", LazyJson(response, indent=2)
             )
 
             # Validate the overall response structure
@@ -1436,7 +1445,8 @@ class Converters:
             }
 
             logger.debug(
-                f"Converted response to OpenAI format: {json.dumps(openai_response, indent=2)}"
+                "Converted response to OpenAI format: %s",
+                LazyJson(openai_response, indent=2),
             )
             return openai_response
 
@@ -1445,7 +1455,8 @@ class Converters:
                 f"Error converting Gemini response to OpenAI format: {e}", exc_info=True
             )
             logger.error(
-                f"Problematic Gemini response structure: {json.dumps(response, indent=2)}"
+                "Problematic Gemini response structure: %s",
+                LazyJson(response, indent=2),
             )
             return {
                 "object": "error",
@@ -1463,7 +1474,8 @@ class Converters:
         """
         try:
             logger.debug(
-                f"Raw response from Gemini API for Claude conversion: {json.dumps(response, indent=2)}"
+                "Raw response from Gemini API for Claude conversion: %s",
+                LazyJson(response, indent=2),
             )
 
             if (
@@ -1515,7 +1527,8 @@ class Converters:
                 },
             }
             logger.debug(
-                f"Converted Gemini response to Claude format: {json.dumps(claude_response, indent=2)}"
+                "Converted Gemini response to Claude format: %s",
+                LazyJson(claude_response, indent=2),
             )
             return claude_response
 
@@ -1539,7 +1552,8 @@ class Converters:
         """
         try:
             logger.debug(
-                f"Raw response from OpenAI API for Claude conversion: {json.dumps(response, indent=2)}"
+                "Raw response from OpenAI API for Claude conversion: %s",
+                LazyJson(response, indent=2),
             )
 
             if (
@@ -1573,7 +1587,7 @@ class Converters:
                                 f"toolu_openai_{random.randint(10000000, 99999999)}",
                             ),
                             "name": function.get("name"),
-                            "input": json.loads(function.get("arguments", "{}")),
+                            "input": orjson.loads(function.get("arguments", "{}")),
                         }
                         claude_content.append(claude_tool_use)
 
@@ -1614,7 +1628,8 @@ class Converters:
                 },
             }
             logger.debug(
-                f"Converted OpenAI response to Claude format: {json.dumps(claude_response, indent=2)}"
+                "Converted OpenAI response to Claude format: %s",
+                LazyJson(claude_response, indent=2),
             )
             return claude_response
 
@@ -1683,7 +1698,7 @@ class Converters:
             # Parse the chunk if it's a string
             if isinstance(gemini_chunk, str):
                 try:
-                    gemini_chunk = json.loads(gemini_chunk)
+                    gemini_chunk = orjson.loads(gemini_chunk)
                 except json.JSONDecodeError as e:
                     logger.error(f"JSON decode error: {e}")
                     return None
@@ -1709,7 +1724,7 @@ class Converters:
                         "totalTokenCount", 0
                     ),
                 }
-                sse_string = f"data: {json.dumps(openai_chunk_payload)}\n\n"
+                sse_string = f"data: {orjson.dumps(openai_chunk_payload).decode()}\n\n"
                 return sse_string
 
             if not candidates:
@@ -1761,7 +1776,7 @@ class Converters:
                 )
 
             # Format as SSE string
-            sse_string = f"data: {json.dumps(openai_chunk_payload)}\n\n"
+            sse_string = f"data: {orjson.dumps(openai_chunk_payload).decode()}\n\n"
             return sse_string
 
         except Exception as e:
@@ -1783,4 +1798,4 @@ class Converters:
                     }
                 ],
             }
-            return f"data: {json.dumps(error_payload)}\n\n"
+            return f"data: {orjson.dumps(error_payload).decode()}\n\n"
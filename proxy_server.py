@@ -1,7 +1,8 @@
+from collections.abc import Callable
 from logging import Logger
+from typing import TYPE_CHECKING
 
 import requests  # noqa: F401 - used by tests via proxy_server.requests.post
-from botocore.exceptions import ClientError  # noqa: F401 - used in bedrock_handler
 
 from auth import RequestValidator  # noqa: F401 - re-exported for tests
 from auth.token_manager import TokenManager  # noqa: F401 - used by tests via proxy_server.TokenManager
@@ -10,6 +11,11 @@ from auth.token_manager import TokenManager  # noqa: F401 - used by tests via pr
 from config import ProxyConfig, ProxyGlobalContext
 from utils.logging_utils import get_server_logger, get_transport_logger
 
+if TYPE_CHECKING:
+    from gen_ai_hub.proxy.native.amazon.clients import ClientWrapper
+
+    from config import SubAccountConfig
+
 # Initialize token logger (will be configured on first use)
 logger: Logger = get_server_logger(__name__)
 transport_logger: Logger = get_transport_logger(__name__)
@@ -17,8 +23,6 @@ token_usage_logger: Logger = get_server_logger("token_usage")
 
 ctx: ProxyGlobalContext
 
-from utils.sdk_pool import get_bedrock_client  # noqa: F401,E402 - re-exported for downstream use
-
 API_VERSION_2023_05_15 = "2023-05-15"
 API_VERSION_2024_12_01_PREVIEW = "2024-12-01-preview"
 API_VERSION_BEDROCK_2023_05_31 = "bedrock-2023-05-31"
@@ -78,13 +82,14 @@ def handle_embedding_service_call(input_text, model, encoding_format):
 def format_embedding_response(response, model):
     # Logic to convert the response to OpenAI format
     embedding_data = response.get("embedding", [])
+    token_count = len(embedding_data)
     return {
         "object": "list",
         "data": [{"object": "embedding", "embedding": embedding_data, "index": 0}],
         "model": model,
         "usage": {
-            "prompt_tokens": len(embedding_data),
-            "total_tokens": len(embedding_data),
+            "prompt_tokens": token_count,
+            "total_tokens": token_count,
         },
     }
 
@@ -174,6 +179,21 @@ def handle_default_request(payload, model=DEFAULT_GPT_MODEL):
 # All endpoints have been migrated to FastAPI routers (routers/).
 
 
+def __getattr__(
+    name: str,
+) -> "Callable[[SubAccountConfig, str, str], ClientWrapper]":
+    """Resolve re-exports that pull in the SAP AI SDK on first access.
+
+    Importing utils.sdk_pool loads gen_ai_hub (and openai/boto3 behind it),
+    which dominates the import time of this compatibility module.
+    """
+    if name == "get_bedrock_client":
+        from utils.sdk_pool import get_bedrock_client
+
+        return get_bedrock_client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def main() -> None:
     """Deprecated entry point (delegates to FastAPI)."""
     logger.warning(
@@ -1,25 +1,33 @@
 """Router for /v1/chat/completions endpoint."""
 
-import json
-import uuid
+import logging
 
+import orjson
 from fastapi import APIRouter, Depends, Request
 from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from auth.request_validator import verify_request_token
-from handlers.model_handlers import (
-    handle_claude_request,
-    handle_default_request,
-    handle_gemini_request,
+from handlers.model_handlers import select_request_handler
+from handlers.streaming_generators import (
+    SSE_RESPONSE_HEADERS,
+    generate_streaming_response,
 )
-from handlers.streaming_generators import generate_streaming_response
 from handlers.streaming_handler import make_backend_request
-from load_balancer import resolve_model_name
+from load_balancer import resolve_model_name, track_request
 from proxy_helpers import Converters, Detector
-from utils.logging_utils import get_server_logger, get_transport_logger
+from utils.logging_utils import (
+    client_log_identity,
+    get_server_logger,
+    get_transport_logger,
+    new_trace_id,
+    traceback_allowed,
+    truncate_body,
+)
+from utils.responses import OrjsonResponse, backend_error_response
 
 logger = get_server_logger(__name__)
+transport_logger = get_transport_logger(__name__)
 
 router = APIRouter()
 
@@ -35,32 +43,21 @@ async def _handle_non_streaming_request(
     subaccount_name: str,
     tid: str,
 ) -> JSONResponse:
-    transport_logger = get_transport_logger(__name__)
-
-    result = await run_in_threadpool(
-        make_backend_request,
-        url=url,
-        headers=headers,
-        payload=payload,
-        model=model,
-        tid=tid,
-        is_claude_model_fn=Detector.is_claude_model,
-    )
+    log_body_limit = request.app.state.proxy_config.log_body_max_bytes
+    with track_request(subaccount_name):
+        result = await run_in_threadpool(
+            make_backend_request,
+            url=url,
+            headers=headers,
+            payload=payload,
+            model=model,
+            tid=tid,
+            is_claude_model_fn=Detector.is_claude_model,
+            log_body_limit=log_body_limit,
+        )
 
     if not result.success:
-        if result.status_code == 429:
-            return JSONResponse(
-                result.response_data or {"error": result.error_message},
-                status_code=429,
-            )
-
-        if result.response_data:
-            return JSONResponse(result.response_data, status_code=result.status_code)
-
-        return JSONResponse(
-            {"error": result.error_message or "Unknown error"},
-            status_code=result.status_code,
-        )
+        return backend_error_response(result)
 
     response_data = result.response_data
 
@@ -76,50 +73,57 @@ async def _handle_non_streaming_request(
     else:
         final_response = response_data
 
-    total_tokens = final_response.get("usage", {}).get("total_tokens", 0)
-    prompt_tokens = final_response.get("usage", {}).get("prompt_tokens", 0)
-    completion_tokens = final_response.get("usage", {}).get("completion_tokens", 0)
-
-    user_id = request.headers.get("Authorization", "unknown")
-    if user_id and len(user_id) > 20:
-        user_id = f"{user_id[:20]}..."
-    ip_address = request.client.host if request.client else "unknown_ip"
-    logger.info(
-        "CHAT_RSP: tid=%s, user=%s, ip=%s, model=%s, sub_account=%s, prompt_tokens=%s, completion_tokens=%s, total_tokens=%s",
-        tid,
-        user_id,
-        ip_address,
-        model,
-        subaccount_name,
-        prompt_tokens,
-        completion_tokens,
-        total_tokens,
-    )
-
-    transport_logger.info(
-        "RSP: tid=%s, status=200, body=%s", tid, json.dumps(final_response)
-    )
-
-    return JSONResponse(final_response)
+    # The usage summary only feeds this log line, so skip gathering it (and
+    # reading request headers) when INFO is disabled
+    if logger.isEnabledFor(logging.INFO):
+        usage = final_response.get("usage", {})
+        user_id, ip_address = client_log_identity(request)
+        logger.info(
+            "CHAT_RSP: tid=%s, user=%s, ip=%s, model=%s, sub_account=%s, prompt_tokens=%s, completion_tokens=%s, total_tokens=%s",
+            tid,
+            user_id,
+            ip_address,
+            model,
+            subaccount_name,
+            usage.get("prompt_tokens", 0),
+            usage.get("completion_tokens", 0),
+            usage.get("total_tokens", 0),
+        )
+
+    # Unconverted backend JSON is forwarded as received instead of re-encoded;
+    # otherwise the body is serialized once and the RSP log reuses its bytes
+    if final_response is response_data and result.body:
+        response = Response(result.body, media_type="application/json")
+    else:
+        response = OrjsonResponse(final_response)
+
+    if transport_logger.isEnabledFor(logging.INFO):
+        transport_logger.info(
+            "RSP: tid=%s, status=200, body=%s",
+            tid,
+            truncate_body(response.body, log_body_limit),
+        )
+
+    return response
 
 
 @router.post("/v1/chat/completions", dependencies=[Depends(verify_request_token)])
 async def proxy_openai_stream(request: Request):
     """Main handler for chat completions endpoint with multi-subAccount support."""
-    transport_logger = get_transport_logger(__name__)
-
     logger.info("Received request to /v1/chat/completions")
-    tid = str(uuid.uuid4())
+    tid = new_trace_id()
 
     raw_body = await request.body()
-    transport_logger.info(
-        "REQ: tid=%s, url=%s, body=%s",
-        tid,
-        request.url,
-        raw_body.decode("utf-8", errors="ignore"),
-    )
-
-    payload = await request.json()
+    # Decoding a large body is only worth it when the record is emitted
+    if transport_logger.isEnabledFor(logging.INFO):
+        transport_logger.info(
+            "REQ: tid=%s, url=%s, body=%s",
+            tid,
+            request.url,
+            truncate_body(raw_body, request.app.state.proxy_config.log_body_max_bytes),
+        )
+
+    payload = orjson.loads(raw_body)
     original_model = payload.get("model")
     effective_model = original_model or DEFAULT_GPT_MODEL
 
@@ -141,30 +145,16 @@ async def proxy_openai_stream(request: Request):
     logger.info("Model: %s, Streaming: %s", original_model, is_stream)
 
     try:
-        if Detector.is_claude_model(original_model):
-            endpoint_url, modified_payload, subaccount_name = handle_claude_request(
-                payload, original_model, request.app.state.proxy_config
-            )
-        elif Detector.is_gemini_model(original_model):
-            endpoint_url, modified_payload, subaccount_name = handle_gemini_request(
-                payload, original_model, request.app.state.proxy_config
-            )
-        else:
-            endpoint_url, modified_payload, subaccount_name = handle_default_request(
-                payload, original_model, request.app.state.proxy_config
-            )
+        handler = select_request_handler(original_model)
+        endpoint_url, modified_payload, subaccount_name = handler(
+            payload, original_model, request.app.state.proxy_config
+        )
 
         subaccount = request.app.state.proxy_config.subaccounts[subaccount_name]
-        subaccount_token = request.app.state.proxy_context.get_token_manager(
+        headers = subaccount.header_template.copy()
+        headers["Authorization"] = request.app.state.proxy_context.get_token_manager(
             subaccount_name
-        ).get_token()
-
-        headers = {
-            "AI-Resource-Group": subaccount.resource_group,
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {subaccount_token}",
-            "AI-Tenant-Id": subaccount.service_key.identity_zone_id,
-        }
+        ).get_bearer_header()
 
         logger.info(
             "CHAT: tid=%s, url=%s, model=%s, sub_account=%s",
@@ -196,12 +186,18 @@ async def proxy_openai_stream(request: Request):
                 tid,
             ),
             media_type="text/event-stream",
+            headers=SSE_RESPONSE_HEADERS,
         )
 
     except ValueError as err:
-        logger.error("CHAT: Value error, tid=%s, %s", tid, str(err), exc_info=True)
+        logger.error("CHAT: Value error, tid=%s, %s", tid, str(err))
         return JSONResponse({"error": str(err)}, status_code=400)
 
     except Exception as err:
-        logger.error("CHAT: Unexpected error, tid=%s, %s", tid, str(err), exc_info=True)
+        logger.error(
+            "CHAT: Unexpected error, tid=%s, %s",
+            tid,
+            str(err),
+            exc_info=traceback_allowed(err),
+        )
         return JSONResponse({"error": str(err)}, status_code=500)
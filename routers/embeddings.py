@@ -1,17 +1,24 @@
 """Router for /v1/embeddings endpoint."""
 
-import uuid
+import functools
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, Request
 from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from auth.request_validator import verify_request_token
 from handlers.streaming_handler import make_backend_request
-from load_balancer import load_balance_url
+from load_balancer import load_balance_url, track_request
 from proxy_helpers import Detector
-from utils.logging_utils import get_server_logger, get_transport_logger
+from utils.logging_utils import (
+    get_server_logger,
+    get_transport_logger,
+    new_trace_id,
+    traceback_allowed,
+)
+from utils.responses import OrjsonResponse, backend_error_response
 
 logger = get_server_logger(__name__)
 transport_logger = get_transport_logger(__name__)
@@ -21,9 +28,19 @@ router = APIRouter()
 DEFAULT_EMBEDDING_MODEL: str = "text-embedding-3-small"
 API_VERSION_2023_05_15 = "2023-05-15"
 
+# Serialized once; returned for every request without input text
+_INPUT_REQUIRED_BODY = orjson.dumps({"error": "Input text is required"})
+
+
+@functools.lru_cache(maxsize=256)
+def _embedding_endpoint_url(deployment_url: str) -> str:
+    """Return the embeddings endpoint for a deployment URL, built once per URL."""
+    base_url = deployment_url.rstrip("/")
+    return f"{base_url}/embeddings?api-version={API_VERSION_2023_05_15}"
+
 
 def _handle_embedding_service_call(
-    proxy_config: Any, input_text: Any, model: str
+    proxy_config: Any, input_text: Any, model: str, encoding_format: str | None = None
 ) -> tuple[str, dict[str, Any], str]:
     resolved_model = model
     if (
@@ -38,84 +55,85 @@ def _handle_embedding_service_call(
         resolved_model = DEFAULT_EMBEDDING_MODEL
 
     selected_url, subaccount_name, _, _ = load_balance_url(resolved_model, proxy_config)
-    endpoint_url = (
-        f"{selected_url.rstrip('/')}/embeddings?api-version={API_VERSION_2023_05_15}"
-    )
+    endpoint_url = _embedding_endpoint_url(selected_url)
     modified_payload = {"input": input_text}
+    # Forward the client's encoding so e.g. base64 embeddings come back
+    # compact and are passed through without parsing a list of floats.
+    if encoding_format:
+        modified_payload["encoding_format"] = encoding_format
     return endpoint_url, modified_payload, subaccount_name
 
 
 @router.post("/v1/embeddings", dependencies=[Depends(verify_request_token)])
 async def handle_embedding_request(request: Request) -> JSONResponse:
     """Handle embedding request endpoint."""
-    tid: str = str(uuid.uuid4())
+    tid: str = new_trace_id()
 
-    request_body_str: str = await request.body()
-    logger.info("CLIENT_EMBED_REQ: tid=%s, body=%s", tid, request_body_str)
+    request_body_bytes: bytes = await request.body()
+    logger.info("CLIENT_EMBED_REQ: tid=%s, body=%s", tid, request_body_bytes)
     transport_logger.info(
         "CLIENT_EMBED_REQ: tid=%s, url=%s, body=%s",
         tid,
         request.url,
-        request_body_str,
+        request_body_bytes,
     )
 
-    payload = await request.json()
+    payload = orjson.loads(request_body_bytes) if request_body_bytes else {}
     input_text = payload.get("input")
     model = payload.get("model", DEFAULT_EMBEDDING_MODEL)
+    encoding_format = payload.get("encoding_format")
 
     if not input_text:
-        return JSONResponse({"error": "Input text is required"}, status_code=400)
+        return Response(
+            _INPUT_REQUIRED_BODY, status_code=400, media_type="application/json"
+        )
 
     proxy_config = request.app.state.proxy_config
     proxy_context = request.app.state.proxy_context
 
     try:
         vendor_endpoint_url, upstream_payload, subaccount_name = (
-            _handle_embedding_service_call(proxy_config, input_text, model)
+            _handle_embedding_service_call(
+                proxy_config, input_text, model, encoding_format
+            )
         )
 
         token_manager = proxy_context.get_token_manager(subaccount_name)
-        subaccount_token = token_manager.get_token()
         subaccount = proxy_config.subaccounts[subaccount_name]
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {subaccount_token}",
-            "AI-Resource-Group": subaccount.resource_group,
-            "AI-Tenant-Id": subaccount.service_key.identity_zone_id,
-        }
-
-        result = await run_in_threadpool(
-            make_backend_request,
-            url=vendor_endpoint_url,
-            headers=headers,
-            payload=upstream_payload,
-            model=model,
-            tid=tid,
-            is_claude_model_fn=Detector.is_claude_model,
-        )
+        headers = subaccount.header_template.copy()
+        headers["Authorization"] = token_manager.get_bearer_header()
+
+        with track_request(subaccount_name):
+            result = await run_in_threadpool(
+                make_backend_request,
+                url=vendor_endpoint_url,
+                headers=headers,
+                payload=upstream_payload,
+                model=model,
+                tid=tid,
+                is_claude_model_fn=Detector.is_claude_model,
+                log_body_limit=proxy_config.log_body_max_bytes,
+                # The body is forwarded as received, so skip parsing the
+                # (often large) embedding vectors
+                parse_json=False,
+            )
 
         if not result.success:
-            if result.status_code == 429:
-                return JSONResponse(
-                    result.response_data or {"error": result.error_message},
-                    status_code=429,
-                )
-            if result.response_data:
-                return JSONResponse(
-                    result.response_data, status_code=result.status_code
-                )
-            return JSONResponse(
-                {"error": result.error_message or "Unknown error"},
+            return backend_error_response(result)
+
+        if result.body:
+            return Response(
+                result.body,
                 status_code=result.status_code,
+                media_type="application/json",
             )
-
-        return JSONResponse(result.response_data, status_code=result.status_code)
+        return OrjsonResponse(result.response_data, status_code=result.status_code)
 
     except Exception as e:
         logger.error(
             "EMBED_ERR: tid=%s, reason=unexpected_error, error=%s",
             tid,
             str(e),
-            exc_info=True,
+            exc_info=traceback_allowed(e),
         )
         return JSONResponse({"error": str(e)}, status_code=500)
@@ -1,11 +1,12 @@
 """Router for /api/event_logging/batch endpoint."""
 
-import json
+import logging
 
+import orjson
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
 
 from utils.logging_utils import get_server_logger
+from utils.responses import OrjsonResponse
 
 logger = get_server_logger(__name__)
 
@@ -14,7 +15,7 @@ router = APIRouter()
 
 @router.post("/api/event_logging/batch")
 @router.options("/api/event_logging/batch")
-async def handle_event_logging(request: Request) -> JSONResponse:
+async def handle_event_logging(request: Request) -> OrjsonResponse:
     """Dummy endpoint for Claude Code event logging to prevent 404 errors.
 
     Handles both POST and OPTIONS (CORS preflight) requests gracefully.
@@ -22,17 +23,18 @@ async def handle_event_logging(request: Request) -> JSONResponse:
     logger.info("Received %s request to /api/event_logging/batch", request.method)
     logger.debug("Request headers: %s", request.headers)
 
-    # Only read body for POST requests (OPTIONS has empty body)
-    if request.method == "POST":
+    # The body is only logged, so skip reading it unless DEBUG is enabled.
+    # OPTIONS requests have an empty body.
+    if request.method == "POST" and logger.isEnabledFor(logging.DEBUG):
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
             logger.debug("Request body: %s", body)
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.debug("Request body is not valid JSON")
         except Exception as e:
             logger.warning("Failed to read request body: %s", e)
 
-    return JSONResponse(
+    return OrjsonResponse(
         {"status": "success", "message": "Events logged successfully"},
         status_code=200,
     )
@@ -1,10 +1,12 @@
 """Router for /v1/messages endpoint (Anthropic Claude Messages API)."""
 
-import json
-import uuid
+import logging
+from typing import Callable, ParamSpec, TypeVar
 
+import orjson
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from gen_ai_hub.proxy.native.amazon.clients import ClientWrapper
 from tenacity import RetryError
 
@@ -15,15 +17,20 @@ from handlers.bedrock_handler import (
     read_response_body_stream,
 )
 from handlers.streaming_generators import (
+    SSE_RESPONSE_HEADERS,
     generate_bedrock_streaming_response,
-    generate_claude_streaming_response,
 )
 from handlers.streaming_handler import make_backend_request
-from load_balancer import load_balance_url
+from load_balancer import load_balance_url, track_request
 from proxy_helpers import Converters, Detector
 from utils.auth_retry import log_auth_error_retry
-from utils.logging_utils import get_server_logger, get_transport_logger
-from utils.retry import unified_retry as bedrock_retry, retry_on_rate_limit
+from utils.logging_utils import (
+    get_server_logger,
+    get_transport_logger,
+    new_trace_id,
+    traceback_allowed,
+    truncate_body,
+)
 from utils.sdk_pool import get_bedrock_client, invalidate_bedrock_client
 from utils.sdk_utils import extract_deployment_id
 
@@ -38,19 +45,66 @@ API_VERSION_2024_12_01_PREVIEW = "2024-12-01-preview"
 API_VERSION_2023_05_15 = "2023-05-15"
 
 
+def _error_body(error_type: str, message: str) -> bytes:
+    """Serialize an Anthropic-style error body."""
+    return orjson.dumps(
+        {"type": "error", "error": {"type": error_type, "message": message}}
+    )
+
+
+def _error_response(body: bytes, status_code: int) -> Response:
+    """Wrap a pre-serialized error body in a JSON response."""
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+async def _call_backend(
+    subaccount_name: str, func: Callable[P, R], *args: P.args, **kwargs: P.kwargs
+) -> R:
+    """Run a blocking Bedrock call in the threadpool, counted as in flight."""
+    with track_request(subaccount_name):
+        return await run_in_threadpool(func, *args, **kwargs)
+
+
+# Error bodies with fixed text are serialized once at import
+_MISSING_MODEL_BODY = _error_body("invalid_request_error", "Missing 'model' parameter")
+_NOT_CLAUDE_BODY = _error_body(
+    "invalid_request_error", "Only Claude models are supported by this endpoint"
+)
+_MALFORMED_RESPONSE_BODY = _error_body(
+    "api_error", "Malformed response from backend API"
+)
+_EMPTY_RESPONSE_BODY = _error_body("api_error", "Empty response body from backend API")
+# The Bedrock retry decorator only retries rate-limit errors, so a RetryError
+# always means the backend kept throttling.
+_RATE_LIMITED_BODY = _error_body(
+    "rate_limit_error", "Bedrock rate limit retries exhausted"
+)
+
+# Top-level Anthropic request fields that Bedrock rejects
+UNSUPPORTED_BEDROCK_FIELDS = frozenset(
+    {"context_management", "metadata", "output_config"}
+)
+
+
 @router.post("/v1/messages", dependencies=[Depends(verify_request_token)])
 async def proxy_claude_request(request: Request):
     """Handles requests compatible with the Anthropic Claude Messages API."""
-    tid: str = str(uuid.uuid4())
+    tid: str = new_trace_id()
 
     request_body_bytes = await request.body()
-    request_body_str = request_body_bytes.decode("utf-8", errors="ignore")
-    logger.info("REQ: tid=%s, body=%s", tid, request_body_str)
-    transport_logger.info(
-        "REQ: tid=%s, url=%s, body=%s", tid, request.url, request_body_str
-    )
+    # Decoding a large body is only worth it when a record is emitted
+    if logger.isEnabledFor(logging.INFO) or transport_logger.isEnabledFor(logging.INFO):
+        request_body_str = request_body_bytes.decode("utf-8", errors="ignore")
+        logger.info("REQ: tid=%s, body=%s", tid, request_body_str)
+        transport_logger.info(
+            "REQ: tid=%s, url=%s, body=%s", tid, request.url, request_body_str
+        )
 
-    request_body_json = await request.json()
+    request_body_json = orjson.loads(request_body_bytes)
     request_model = request_body_json.get("model")
     if (request_model is None) or (request_model == ""):
         request_model = DEFAULT_CLAUDE_MODEL
@@ -59,16 +113,7 @@ async def proxy_claude_request(request: Request):
         logger.info("request_model is: %s", request_model)
 
     if not request_model:
-        return JSONResponse(
-            {
-                "type": "error",
-                "error": {
-                    "type": "invalid_request_error",
-                    "message": "Missing 'model' parameter",
-                },
-            },
-            status_code=400,
-        )
+        return _error_response(_MISSING_MODEL_BODY, 400)
 
     proxy_config = request.app.state.proxy_config
     proxy_context = request.app.state.proxy_context
@@ -78,7 +123,7 @@ async def proxy_claude_request(request: Request):
             request_model, proxy_config
         )
     except ValueError as e:
-        logger.error("Model validation failed: %s", e, exc_info=True)
+        logger.error("Model validation failed: %s", e)
         return JSONResponse(
             {
                 "type": "error",
@@ -95,16 +140,7 @@ async def proxy_claude_request(request: Request):
             "Model '%s' is not a Claude model, falling back to original implementation",
             model,
         )
-        return JSONResponse(
-            {
-                "type": "error",
-                "error": {
-                    "type": "invalid_request_error",
-                    "message": "Only Claude models are supported by this endpoint",
-                },
-            },
-            status_code=400,
-        )
+        return _error_response(_NOT_CLAUDE_BODY, 400)
 
     logger.info("Request from Claude API for model: %s", model)
     stream = request_body_json.get("stream", True)
@@ -126,53 +162,54 @@ async def proxy_claude_request(request: Request):
         conversation = request_body_json.get("messages", [])
         logger.debug("Original conversation: %s", conversation)
 
-        thinking_cfg_preview = request_body_json.get("thinking")
+        thinking_cfg = request_body_json.get("thinking")
+        has_thinking = isinstance(thinking_cfg, dict)
         logger.info(
             "Claude request context: stream=%s, messages=%s, has_thinking=%s",
             stream,
             len(conversation) if isinstance(conversation, list) else "unknown",
-            isinstance(thinking_cfg_preview, dict),
+            has_thinking,
         )
 
+        # Drop empty text blocks, which Bedrock rejects
         for message in conversation:
             content = message.get("content")
             if isinstance(content, list):
-                items_to_remove = []
-                for i, item in enumerate(content):
-                    if item.get("type") == "text" and (
-                        not item.get("text") or item.get("text") == ""
-                    ):
-                        items_to_remove.append(i)
-                for i in reversed(items_to_remove):
-                    content.pop(i)
-
-        body = request_body_json.copy()
+                message["content"] = [
+                    item
+                    for item in content
+                    if item.get("type") != "text" or item.get("text")
+                ]
+
+        # The parsed body is owned by this request, so strip it in place
+        # rather than copying it
+        body = request_body_json
         logger.info("Original request body keys: %s", list(body.keys()))
         body.pop("model", None)
         body.pop("stream", None)
         body["anthropic_version"] = API_VERSION_BEDROCK_2023_05_31
 
-        unsupported_fields = ["context_management", "metadata", "output_config"]
-        for field in unsupported_fields:
-            if field in body:
-                logger.info(
-                    "Removing unsupported top-level field '%s' from request body",
-                    field,
-                )
-                body.pop(field, None)
+        # One C-level intersection; usually empty, so the loop rarely runs
+        for field in UNSUPPORTED_BEDROCK_FIELDS & body.keys():
+            logger.info(
+                "Removing unsupported top-level field '%s' from request body",
+                field,
+            )
+            del body[field]
 
-        thinking_cfg = body.get("thinking")
-        if isinstance(thinking_cfg, dict) and "context_management" in thinking_cfg:
+        if has_thinking and "context_management" in thinking_cfg:
             logger.info("Removing 'context_management' from thinking config")
             thinking_cfg.pop("context_management", None)
 
+        # Bedrock rejects input_examples. The body comes straight from
+        # orjson, so exact type checks suffice here.
         tools_list = body.get("tools")
-        if isinstance(tools_list, list):
+        if type(tools_list) is list:
             for tool in tools_list:
-                if isinstance(tool, dict):
+                if type(tool) is dict:
                     tool.pop("input_examples", None)
                     custom = tool.get("custom")
-                    if isinstance(custom, dict):
+                    if type(custom) is dict:
                         custom.pop("input_examples", None)
 
         raw_max_tokens = body.get("max_tokens")
@@ -187,7 +224,7 @@ async def proxy_claude_request(request: Request):
                 )
                 max_tokens_value = None
 
-        if isinstance(thinking_cfg, dict):
+        if has_thinking:
             budget_tokens = thinking_cfg.get("budget_tokens")
             if isinstance(budget_tokens, int):
                 required_min_tokens = budget_tokens + 1
@@ -199,11 +236,17 @@ async def proxy_claude_request(request: Request):
                         budget_tokens,
                     )
 
-        body_json = json.dumps(body)
+        # boto3 accepts bytes for the body blob, so skip the str round-trip
+        body_json = orjson.dumps(body)
 
         if stream:
             try:
-                response = invoke_bedrock_streaming(bedrock_client, body_json)
+                response = await _call_backend(
+                    subaccount_name,
+                    invoke_bedrock_streaming,
+                    bedrock_client,
+                    body_json,
+                )
                 response_status = response.get("ResponseMetadata", {}).get(
                     "HTTPStatusCode"
                 )
@@ -222,23 +265,19 @@ async def proxy_claude_request(request: Request):
                         model_name=model,
                         deployment_id=extract_deployment_id(selected_url),
                     )
-                    response = invoke_bedrock_streaming(bedrock_client, body_json)
+                    response = await _call_backend(
+                        subaccount_name,
+                        invoke_bedrock_streaming,
+                        bedrock_client,
+                        body_json,
+                    )
                     response_status = response.get("ResponseMetadata", {}).get(
                         "HTTPStatusCode"
                     )
                     response_body = response.get("body")
 
                 if response_status is None:
-                    return JSONResponse(
-                        {
-                            "type": "error",
-                            "error": {
-                                "type": "api_error",
-                                "message": "Malformed response from backend API",
-                            },
-                        },
-                        status_code=500,
-                    )
+                    return _error_response(_MALFORMED_RESPONSE_BODY, 500)
 
                 if response_status != 200:
                     return JSONResponse(
@@ -253,18 +292,14 @@ async def proxy_claude_request(request: Request):
                     )
 
                 if response_body is None:
-                    return JSONResponse(
-                        {
-                            "type": "error",
-                            "error": {
-                                "type": "api_error",
-                                "message": "Empty response body from backend API",
-                            },
-                        },
-                        status_code=500,
-                    )
+                    return _error_response(_EMPTY_RESPONSE_BODY, 500)
+            except RetryError:
+                # Answered with the static 429 by the outer handler
+                raise
             except Exception as e:
-                logger.error("Error before streaming: %s", e, exc_info=True)
+                logger.error(
+                    "Error before streaming: %s", e, exc_info=traceback_allowed(e)
+                )
                 return JSONResponse(
                     {
                         "type": "error",
@@ -274,11 +309,20 @@ async def proxy_claude_request(request: Request):
                 )
 
             return StreamingResponse(
-                generate_bedrock_streaming_response(response_body, tid),
+                generate_bedrock_streaming_response(
+                    response_body,
+                    tid,
+                    subaccount_name,
+                    proxy_config.stream_flush_bytes,
+                    proxy_config.stream_flush_ms,
+                ),
                 media_type="text/event-stream",
+                headers=SSE_RESPONSE_HEADERS,
             )
 
-        response = invoke_bedrock_non_streaming(bedrock_client, body_json)
+        response = await _call_backend(
+            subaccount_name, invoke_bedrock_non_streaming, bedrock_client, body_json
+        )
         response_status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
         response_body = response.get("body")
 
@@ -293,57 +337,48 @@ async def proxy_claude_request(request: Request):
                 model_name=model,
                 deployment_id=extract_deployment_id(selected_url),
             )
-            response = invoke_bedrock_non_streaming(bedrock_client, body_json)
+            response = await _call_backend(
+                subaccount_name,
+                invoke_bedrock_non_streaming,
+                bedrock_client,
+                body_json,
+            )
             response_status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
             response_body = response.get("body")
 
         # Check for malformed response
         if response_status is None:
-            return JSONResponse(
-                {
-                    "type": "error",
-                    "error": {
-                        "type": "api_error",
-                        "message": "Malformed response from backend API",
-                    },
-                },
-                status_code=500,
-            )
+            return _error_response(_MALFORMED_RESPONSE_BODY, 500)
 
         if response_body is not None:
-            chunk_data = read_response_body_stream(response_body)
-            response_json = json.loads(chunk_data)
-
-            logger.info("OUT_RSP_BODY: tid=%s, %s", tid, json.dumps(response_json))
+            # Bedrock already returns the Messages API JSON, so hand its
+            # bytes to the client instead of parsing and re-serializing.
+            chunk_data = await _call_backend(
+                subaccount_name, read_response_body_stream, response_body
+            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "OUT_RSP_BODY: tid=%s, %s",
+                    tid,
+                    truncate_body(chunk_data, proxy_config.log_body_max_bytes),
+                )
 
-            return JSONResponse(response_json, status_code=response_status)
+            return Response(
+                chunk_data,
+                status_code=response_status,
+                media_type="application/json",
+            )
         else:
             error_status = response_status if response_status >= 400 else 500
-            return JSONResponse(
-                {
-                    "type": "error",
-                    "error": {
-                        "type": "api_error",
-                        "message": "Empty response body from backend API",
-                    },
-                },
-                status_code=error_status,
-            )
+            return _error_response(_EMPTY_RESPONSE_BODY, error_status)
 
     except RetryError as err:
-        logger.error("RetryError in Claude request: %s", err, exc_info=True)
-        return JSONResponse(
-            {
-                "type": "error",
-                "error": {
-                    "type": "api_error",
-                    "message": "Bedrock retry failed",
-                },
-            },
-            status_code=500,
-        )
+        logger.error("RetryError in Claude request: %s", err)
+        return _error_response(_RATE_LIMITED_BODY, 429)
     except Exception as err:
-        logger.error("Error in Claude request: %s", err, exc_info=True)
+        logger.error(
+            "Error in Claude request: %s", err, exc_info=traceback_allowed(err)
+        )
         return JSONResponse(
             {
                 "type": "error",
@@ -1,10 +1,10 @@
 """Router for /v1/models endpoint."""
 
 import time
-from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from auth.request_validator import verify_request_token
 from utils.logging_utils import get_server_logger
@@ -13,25 +13,49 @@ logger = get_server_logger(__name__)
 
 router = APIRouter()
 
+# Serialized model list, keyed by the model mapping it was built from. The
+# mapping is only replaced on config (re)load, so clients polling this
+# endpoint get the cached bytes; "created" is the time the list was built.
+_models_cache: tuple[dict[str, list[str]], int, bytes] | None = None
+
+
+def _models_body(model_to_subaccounts: dict[str, list[str]]) -> bytes:
+    """Return the serialized /v1/models body for the configured models."""
+    global _models_cache
+    cached = _models_cache
+    if (
+        cached is not None
+        and cached[0] is model_to_subaccounts
+        and cached[1] == len(model_to_subaccounts)
+    ):
+        return cached[2]
+
+    timestamp = int(time.time())
+    body = orjson.dumps(
+        {
+            "object": "list",
+            "data": [
+                {
+                    "id": model_name,
+                    "object": "model",
+                    "created": timestamp,
+                    "owned_by": "sap-ai-core",
+                }
+                for model_name in model_to_subaccounts
+            ],
+        }
+    )
+    _models_cache = (model_to_subaccounts, len(model_to_subaccounts), body)
+    return body
+
 
 @router.get("/v1/models", dependencies=[Depends(verify_request_token)])
 @router.options("/v1/models")
-async def list_models(request: Request) -> JSONResponse:
+async def list_models(request: Request) -> Response:
     """Lists all available models across all subAccounts."""
     logger.info("Received request to /v1/models")
 
-    models: list[dict[str, Any]] = []
-    timestamp = int(time.time())
-    proxy_config = request.app.state.proxy_config
-
-    for model_name in proxy_config.model_to_subaccounts.keys():
-        models.append(
-            {
-                "id": model_name,
-                "object": "model",
-                "created": timestamp,
-                "owned_by": "sap-ai-core",
-            }
-        )
-
-    return JSONResponse({"object": "list", "data": models})
+    return Response(
+        _models_body(request.app.state.proxy_config.model_to_subaccounts),
+        media_type="application/json",
+    )
@@ -100,6 +100,15 @@ class TestDetector:
         assert Detector.is_gemini_model("llama-2") is False
         assert Detector.is_gemini_model("") is False
 
+    def test_model_classification_is_cached(self):
+        """Test that repeated classification of a model hits the cache."""
+        Detector.is_claude_model.cache_clear()
+        assert Detector.is_claude_model("claude-cache-test") is True
+        assert Detector.is_claude_model("claude-cache-test") is True
+        info = Detector.is_claude_model.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
 
 class TestConvertersUtility:
     """Test utility methods in Converters class."""
@@ -196,6 +205,8 @@ class TestConvertersOpenAIToClaudeRequests:
         assert result["messages"][0]["role"] == "user"
         assert result["messages"][0]["content"][0]["text"] == "System prompt"
         assert result["messages"][1]["content"][0]["text"] == "User message"
+        # The caller's message list is left intact
+        assert len(payload["messages"]) == 2
 
     def test_convert_openai_to_claude37_with_stop_sequences(self):
         """Test conversion with stop sequences."""
@@ -616,7 +627,7 @@ class TestConvertersStreamingChunks:
         result = Converters.convert_gemini_chunk_to_openai(chunk, "gemini-pro")
 
         assert "finish_reason" in result
-        assert '"finish_reason": "stop"' in result
+        assert '"finish_reason":"stop"' in result
 
 
 class TestConvertersBedrockFormat:
@@ -450,6 +450,9 @@ class TestModelDetection:
             ("claude", True),
             ("sonnet", True),
             ("CLAUDE", True),
+            ("anthropic--claude-haiku-4.5", True),
+            ("opus-4", True),
+            ("OPUS", True),
             ("gpt-4", False),
             ("gemini-pro", False),
         ],
@@ -670,8 +673,7 @@ class TestTokenManagement:
         mock_request = Mock()
         mock_request.headers = {"Authorization": "Bearer wrong-token-xyz"}
 
-        # The function checks if any secret_key is IN the token string
-        # "wrong-token-xyz" doesn't contain "secret-abc-123"
+        # "wrong-token-xyz" does not match "secret-abc-123"
         result = verify_request_token(mock_request, proxy_server.proxy_config)
         assert result is False
 
@@ -958,7 +960,7 @@ class TestFlaskEndpoints:
         assert data["status"] == "success"
 
     @patch("auth.request_validator.RequestValidator.validate")
-    @patch("proxy_server.requests.post")
+    @patch("requests.Session.post")
     def test_embeddings_endpoint(
         self, mock_post, mock_validate, flask_client, reset_proxy_config
     ):
@@ -977,6 +979,7 @@ class TestFlaskEndpoints:
         mock_response.text = (
             '{"object": "list", "data": [{"embedding": [0.1, 0.2, 0.3], "index": 0}]}'
         )
+        mock_response.content = mock_response.text.encode()
         mock_post.return_value = mock_response
 
         # Setup subaccount
@@ -1070,8 +1073,14 @@ class TestIntegration:
 
     @patch("auth.request_validator.RequestValidator.validate")
     @patch("proxy_server.requests.post")
+    @patch("requests.Session.post")
     def test_chat_completion_flow(
-        self, mock_post, mock_validate, flask_client, reset_proxy_config
+        self,
+        mock_session_post,
+        mock_post,
+        mock_validate,
+        flask_client,
+        reset_proxy_config,
     ):
         """Test complete chat completion flow."""
         mock_validate.return_value = True
@@ -1090,7 +1099,7 @@ class TestIntegration:
             else:
                 # Chat completion response
                 mock_response = Mock()
-                mock_response.json.return_value = {
+                mock_response.json.return_value = response_json = {
                     "id": "chatcmpl-123",
                     "object": "chat.completion",
                     "created": 1234567890,
@@ -1111,13 +1120,13 @@ class TestIntegration:
                 mock_response.raise_for_status = Mock()
                 mock_response.status_code = 200
                 mock_response.headers = {}
-                mock_response.text = (
-                    '{"id": "chatcmpl-123", "object": "chat.completion"}'
-                )
-                mock_response.content = b'{"id": "chatcmpl-123"}'
+                mock_response.text = json.dumps(response_json)
+                mock_response.content = mock_response.text.encode()
                 return mock_response
 
+        # Token fetch uses requests.post, backend calls the pooled Session
         mock_post.side_effect = mock_post_side_effect
+        mock_session_post.side_effect = mock_post_side_effect
 
         # Setup subaccount
         subaccount = SubAccountConfig(
@@ -1951,6 +1960,50 @@ class TestRequestHandlersExtended:
         assert subaccount_name == "account1"
         assert "messages" in modified_payload
 
+    @pytest.mark.parametrize(
+        "model, stream, expected_path",
+        [
+            ("anthropic--claude-4.5-sonnet", True, "/converse-stream"),
+            ("anthropic--claude-4.5-sonnet", False, "/converse"),
+            ("anthropic--claude-3.5-sonnet", True, "/invoke-with-response-stream"),
+            ("anthropic--claude-3.5-sonnet", False, "/invoke"),
+        ],
+    )
+    def test_handle_claude_request_endpoint_paths(
+        self, reset_proxy_config, model, stream, expected_path
+    ):
+        """Test handle_claude_request endpoint path per API family and stream mode."""
+        subaccount = SubAccountConfig(
+            name="account1",
+            resource_group="default",
+            service_key_json="key.json",
+            model_to_deployment_urls={model: ["https://url1.com/"]},
+        )
+        proxy_server.proxy_config.subaccounts["account1"] = subaccount
+        proxy_server.proxy_config.model_to_subaccounts = {model: ["account1"]}
+
+        payload = {"messages": [{"role": "user", "content": "Hello"}], "stream": stream}
+
+        url, _, _ = proxy_server.handle_claude_request(payload, model)
+
+        assert url == f"https://url1.com{expected_path}"
+
+    @pytest.mark.parametrize(
+        "model, expected_handler",
+        [
+            ("anthropic--claude-4.5-sonnet", "handle_claude_request"),
+            ("gemini-2.5-pro", "handle_gemini_request"),
+            ("gpt-4.1", "handle_default_request"),
+        ],
+    )
+    def test_select_request_handler(self, model, expected_handler):
+        """Test that each model family is routed to its request handler."""
+        from handlers import model_handlers
+
+        handler = model_handlers.select_request_handler(model)
+
+        assert handler is getattr(model_handlers, expected_handler)
+
     def test_handle_gemini_request_streaming(self, reset_proxy_config):
         """Test handle_gemini_request with streaming."""
         subaccount = SubAccountConfig(
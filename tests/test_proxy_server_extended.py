@@ -144,7 +144,7 @@ class TestEmbeddingEndpoint:
 
     @patch("routers.embeddings.load_balance_url")
     @patch("proxy_server.handle_embedding_service_call")
-    @patch("proxy_server.requests.post")
+    @patch("requests.Session.post")
     def test_embedding_endpoint_array_input(
         self, mock_post, mock_handle_call, mock_load_balance, client, setup_test_config
     ):
@@ -171,6 +171,7 @@ class TestEmbeddingEndpoint:
         mock_response.status_code = 200
         mock_response.headers = {}
         mock_response.text = '{"embeddings": [[0.1, 0.2], [0.3, 0.4]]}'
+        mock_response.content = mock_response.text.encode()
         mock_post.return_value = mock_response
 
         response = client.post(
@@ -241,6 +242,21 @@ class TestConvertersEdgeCases:
         assert result["choices"][0]["finish_reason"] == "tool_use"
 
 
+class TestLazyReexports:
+    """Test cases for re-exports resolved on first attribute access."""
+
+    def test_get_bedrock_client_resolves_to_sdk_pool(self):
+        """Test that get_bedrock_client is still importable from proxy_server."""
+        from utils.sdk_pool import get_bedrock_client
+
+        assert proxy_server.get_bedrock_client is get_bedrock_client
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            proxy_server.does_not_exist
+
+
 class TestParseArguments:
     """Test cases for parse_arguments function."""
 
@@ -314,7 +330,7 @@ class TestProxyOpenAIStreamEndpoint:
     """Test cases for proxy_openai_stream endpoint."""
 
     @patch("auth.request_validator.RequestValidator.validate")
-    @patch("proxy_server.requests.post")
+    @patch("requests.Session.post")
     def test_proxy_openai_stream_claude_model_success(
         self, mock_post, mock_validate, client, setup_test_config
     ):
@@ -333,11 +349,11 @@ class TestProxyOpenAIStreamEndpoint:
             "stopReason": "end_turn",
             "usage": {"inputTokens": 10, "outputTokens": 5, "totalTokens": 15},
         }
-        mock_response.text = '{"output": {"message": {"role": "assistant", "content": [{"text": "Hello"}]}}}'
+        mock_response.text = json.dumps(mock_response.json.return_value)
         mock_response.raise_for_status = Mock()
         mock_response.status_code = 200
         mock_response.headers = {}
-        mock_response.content = b'{"output": {"message": {"role": "assistant", "content": [{"text": "Hello"}]}}}'
+        mock_response.content = mock_response.text.encode()
         mock_post.return_value = mock_response
 
         response = client.post(
@@ -355,7 +371,7 @@ class TestProxyOpenAIStreamEndpoint:
         assert "choices" in data
 
     @patch("auth.request_validator.RequestValidator.validate")
-    @patch("proxy_server.requests.post")
+    @patch("requests.Session.post")
     def test_proxy_openai_stream_gemini_model_success(
         self, mock_post, mock_validate, client, setup_test_config
     ):
@@ -374,12 +390,8 @@ class TestProxyOpenAIStreamEndpoint:
         mock_response.raise_for_status = Mock()
         mock_response.status_code = 200
         mock_response.headers = {}
-        mock_response.text = (
-            '{"candidates": [{"content": {"parts": [{"text": "Hello from Gemini"}]}}]}'
-        )
-        mock_response.content = (
-            b'{"candidates": [{"content": {"parts": [{"text": "Hello from Gemini"}]}}]}'
-        )
+        mock_response.text = json.dumps(mock_response.json.return_value)
+        mock_response.content = mock_response.text.encode()
         mock_post.return_value = mock_response
 
         response = client.post(
@@ -501,20 +513,21 @@ class TestProxyOpenAIStreamEndpoint:
 class TestGenerateClaudeStreamingResponse:
     """Test cases for generate_claude_streaming_response function (no Flask context needed)."""
 
-    @patch("proxy_server.requests.post")
-    def test_generate_claude_streaming_response_success(self, mock_post):
+    @patch("handlers.streaming_generators._get_sync_stream_client")
+    def test_generate_claude_streaming_response_success(self, mock_get_client):
         """Test successful Claude streaming response generation."""
         from proxy_server import generate_claude_streaming_response
 
         mock_response = Mock()
-        mock_response.iter_lines.return_value = [
+        mock_response.iter_raw.return_value = [
             b'data: {"type":"message_start","message":{"id":"msg_123"}}\n',
-            b'data: {"type":"content_block_delta","delta":{"text":"Hello"}}\n',
+            b'data: {"type":"content_block_delta",',
+            b'"delta":{"text":"Hello"}}\n',
             b'data: {"type":"message_stop"}\n',
         ]
         mock_response.__enter__ = Mock(return_value=mock_response)
         mock_response.__exit__ = Mock(return_value=None)
-        mock_post.return_value = mock_response
+        mock_get_client.return_value.stream.return_value = mock_response
 
         result = generate_claude_streaming_response(
             "https://test.com/api",
@@ -528,21 +541,26 @@ class TestGenerateClaudeStreamingResponse:
         assert result is not None
         # Convert to list to test content
         chunks = list(result)
-        assert len(chunks) > 0
+        assert len(chunks) == 3
+        assert chunks[1] == (
+            b'data: {"type":"content_block_delta","delta":{"text":"Hello"}}\n'
+        )
 
-    @patch("proxy_server.requests.post")
-    def test_generate_claude_streaming_response_error_handling(self, mock_post):
+    @patch("handlers.streaming_generators._get_sync_stream_client")
+    def test_generate_claude_streaming_response_error_handling(self, mock_get_client):
         """Test error handling in Claude streaming response."""
         from proxy_server import generate_claude_streaming_response
-        import requests
+        import httpx
 
         mock_response = Mock()
         mock_response.__enter__ = Mock(return_value=mock_response)
         mock_response.__exit__ = Mock(return_value=None)
         mock_response.raise_for_status = Mock(
-            side_effect=requests.exceptions.HTTPError("HTTP Error")
+            side_effect=httpx.HTTPStatusError(
+                "HTTP Error", request=Mock(), response=Mock()
+            )
         )
-        mock_post.return_value = mock_response
+        mock_get_client.return_value.stream.return_value = mock_response
 
         result = generate_claude_streaming_response(
             "https://test.com/api",
@@ -553,7 +571,7 @@ class TestGenerateClaudeStreamingResponse:
         )
 
         # Should raise exception on HTTP error
-        with pytest.raises(requests.exceptions.HTTPError):
+        with pytest.raises(httpx.HTTPStatusError):
             list(result)
 
 
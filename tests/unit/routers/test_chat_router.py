@@ -155,11 +155,13 @@ class TestNonStreamingHandler:
         mock_request = Mock(spec=Request)
         mock_request.headers = {}
         mock_request.client = Mock(host="127.0.0.1")
+        mock_request.app.state.proxy_config.log_body_max_bytes = 4096
 
         backend_result = Mock()
         backend_result.success = True
         backend_result.response_data = {"choices": [{"message": {"content": "Hello"}}]}
         backend_result.is_sse_response = False
+        backend_result.body = None
 
         with patch("routers.chat.run_in_threadpool", return_value=backend_result):
             with patch(
@@ -179,12 +181,76 @@ class TestNonStreamingHandler:
                 assert isinstance(response, JSONResponse)
                 assert response.status_code == 200
 
+    @pytest.mark.asyncio
+    async def test_unconverted_response_forwards_backend_body(self):
+        """Verify a response needing no conversion is returned byte-for-byte."""
+        mock_request = Mock(spec=Request)
+        mock_request.headers = {}
+        mock_request.client = Mock(host="127.0.0.1")
+        mock_request.app.state.proxy_config.log_body_max_bytes = 4096
+
+        backend_result = Mock()
+        backend_result.success = True
+        backend_result.response_data = {"choices": []}
+        backend_result.is_sse_response = False
+        backend_result.body = b'{"choices": []}'
+
+        with patch("routers.chat.run_in_threadpool", return_value=backend_result):
+            response = await _handle_non_streaming_request(
+                request=mock_request,
+                url="http://test.com",
+                headers={},
+                payload={"model": "gpt-4"},
+                model="gpt-4",
+                subaccount_name="test",
+                tid="test-123",
+            )
+
+        assert response.body == b'{"choices": []}'
+        assert response.media_type == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_converted_response_logged_from_response_body(self):
+        """Verify the RSP log line reuses the serialized response body."""
+        mock_request = Mock(spec=Request)
+        mock_request.headers = {}
+        mock_request.client = Mock(host="127.0.0.1")
+        mock_request.app.state.proxy_config.log_body_max_bytes = 0
+
+        backend_result = Mock()
+        backend_result.success = True
+        backend_result.response_data = {"content": []}
+        backend_result.is_sse_response = False
+        backend_result.body = b'{"content": []}'
+
+        with patch("routers.chat.run_in_threadpool", return_value=backend_result):
+            with patch(
+                "routers.chat.Converters.convert_claude_to_openai",
+                return_value={"converted": True},
+            ):
+                with patch("routers.chat.transport_logger") as mock_transport:
+                    response = await _handle_non_streaming_request(
+                        request=mock_request,
+                        url="http://test.com",
+                        headers={},
+                        payload={"model": "claude-sonnet-4"},
+                        model="claude-sonnet-4",
+                        subaccount_name="test",
+                        tid="test-123",
+                    )
+
+        assert response.body == b'{"converted":true}'
+        mock_transport.info.assert_called_once_with(
+            "RSP: tid=%s, status=200, body=%s", "test-123", '{"converted":true}'
+        )
+
     @pytest.mark.asyncio
     async def test_backend_error_returns_error_status(self):
         """Verify backend errors propagate status code."""
         mock_request = Mock(spec=Request)
         mock_request.headers = {}
         mock_request.client = Mock(host="127.0.0.1")
+        mock_request.app.state.proxy_config.log_body_max_bytes = 4096
 
         backend_result = Mock()
         backend_result.success = False
@@ -213,6 +279,7 @@ class TestNonStreamingHandler:
         mock_request = Mock(spec=Request)
         mock_request.headers = {}
         mock_request.client = Mock(host="127.0.0.1")
+        mock_request.app.state.proxy_config.log_body_max_bytes = 4096
 
         with patch(
             "routers.chat.run_in_threadpool",
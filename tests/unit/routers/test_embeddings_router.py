@@ -6,7 +6,10 @@ from unittest.mock import AsyncMock, Mock, patch
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
-from routers.embeddings import handle_embedding_request
+from routers.embeddings import (
+    _handle_embedding_service_call,
+    handle_embedding_request,
+)
 
 
 @pytest.mark.skip(reason="Tests require complex mocking of internal implementation")
@@ -138,3 +141,47 @@ class TestThreadPoolHandling:
 
             mock_threadpool.assert_called_once()
             assert callable(mock_threadpool.call_args[0][0])
+
+
+class TestRequestBodyParsing:
+    """Test parsing of the inbound request body."""
+
+    @pytest.mark.asyncio
+    async def test_empty_body_returns_400(self):
+        """Verify an empty body is reported as missing input, not a server error."""
+        mock_request = AsyncMock(spec=Request)
+        mock_request.url = Mock(path="/v1/embeddings")
+        mock_request.body = AsyncMock(return_value=b"")
+
+        response = await handle_embedding_request(mock_request)
+
+        assert response.status_code == 400
+        assert json.loads(response.body) == {"error": "Input text is required"}
+
+
+class TestEmbeddingServiceCall:
+    """Test construction of the upstream embeddings request."""
+
+    @pytest.mark.parametrize(
+        "encoding_format, expected_payload",
+        [
+            (None, {"input": "hi"}),
+            ("base64", {"input": "hi", "encoding_format": "base64"}),
+        ],
+    )
+    def test_encoding_format_forwarded(self, encoding_format, expected_payload):
+        """Verify the client's encoding_format is forwarded only when given."""
+        proxy_config = Mock()
+        proxy_config.model_to_subaccounts = {"text-embedding-3-small": ["test"]}
+
+        with patch(
+            "routers.embeddings.load_balance_url",
+            return_value=("https://host/deployments/d1/", "test", None, None),
+        ):
+            url, payload, subaccount_name = _handle_embedding_service_call(
+                proxy_config, "hi", "text-embedding-3-small", encoding_format
+            )
+
+        assert url == "https://host/deployments/d1/embeddings?api-version=2023-05-15"
+        assert payload == expected_payload
+        assert subaccount_name == "test"
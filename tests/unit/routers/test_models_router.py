@@ -0,0 +1,40 @@
+"""Unit tests for models router."""
+
+import json
+
+from routers import models
+from routers.models import _models_body
+
+
+class TestModelsBody:
+    """Test the cached /v1/models response body."""
+
+    def setup_method(self):
+        models._models_cache = None
+
+    def test_lists_configured_models(self):
+        """Verify every configured model is listed in OpenAI format."""
+        body = json.loads(_models_body({"gpt-4": ["a"], "gemini-2.5-pro": ["b"]}))
+
+        assert body["object"] == "list"
+        assert [m["id"] for m in body["data"]] == ["gpt-4", "gemini-2.5-pro"]
+        assert all(m["owned_by"] == "sap-ai-core" for m in body["data"])
+
+    def test_reuses_body_for_same_mapping(self):
+        """Verify repeated calls with the same mapping return the cached bytes."""
+        mapping = {"gpt-4": ["a"]}
+
+        assert _models_body(mapping) is _models_body(mapping)
+
+    def test_rebuilds_when_mapping_changes(self):
+        """Verify a replaced or resized mapping produces a fresh body."""
+        mapping = {"gpt-4": ["a"]}
+        first = _models_body(mapping)
+
+        mapping["gpt-4.1"] = ["a"]
+        resized = json.loads(_models_body(mapping))
+        replaced = json.loads(_models_body({"claude": ["a"]}))
+
+        assert first != _models_body(mapping)
+        assert [m["id"] for m in resized["data"]] == ["gpt-4", "gpt-4.1"]
+        assert [m["id"] for m in replaced["data"]] == ["claude"]
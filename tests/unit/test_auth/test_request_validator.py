@@ -49,6 +49,14 @@ class TestRequestValidator:
 
         assert validator.validate(mock_request) is False
 
+    def test_validate_uses_pre_extracted_token(self, validator):
+        """Test that a token passed in is used without re-reading headers."""
+        request = Mock()
+        request.headers = Mock()
+
+        assert validator.validate(request, "Bearer valid_token_1") is True
+        request.headers.get.assert_not_called()
+
     def test_validate_no_headers(self, validator, mock_request):
         """Test validation with no authentication headers."""
         mock_request.headers = {}
@@ -61,14 +69,22 @@ class TestRequestValidator:
 
         assert validator_no_tokens.validate(mock_request) is True
 
-    def test_validate_partial_token_match(self, validator, mock_request):
-        """Test validation with partial token match."""
+    def test_validate_partial_token_match(self, mock_request):
+        """Test that partial token matches need the legacy substring flag."""
         mock_request.headers = {"Authorization": "Bearer valid_token_1_extra"}
 
-        # Should fail because "valid_token_1" is contained in "valid_token_1_extra"
-        # but we want exact matching behavior
+        # "valid_token_1" is contained in "valid_token_1_extra"
+        validator = RequestValidator(
+            ["valid_token_1", "valid_token_2"], allow_substring_match=True
+        )
         assert validator.validate(mock_request) is True
 
+    def test_validate_partial_token_rejected_by_default(self, validator, mock_request):
+        """Test that a token merely containing a valid one is rejected."""
+        mock_request.headers = {"Authorization": "Bearer valid_token_1_extra"}
+
+        assert validator.validate(mock_request) is False
+
     def test_validate_bearer_token_without_bearer(self, validator, mock_request):
         """Test validation with token that doesn't have Bearer prefix."""
         mock_request.headers = {"Authorization": "valid_token_1"}
@@ -114,3 +130,36 @@ class TestRequestValidator:
 
         token = validator._extract_token(mock_request)
         assert token == "Bearer auth_token"
+
+
+class TestSharedValidator:
+    """Test cases for the validator shared by verify_request_token."""
+
+    def test_reused_for_same_token_list(self):
+        """Test that one validator serves every request for a token list."""
+        from auth.request_validator import _get_validator
+
+        tokens = ["valid_token_1"]
+
+        assert _get_validator(tokens) is _get_validator(tokens)
+
+    def test_rebuilt_when_token_list_replaced(self):
+        """Test that replacing the configured token list takes effect."""
+        from auth.request_validator import _get_validator
+
+        first = _get_validator(["old_token"])
+        second = _get_validator(["new_token"])
+
+        assert second is not first
+        assert second.valid_tokens == ["new_token"]
+
+    def test_rebuilt_when_match_mode_changes(self):
+        """Test that toggling substring matching takes effect."""
+        from auth.request_validator import _get_validator
+
+        tokens = ["valid_token_1"]
+        exact = _get_validator(tokens)
+        legacy = _get_validator(tokens, allow_substring_match=True)
+
+        assert legacy is not exact
+        assert legacy.allow_substring_match is True
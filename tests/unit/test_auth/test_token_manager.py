@@ -3,10 +3,12 @@ Unit tests for TokenManager class.
 """
 
 import pytest
+import threading
 import time
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 from config import SubAccountConfig, ServiceKey
-from auth import TokenManager
+from auth import TokenManager, TokenRefresher
+from auth.token_manager import STOP_JOIN_TIMEOUT_SECONDS
 
 
 class TestTokenManager:
@@ -54,6 +56,15 @@ class TestTokenManager:
         token = token_manager.get_token()
         assert token == "cached_token"
 
+    def test_get_token_cached_valid_skips_lock(self, token_manager, mock_subaccount):
+        """Test that a valid cached token is returned without taking the lock."""
+        mock_subaccount.token_info.token = "cached_token"
+        mock_subaccount.token_info.expiry = time.time() + 3600
+        token_manager._lock = MagicMock()
+
+        assert token_manager.get_token() == "cached_token"
+        token_manager._lock.__enter__.assert_not_called()
+
     def test_get_token_cached_expired(self, token_manager, mock_subaccount):
         """Test getting new token when cached token is expired."""
         # Set up expired cached token
@@ -105,7 +116,9 @@ class TestTokenManager:
             call_args[0][0]
             == "https://test.auth.com/oauth/token?grant_type=client_credentials"
         )
-        assert "Authorization" in call_args[1]["headers"]
+        assert call_args[1]["headers"]["Authorization"] == (
+            "Basic dGVzdF9jbGllbnRfaWQ6dGVzdF9jbGllbnRfc2VjcmV0"
+        )
 
     @patch("requests.post")
     def test_fetch_new_token_empty_token(self, mock_post, token_manager):
@@ -361,6 +374,81 @@ class TestTokenManager:
         assert mock_subaccount.token_info.token == ""
         assert mock_subaccount.token_info.expiry == 0.0
 
+    def test_get_bearer_header_reuses_header_until_token_changes(
+        self, token_manager, mock_subaccount
+    ):
+        """Test that the bearer header is rebuilt only on token change."""
+        mock_subaccount.token_info.token = "cached_token"
+        mock_subaccount.token_info.expiry = time.time() + 3600
+
+        first = token_manager.get_bearer_header()
+        assert first == "Bearer cached_token"
+        assert token_manager.get_bearer_header() is first
+
+        mock_subaccount.token_info.token = "rotated_token"
+        assert token_manager.get_bearer_header() == "Bearer rotated_token"
+
+    def test_refresh_if_expiring_keeps_fresh_token(
+        self, token_manager, mock_subaccount
+    ):
+        """Test that a token outside the refresh margin is kept."""
+        mock_subaccount.token_info.token = "cached_token"
+        mock_subaccount.token_info.expiry = time.time() + 3600
+
+        with patch.object(token_manager, "_fetch_new_token") as mock_fetch:
+            assert token_manager.refresh_if_expiring(margin=600) is False
+        mock_fetch.assert_not_called()
+
+    def test_refresh_if_expiring_fetches_near_expiry(
+        self, token_manager, mock_subaccount
+    ):
+        """Test that a token inside the refresh margin is fetched again."""
+        mock_subaccount.token_info.token = "cached_token"
+        mock_subaccount.token_info.expiry = time.time() + 300
+
+        with patch.object(token_manager, "_fetch_new_token") as mock_fetch:
+            assert token_manager.refresh_if_expiring(margin=600) is True
+        mock_fetch.assert_called_once()
+
+    def test_token_refresher_refreshes_all_and_survives_errors(self):
+        """Test that one failing refresh does not stop the others."""
+        failing = Mock()
+        failing.refresh_if_expiring.side_effect = ConnectionError("HTTP Error 500")
+        healthy = Mock()
+
+        refresher = TokenRefresher({"a": failing, "b": healthy}, margin=600)
+        refresher.refresh_all()
+
+        failing.refresh_if_expiring.assert_called_once_with(600)
+        healthy.refresh_if_expiring.assert_called_once_with(600)
+
+    def test_token_refresher_start_stop(self):
+        """Test that the refresher primes tokens on start and stops cleanly."""
+        manager = Mock()
+        refresher = TokenRefresher({"a": manager}, interval=60)
+
+        refresher.start()
+        refresher.stop()
+
+        manager.refresh_if_expiring.assert_called_once()
+        assert refresher._thread is None
+
+    def test_token_refresher_stop_does_not_wait_for_slow_refresh(self):
+        """Test that stop() returns promptly while a refresh is still running."""
+        release = threading.Event()
+        manager = Mock()
+        manager.refresh_if_expiring.side_effect = lambda margin: release.wait(10)
+        refresher = TokenRefresher({"a": manager}, interval=60)
+
+        refresher.start()
+        started = time.monotonic()
+        refresher.stop()
+        elapsed = time.monotonic() - started
+        release.set()
+
+        assert elapsed < STOP_JOIN_TIMEOUT_SECONDS + 1
+        assert refresher._thread is None
+
 
 class TestBackwardCompatibility:
     """Test backward compatibility functions."""
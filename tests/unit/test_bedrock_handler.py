@@ -0,0 +1,19 @@
+"""
+Unit tests for handlers.bedrock_handler module.
+"""
+
+from handlers.bedrock_handler import read_response_body_stream
+
+
+class TestReadResponseBodyStream:
+    """Test cases for read_response_body_stream."""
+
+    def test_joins_chunks_into_bytes(self) -> None:
+        """Test that byte and non-byte events are joined into one bytes body."""
+        events = [b'{"type": ', "\"message\"", '}'.encode()]
+
+        assert read_response_body_stream(iter(events)) == b'{"type": "message"}'
+
+    def test_empty_stream(self) -> None:
+        """Test that an empty stream yields an empty body."""
+        assert read_response_body_stream(iter([])) == b""
@@ -65,6 +65,14 @@ class TestCLIArguments:
         
         assert args.port == 9000
 
+    def test_workers_argument(self, monkeypatch):
+        """Test worker process count argument and its default."""
+        monkeypatch.setattr(sys, 'argv', ['proxy_server.py'])
+        assert parse_arguments().workers == 1
+
+        monkeypatch.setattr(sys, 'argv', ['proxy_server.py', '-w', '4'])
+        assert parse_arguments().workers == 4
+
     def test_combined_arguments(self, monkeypatch):
         """Test multiple arguments together."""
         monkeypatch.setattr(sys, 'argv', [
@@ -9,13 +9,20 @@ Tests cover:
 - Model fallback logic
 """
 
+import sys
+
 import pytest
 from unittest.mock import MagicMock
 
 from load_balancer import (
+    begin_request,
+    end_request,
+    get_counters,
     resolve_model_name,
     load_balance_url,
     reset_counters,
+    track_request,
+    _in_flight,
     _load_balance_counters,
 )
 from config import ProxyConfig, SubAccountConfig
@@ -122,6 +129,15 @@ class TestResolveModelName:
 
         assert result == "gpt-4.1"
 
+    def test_exact_match_returns_interned_name(self, mock_proxy_config):
+        """Test that the resolved name is the interned config key."""
+        mock_proxy_config.model_to_subaccounts = {"gpt-4": ["account1"]}
+        requested = "".join(["gpt", "-4"])
+
+        result = resolve_model_name(requested, mock_proxy_config)
+
+        assert result is sys.intern("gpt-4")
+
     def test_no_fallback_returns_none(self, mock_proxy_config):
         """Test that None is returned when no fallback exists."""
         mock_proxy_config.model_to_subaccounts = {}
@@ -201,6 +217,60 @@ class TestLoadBalanceUrl:
         url4, _, _, _ = load_balance_url("gpt-4", mock_proxy_config)
         assert url4 == "https://url1.com"
 
+    def test_round_robin_is_even_under_concurrency(
+        self, mock_proxy_config, sample_subaccount
+    ):
+        """Test that concurrent callers still get a strictly even distribution."""
+        from collections import Counter
+        from concurrent.futures import ThreadPoolExecutor
+
+        sub1 = sample_subaccount("account1", "rg1", {"gpt-4": ["https://url1.com"]})
+        sub2 = sample_subaccount("account2", "rg2", {"gpt-4": ["https://url2.com"]})
+        mock_proxy_config.model_to_subaccounts = {"gpt-4": ["account1", "account2"]}
+        mock_proxy_config.subaccounts = {"account1": sub1, "account2": sub2}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(
+                    lambda _: load_balance_url("gpt-4", mock_proxy_config)[1],
+                    range(400),
+                )
+            )
+
+        assert Counter(results) == {"account1": 200, "account2": 200}
+
+    def test_least_loaded_subaccount_is_preferred(
+        self, mock_proxy_config, sample_subaccount
+    ):
+        """Test that a subaccount with fewer in-flight requests is chosen."""
+        sub1 = sample_subaccount("account1", "rg1", {"gpt-4": ["https://url1.com"]})
+        sub2 = sample_subaccount("account2", "rg2", {"gpt-4": ["https://url2.com"]})
+        mock_proxy_config.model_to_subaccounts = {"gpt-4": ["account1", "account2"]}
+        mock_proxy_config.subaccounts = {"account1": sub1, "account2": sub2}
+
+        begin_request("account1")
+        try:
+            names = [load_balance_url("gpt-4", mock_proxy_config)[1] for _ in range(3)]
+        finally:
+            end_request("account1")
+
+        assert names == ["account2", "account2", "account2"]
+
+        # Once idle again, selection rotates as plain round-robin
+        _, name, _, _ = load_balance_url("gpt-4", mock_proxy_config)
+        assert name == "account2"
+        _, name, _, _ = load_balance_url("gpt-4", mock_proxy_config)
+        assert name == "account1"
+
+    def test_track_request_releases_on_error(self):
+        """Test that track_request ends the request when the block raises."""
+        with pytest.raises(RuntimeError):
+            with track_request("account1"):
+                assert _in_flight["account1"] == 1
+                raise RuntimeError("backend failed")
+
+        assert _in_flight["account1"] == 0
+
     def test_model_not_found_raises_error(self, mock_proxy_config):
         """Test that ValueError is raised when model is not found."""
         mock_proxy_config.model_to_subaccounts = {}
@@ -291,6 +361,23 @@ class TestResetCounters:
         reset_counters()
         assert _load_balance_counters == {}
 
+    def test_get_counters_returns_int_snapshot(
+        self, mock_proxy_config, sample_subaccount
+    ):
+        """Test that get_counters reports values without advancing them."""
+        subaccount = sample_subaccount(
+            "account1", "default", {"gpt-4": ["https://url1.com"]}
+        )
+        mock_proxy_config.model_to_subaccounts = {"gpt-4": ["account1"]}
+        mock_proxy_config.subaccounts = {"account1": subaccount}
+        load_balance_url("gpt-4", mock_proxy_config)
+        load_balance_url("gpt-4", mock_proxy_config)
+
+        counters = get_counters()
+
+        assert counters["gpt-4"] == 2
+        assert get_counters() == counters
+
 
 # ============================================================================
 # TEST edge cases
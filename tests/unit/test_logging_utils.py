@@ -7,7 +7,7 @@ import os
 import tempfile
 import time
 from typing import Generator
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 from utils import logging_utils
 
@@ -196,3 +196,84 @@ class TestLoggingUtils:
             logging_utils.init_logging(debug=True)
             # Second call should not fail
             logging_utils.init_logging(debug=True)
+
+    def test_lazy_json_serializes_only_when_formatted(self) -> None:
+        """Test that LazyJson defers serialization to str()."""
+        with patch("utils.logging_utils.orjson.dumps", return_value=b"{}") as dumps:
+            lazy = logging_utils.LazyJson({"a": 1})
+            dumps.assert_not_called()
+            assert str(lazy) == "{}"
+            dumps.assert_called_once()
+
+    def test_lazy_json_truncates_to_limit(self) -> None:
+        """Test that LazyJson honours the character limit."""
+        assert str(logging_utils.LazyJson({"key": "value"}, limit=5)) == '{"key'
+
+    def test_lazy_json_pretty_prints_with_indent(self) -> None:
+        """Test that LazyJson pretty-prints when an indent is given."""
+        assert str(logging_utils.LazyJson({"a": 1}, indent=2)) == '{\n  "a": 1\n}'
+
+    def test_lazy_json_is_compact_by_default(self) -> None:
+        """Test that LazyJson emits compact JSON, including non-str keys."""
+        assert str(logging_utils.LazyJson({"a": [1, 2], 3: "é"})) == (
+            '{"a":[1,2],"3":"é"}'
+        )
+
+    def test_lazy_json_falls_back_for_unsupported_values(self) -> None:
+        """Test that values orjson rejects are still logged via json."""
+        assert str(logging_utils.LazyJson({"n": 2**70})) == '{"n": %d}' % 2**70
+
+    def test_truncate_user_id(self) -> None:
+        """Test that only identifiers longer than the limit are shortened."""
+        assert logging_utils.truncate_user_id("short") == "short"
+        assert logging_utils.truncate_user_id("x" * 20) == "x" * 20
+        assert logging_utils.truncate_user_id("Bearer " + "y" * 30) == (
+            "Bearer " + "y" * 13 + "..."
+        )
+
+    def test_truncate_body(self) -> None:
+        """Test that bodies over the limit are cut and marked as truncated."""
+        assert logging_utils.truncate_body(b'{"a": 1}', 0) == '{"a": 1}'
+        assert logging_utils.truncate_body(b'{"a": 1}', 8) == '{"a": 1}'
+        assert logging_utils.truncate_body(b'{"a": 1}', 4) == '{"a"...[truncated]'
+
+    def test_client_log_identity(self) -> None:
+        """Test the (user id, IP) pair used in usage logs."""
+        request = Mock()
+        request.headers = {"Authorization": "Bearer " + "z" * 30}
+        request.client.host = "10.0.0.1"
+        assert logging_utils.client_log_identity(request) == (
+            "Bearer " + "z" * 13 + "...",
+            "10.0.0.1",
+        )
+
+        request.headers = {}
+        request.client = None
+        assert logging_utils.client_log_identity(request) == (
+            "unknown",
+            "unknown_ip",
+        )
+        assert logging_utils.client_log_identity(None) == ("unknown", "unknown_ip")
+
+    def test_new_trace_id_is_unique(self) -> None:
+        """Test that consecutive trace ids differ and share the process prefix."""
+        first = logging_utils.new_trace_id()
+        second = logging_utils.new_trace_id()
+
+        assert first != second
+        assert first.rsplit("-", 1)[0] == second.rsplit("-", 1)[0]
+
+    def test_traceback_allowed_once_per_type_per_interval(self) -> None:
+        """Test that repeated errors of one type only get one traceback."""
+        logging_utils._traceback_last_logged.clear()
+
+        assert logging_utils.traceback_allowed(KeyError("a")) is True
+        assert logging_utils.traceback_allowed(KeyError("b")) is False
+        assert logging_utils.traceback_allowed(OSError("c")) is True
+
+        with patch.object(
+            logging_utils.time,
+            "monotonic",
+            return_value=time.monotonic() + logging_utils.TRACEBACK_INTERVAL_SECONDS,
+        ):
+            assert logging_utils.traceback_allowed(KeyError("d")) is True
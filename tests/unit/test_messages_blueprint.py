@@ -1,9 +1,13 @@
 """Tests for the /v1/messages router (FastAPI)."""
 
+import json
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch, Mock
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
+from tenacity import RetryError
 
 from routers.messages import router
 
@@ -24,6 +28,9 @@ def _make_app(proxy_config=None, proxy_context=None):
 def mock_proxy_state():
     """Return a (config, context) pair suitable for app state injection."""
     mock_config = MagicMock()
+    mock_config.log_body_max_bytes = 4096
+    mock_config.stream_flush_bytes = 256
+    mock_config.stream_flush_ms = 60_000
     mock_config.secret_authentication_tokens = []
     mock_ctx = MagicMock()
     return mock_config, mock_ctx
@@ -47,12 +54,222 @@ def test_missing_model_returns_404(mock_load_balance, mock_validate, client):
     assert "not available" in data["error"]["message"]
 
 
+@patch("routers.messages.verify_request_token", return_value=True)
+@patch("routers.messages.load_balance_url")
+def test_non_claude_model_returns_400(mock_load_balance, mock_validate, client):
+    mock_load_balance.return_value = ("https://u", "sub", "rg", "gpt-4.1")
+
+    response = client.post("/v1/messages", json={"model": "gpt-4.1"})
+
+    assert response.status_code == 400
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {
+        "type": "error",
+        "error": {
+            "type": "invalid_request_error",
+            "message": "Only Claude models are supported by this endpoint",
+        },
+    }
+
+
+@patch("routers.messages.verify_request_token", return_value=True)
+@patch("routers.messages.extract_deployment_id", return_value="deployment-id")
+@patch("routers.messages.get_bedrock_client")
+@patch("routers.messages.load_balance_url")
+def test_bedrock_body_drops_routing_and_unsupported_fields(
+    mock_load_balance, mock_get_client, mock_extract_id, mock_validate, client
+):
+    mock_load_balance.return_value = (
+        "https://test.url/deployment-id",
+        "test_subaccount",
+        "test_resource_group",
+        "anthropic--claude-4.5-sonnet",
+    )
+    ok_response = {"ResponseMetadata": {"HTTPStatusCode": 200}, "body": MagicMock()}
+
+    with (
+        patch(
+            "routers.messages.invoke_bedrock_non_streaming", return_value=ok_response
+        ) as mock_invoke,
+        patch(
+            "routers.messages.read_response_body_stream",
+            return_value=b'{"type": "message"}',
+        ),
+    ):
+        response = client.post(
+            "/v1/messages",
+            json={
+                "model": "anthropic--claude-4.5-sonnet",
+                "stream": False,
+                "metadata": {"user_id": "u"},
+                "temperature": 0.5,
+                "messages": [{"role": "user", "content": "Hello"}],
+                "tools": [
+                    {"name": "a", "input_examples": [{}]},
+                    {"name": "b", "custom": {"input_examples": [{}]}},
+                ],
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.content == b'{"type": "message"}'
+    assert response.headers["content-type"] == "application/json"
+    assert isinstance(mock_invoke.call_args[0][1], bytes)
+    sent = json.loads(mock_invoke.call_args[0][1])
+    assert sent == {
+        "temperature": 0.5,
+        "messages": [{"role": "user", "content": "Hello"}],
+        "tools": [{"name": "a"}, {"name": "b", "custom": {}}],
+        "anthropic_version": "bedrock-2023-05-31",
+    }
+
+
+@patch("routers.messages.verify_request_token", return_value=True)
+@patch("routers.messages.extract_deployment_id", return_value="deployment-id")
+@patch("routers.messages.get_bedrock_client")
+@patch("routers.messages.load_balance_url")
+def test_bedrock_calls_run_off_the_event_loop(
+    mock_load_balance, mock_get_client, mock_extract_id, mock_validate, client
+):
+    mock_load_balance.return_value = (
+        "https://test.url/deployment-id",
+        "test_subaccount",
+        "test_resource_group",
+        "anthropic--claude-4.5-sonnet",
+    )
+    threads = {}
+
+    def record(name, value):
+        def side_effect(*args, **kwargs):
+            threads[name] = threading.get_ident()
+            return value
+
+        return side_effect
+
+    mock_get_client.side_effect = record("handler", MagicMock())
+    ok_response = {"ResponseMetadata": {"HTTPStatusCode": 200}, "body": MagicMock()}
+
+    with (
+        patch(
+            "routers.messages.invoke_bedrock_non_streaming",
+            side_effect=record("invoke", ok_response),
+        ),
+        patch(
+            "routers.messages.read_response_body_stream",
+            side_effect=record("read", b'{"type": "message"}'),
+        ),
+    ):
+        response = client.post(
+            "/v1/messages",
+            json={
+                "model": "anthropic--claude-4.5-sonnet",
+                "stream": False,
+                "messages": [{"role": "user", "content": "Hello"}],
+            },
+        )
+
+    assert response.status_code == 200
+    assert threads["invoke"] != threads["handler"]
+    assert threads["read"] != threads["handler"]
+
+
+@patch("routers.messages.verify_request_token", return_value=True)
+@patch("routers.messages.extract_deployment_id", return_value="deployment-id")
+@patch("routers.messages.get_bedrock_client")
+@patch("routers.messages.load_balance_url")
+def test_bedrock_body_drops_empty_text_blocks(
+    mock_load_balance, mock_get_client, mock_extract_id, mock_validate, client
+):
+    mock_load_balance.return_value = (
+        "https://test.url/deployment-id",
+        "test_subaccount",
+        "test_resource_group",
+        "anthropic--claude-4.5-sonnet",
+    )
+    ok_response = {"ResponseMetadata": {"HTTPStatusCode": 200}, "body": MagicMock()}
+    content = [
+        {"type": "text", "text": ""},
+        {"type": "text", "text": "Hello"},
+        {"type": "text"},
+        {"type": "image", "source": {}},
+    ]
+
+    with (
+        patch(
+            "routers.messages.invoke_bedrock_non_streaming", return_value=ok_response
+        ) as mock_invoke,
+        patch(
+            "routers.messages.read_response_body_stream",
+            return_value=b'{"type": "message"}',
+        ),
+    ):
+        client.post(
+            "/v1/messages",
+            json={
+                "model": "anthropic--claude-4.5-sonnet",
+                "stream": False,
+                "messages": [{"role": "user", "content": content}],
+            },
+        )
+
+    sent = json.loads(mock_invoke.call_args[0][1])
+    assert sent["messages"][0]["content"] == [
+        {"type": "text", "text": "Hello"},
+        {"type": "image", "source": {}},
+    ]
+
+
+@patch("routers.messages.verify_request_token", return_value=True)
+@patch("routers.messages.extract_deployment_id", return_value="deployment-id")
+@patch("routers.messages.get_bedrock_client")
+@patch("routers.messages.load_balance_url")
+def test_bedrock_body_adjusts_thinking_config(
+    mock_load_balance, mock_get_client, mock_extract_id, mock_validate, client
+):
+    mock_load_balance.return_value = (
+        "https://test.url/deployment-id",
+        "test_subaccount",
+        "test_resource_group",
+        "anthropic--claude-4.5-sonnet",
+    )
+    ok_response = {"ResponseMetadata": {"HTTPStatusCode": 200}, "body": MagicMock()}
+
+    with (
+        patch(
+            "routers.messages.invoke_bedrock_non_streaming", return_value=ok_response
+        ) as mock_invoke,
+        patch(
+            "routers.messages.read_response_body_stream",
+            return_value=b'{"type": "message"}',
+        ),
+    ):
+        client.post(
+            "/v1/messages",
+            json={
+                "model": "anthropic--claude-4.5-sonnet",
+                "stream": False,
+                "max_tokens": 500,
+                "thinking": {
+                    "type": "enabled",
+                    "budget_tokens": 1000,
+                    "context_management": {},
+                },
+                "messages": [{"role": "user", "content": "Hello"}],
+            },
+        )
+
+    sent = json.loads(mock_invoke.call_args[0][1])
+    assert sent["thinking"] == {"type": "enabled", "budget_tokens": 1000}
+    assert sent["max_tokens"] == 1001
+
+
 class TestSDKReAuthenticationRetry:
     """Test re-authentication retry logic for SDK path (proxy_claude_request)."""
 
     @pytest.fixture
     def mock_sdk_setup(self):
         mock_config = MagicMock()
+        mock_config.log_body_max_bytes = 4096
         mock_ctx = MagicMock()
 
         mock_subaccount = MagicMock()
@@ -109,7 +326,7 @@ class TestSDKReAuthenticationRetry:
         with patch("routers.messages.invoke_bedrock_non_streaming") as mock_invoke:
             with patch(
                 "routers.messages.read_response_body_stream",
-                return_value='{"content": [{"text": "Hello"}], "type": "message"}',
+                return_value=b'{"content": [{"text": "Hello"}], "type": "message"}',
             ):
                 mock_invoke.side_effect = [first_response, second_response]
 
@@ -166,7 +383,7 @@ class TestSDKReAuthenticationRetry:
         with patch("routers.messages.invoke_bedrock_non_streaming") as mock_invoke:
             with patch(
                 "routers.messages.read_response_body_stream",
-                return_value='{"content": [{"text": "Hello"}], "type": "message"}',
+                return_value=b'{"content": [{"text": "Hello"}], "type": "message"}',
             ):
                 mock_invoke.side_effect = [first_response, second_response]
 
@@ -232,3 +449,96 @@ class TestSDKReAuthenticationRetry:
             assert response.status_code == 500
             assert not mock_invalidate_client.called
             assert mock_invoke.call_count == 1
+
+
+@patch("routers.messages.verify_request_token", return_value=True)
+@patch("routers.messages.extract_deployment_id", return_value="deployment-id")
+@patch("routers.messages.get_bedrock_client")
+@patch("routers.messages.load_balance_url")
+@pytest.mark.parametrize(
+    "stream, invoke_name",
+    [
+        (False, "invoke_bedrock_non_streaming"),
+        (True, "invoke_bedrock_streaming"),
+    ],
+)
+def test_exhausted_rate_limit_retries_return_429(
+    mock_load_balance,
+    mock_get_client,
+    mock_extract_id,
+    mock_validate,
+    client,
+    stream,
+    invoke_name,
+):
+    mock_load_balance.return_value = (
+        "https://test.url/deployment-id",
+        "test_subaccount",
+        "test_resource_group",
+        "anthropic--claude-4.5-sonnet",
+    )
+
+    with patch(
+        f"routers.messages.{invoke_name}",
+        side_effect=RetryError(MagicMock()),
+    ):
+        response = client.post(
+            "/v1/messages",
+            json={
+                "model": "anthropic--claude-4.5-sonnet",
+                "stream": stream,
+                "messages": [{"role": "user", "content": "Hello"}],
+            },
+        )
+
+    assert response.status_code == 429
+    assert response.json()["error"]["type"] == "rate_limit_error"
+
+
+@patch("routers.messages.verify_request_token", return_value=True)
+@patch("routers.messages.extract_deployment_id", return_value="deployment-id")
+@patch("routers.messages.get_bedrock_client")
+@patch("routers.messages.load_balance_url")
+def test_streaming_text_deltas_are_coalesced(
+    mock_load_balance, mock_get_client, mock_extract_id, mock_validate, client
+):
+    mock_load_balance.return_value = (
+        "https://test.url/deployment-id",
+        "test_subaccount",
+        "test_resource_group",
+        "anthropic--claude-4.5-sonnet",
+    )
+    raw_chunks = [
+        b'{"type":"message_start","message":{"id":"msg_1"}}',
+        *(
+            b'{"type":"content_block_delta","index":0,'
+            b'"delta":{"type":"text_delta","text":"%s"}}' % c
+            for c in (b"Hel", b"lo")
+        ),
+        b'{"type":"message_stop"}',
+    ]
+    stream_response = {
+        "ResponseMetadata": {"HTTPStatusCode": 200},
+        "body": [{"chunk": {"bytes": c}} for c in raw_chunks],
+    }
+
+    with patch(
+        "routers.messages.invoke_bedrock_streaming", return_value=stream_response
+    ):
+        response = client.post(
+            "/v1/messages",
+            json={
+                "model": "anthropic--claude-4.5-sonnet",
+                "messages": [{"role": "user", "content": "Hello"}],
+            },
+        )
+
+    assert response.status_code == 200
+    frames = [f for f in response.text.split("\n\n") if f]
+    deltas = [
+        json.loads(f.split("\ndata: ")[1])
+        for f in frames
+        if f.startswith("event: content_block_delta")
+    ]
+    assert [d["delta"]["text"] for d in deltas] == ["Hello"]
+    assert frames[-1] == "data: [DONE]"
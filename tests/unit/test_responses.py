@@ -0,0 +1,56 @@
+"""
+Unit tests for utils.responses module.
+"""
+
+import json
+
+from fastapi.responses import JSONResponse
+
+from handlers.streaming_handler import BackendRequestResult
+from utils.responses import OrjsonResponse, backend_error_response
+
+
+class TestOrjsonResponse:
+    """Test cases for OrjsonResponse."""
+
+    def test_renders_same_json_as_json_response(self) -> None:
+        """Test that the body decodes to the same object as JSONResponse."""
+        content = {"id": "chatcmpl-1", "choices": [{"text": "héllo 🙂"}], "n": 1.5}
+
+        response = OrjsonResponse(content, status_code=201)
+
+        assert isinstance(response, JSONResponse)
+        assert response.status_code == 201
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == json.loads(JSONResponse(content).body)
+
+
+class TestBackendErrorResponse:
+    """Test cases for backend_error_response."""
+
+    def test_forwards_backend_body_and_retry_after_on_429(self) -> None:
+        """Test that a 429 keeps the backend body and Retry-After header."""
+        result = BackendRequestResult(
+            success=False,
+            response_data={"error": "slow down"},
+            status_code=429,
+            headers={"Retry-After": "7", "Content-Type": "application/json"},
+        )
+
+        response = backend_error_response(result)
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "7"
+        assert json.loads(response.body) == {"error": "slow down"}
+
+    def test_falls_back_to_error_message(self) -> None:
+        """Test that a failure without a JSON body reports the error message."""
+        result = BackendRequestResult(
+            success=False, error_message="Connection timed out", status_code=500
+        )
+
+        response = backend_error_response(result)
+
+        assert response.status_code == 500
+        assert "retry-after" not in response.headers
+        assert json.loads(response.body) == {"error": "Connection timed out"}
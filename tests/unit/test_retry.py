@@ -0,0 +1,27 @@
+"""
+Unit tests for utils.retry module.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from utils.retry import RETRY_MAX_WAIT, RETRY_MIN_WAIT, RETRY_WAIT
+
+
+class TestRetryWait:
+    """Tests for the jittered exponential backoff."""
+
+    @pytest.mark.parametrize("attempt_number", [1, 2, 3, 4, 10])
+    def test_wait_stays_within_bounds(self, attempt_number: int) -> None:
+        """Test that every wait falls between the configured min and max."""
+        retry_state = Mock(attempt_number=attempt_number)
+
+        for _ in range(50):
+            assert RETRY_MIN_WAIT <= RETRY_WAIT(retry_state) <= RETRY_MAX_WAIT
+
+    def test_wait_is_jittered(self) -> None:
+        """Test that repeated waits for the same attempt are not identical."""
+        retry_state = Mock(attempt_number=4)
+
+        assert len({RETRY_WAIT(retry_state) for _ in range(20)}) > 1
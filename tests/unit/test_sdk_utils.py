@@ -2,6 +2,7 @@ import pytest
 import threading
 from unittest.mock import Mock, patch, MagicMock
 import requests
+from urllib.parse import urlparse
 from diskcache import Cache
 
 from utils.sdk_utils import (
@@ -472,6 +473,18 @@ def test_extract_deployment_id_with_query_and_fragment():
     assert "#" not in deployment_id
 
 
+def test_extract_deployment_id_parses_each_url_once():
+    """Test that repeated lookups of the same URL are served from the cache."""
+    url = "https://api.ai.com/v2/inference/deployments/dcache1"
+    extract_deployment_id.cache_clear()
+
+    with patch("utils.sdk_utils.urlparse", wraps=urlparse) as mock_urlparse:
+        assert extract_deployment_id(url) == "dcache1"
+        assert extract_deployment_id(url) == "dcache1"
+
+    mock_urlparse.assert_called_once_with(url)
+
+
 @patch("utils.sdk_utils.AIAPIV2Client")
 def test_fetch_all_deployments_singleton(mock_client_cls, mock_service_key):
     """Test that AIAPIV2Client is reused across multiple calls."""
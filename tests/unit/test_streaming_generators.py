@@ -2,6 +2,8 @@
 
 import asyncio
 import json
+import threading
+import time
 import pytest
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from fastapi import Request
@@ -48,9 +50,9 @@ class TestGenerateStreamingResponseLifecycle:
             ):
                 chunks.append(chunk)
 
-            # Verify cleanup was called
-            mock_client.__aexit__.assert_called_once()
+            # The stream is closed; the shared client stays open for reuse
             mock_stream.__aexit__.assert_called_once()
+            mock_client.__aexit__.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_generator_cleanup_on_early_break(self):
@@ -95,8 +97,9 @@ class TestGenerateStreamingResponseLifecycle:
             # Give cleanup a chance to run
             await asyncio.sleep(0.1)
 
-            # Verify cleanup was called even with early break
-            mock_client.__aexit__.assert_called_once()
+            # Verify the stream was closed even with early break
+            mock_stream.__aexit__.assert_called_once()
+            mock_client.__aexit__.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_generator_cleanup_on_exception(self):
@@ -135,9 +138,9 @@ class TestGenerateStreamingResponseLifecycle:
             ):
                 chunks.append(chunk)
 
-            # Verify cleanup was called even with exception
-            mock_client.__aexit__.assert_called_once()
+            # Verify the stream was closed even with exception
             mock_stream.__aexit__.assert_called_once()
+            mock_client.__aexit__.assert_not_called()
 
 
 class TestHttpxExceptionHandling:
@@ -307,15 +310,17 @@ class TestConcurrentStreaming:
             mock_response.aiter_lines = Mock(side_effect=aiter_lines_impl)
             mock_response.aiter_bytes = Mock(side_effect=aiter_bytes_impl)
 
-            with patch("httpx.AsyncClient") as mock_client_class:
-                mock_client = AsyncMock()
-                mock_stream = AsyncMock()
-                mock_stream.__aenter__ = AsyncMock(return_value=mock_response)
-                mock_stream.__aexit__ = AsyncMock(return_value=False)
-                mock_client.stream = Mock(return_value=mock_stream)
-                mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                mock_client.__aexit__ = AsyncMock(return_value=False)
-                mock_client_class.return_value = mock_client
+            mock_client = AsyncMock()
+            mock_stream = AsyncMock()
+            mock_stream.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_stream.__aexit__ = AsyncMock(return_value=False)
+            mock_client.stream = Mock(return_value=mock_stream)
+
+            # Each stream gets its own mock client; all share one event loop
+            with patch(
+                "handlers.streaming_generators._get_async_stream_client",
+                return_value=mock_client,
+            ):
 
                 chunks = []
                 async for chunk in generate_streaming_response(
@@ -464,3 +469,463 @@ class TestStreamingErrorNotification:
             # Should get error event before [DONE]
             error_events = [c for c in chunks if "PROXY ERROR" in c]
             assert len(error_events) > 0, "Expected error event for parse failure"
+
+
+class TestAsyncStreamClient:
+    """Test the shared httpx.AsyncClient used by the async streaming generators."""
+
+    def test_client_reused_within_a_loop(self):
+        """One client is shared per event loop and replaced on a new loop."""
+        from handlers.streaming_generators import _get_async_stream_client
+
+        async def get_twice():
+            return _get_async_stream_client(), _get_async_stream_client()
+
+        first, again = asyncio.run(get_twice())
+        second, _ = asyncio.run(get_twice())
+
+        assert first is again
+        assert second is not first
+        assert first.timeout == httpx.Timeout(600)
+
+
+class TestIterRawLines:
+    """Test the raw byte line splitter used by the sync streaming generators."""
+
+    def test_joins_lines_split_across_chunks(self):
+        """Partial lines are buffered until the newline arrives."""
+        from handlers.streaming_generators import _iter_raw_lines
+
+        chunks = [b'data: {"a":', b" 1}\ndata: [DO", b"NE]\n"]
+        assert list(_iter_raw_lines(chunks)) == [b'data: {"a": 1}', b"data: [DONE]"]
+
+    def test_skips_blank_lines_and_strips_crlf(self):
+        """Blank SSE separators are dropped and CRLF endings are normalized."""
+        from handlers.streaming_generators import _iter_raw_lines
+
+        chunks = [b"event: ping\r\n\r\n", b"data: x\n\n", b"data: tail"]
+        assert list(_iter_raw_lines(chunks)) == [
+            b"event: ping",
+            b"data: x",
+            b"data: tail",
+        ]
+
+
+class TestSseFrame:
+    """Test the bytes SSE frame builder used by the Claude Messages stream."""
+
+    def test_frame_layout(self):
+        """Frames carry the event line, the JSON data line and a blank line."""
+        import orjson
+
+        from handlers.streaming_generators import _EV_CONTENT_BLOCK_DELTA, _sse
+
+        frame = _sse(_EV_CONTENT_BLOCK_DELTA, orjson.dumps({"text": "héllo"}))
+        assert frame == (
+            b"event: content_block_delta\n" b'data: {"text":"h\xc3\xa9llo"}\n\n'
+        )
+
+    def test_message_start_template_matches_serialized_payload(self):
+        """The templated message_start frame decodes to the full payload."""
+        import orjson
+
+        from handlers.streaming_generators import _message_start_frame
+
+        frame = _message_start_frame('claude-"4"')
+        event_line, data_line, _, _ = frame.split(b"\n")
+        assert event_line == b"event: message_start"
+        payload = orjson.loads(data_line[len(b"data: ") :])
+        assert payload["message"]["id"].startswith("msg_")
+        assert payload == {
+            "type": "message_start",
+            "message": {
+                "id": payload["message"]["id"],
+                "type": "message",
+                "role": "assistant",
+                "content": [],
+                "model": 'claude-"4"',
+                "stop_reason": None,
+                "stop_sequence": None,
+                "usage": {"input_tokens": 0, "output_tokens": 0},
+            },
+        }
+
+    def test_generated_ids_are_unique(self):
+        """Message ids come from a monotonic counter and never repeat."""
+        from handlers.streaming_generators import _next_id
+
+        ids = {_next_id() for _ in range(1000)}
+        assert len(ids) == 1000
+
+    def test_id_prefix_includes_pid(self):
+        """Worker processes started together still get distinct id prefixes."""
+        import os
+
+        from handlers.streaming_generators import _ID_PREFIX
+
+        assert _ID_PREFIX.endswith(f"_{os.getpid():x}")
+
+
+def _mock_async_client_class(mock_client_class, lines):
+    """Wire a patched httpx.AsyncClient class to stream the given SSE lines."""
+
+    async def mock_lines():
+        for line in lines:
+            yield line
+
+    mock_response = AsyncMock()
+    mock_response.status_code = 200
+    mock_response.raise_for_status = Mock()
+    mock_response.aiter_lines = Mock(return_value=mock_lines())
+
+    mock_client = AsyncMock()
+    mock_stream = AsyncMock()
+    mock_stream.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_stream.__aexit__ = AsyncMock()
+    mock_client.stream = Mock(return_value=mock_stream)
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock()
+    mock_client_class.return_value = mock_client
+
+
+async def _collect_claude_events(model, lines, **kwargs):
+    from handlers.streaming_generators import generate_claude_streaming_response
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        _mock_async_client_class(mock_client_class, lines)
+        frames = [
+            frame
+            async for frame in generate_claude_streaming_response(
+                url="http://test.com",
+                headers={},
+                payload={},
+                model=model,
+                subaccount_name="test",
+                **kwargs,
+            )
+        ]
+
+    events = []
+    for frame in frames:
+        event_line, data_line = frame.decode("utf-8").strip().split("\n")
+        events.append((event_line[len("event: ") :], json.loads(data_line[6:])))
+    return events
+
+
+class TestGenerateClaudeStreamingResponse:
+    """Test Claude Messages API streaming for Claude and converted backends."""
+
+    @pytest.mark.asyncio
+    async def test_claude_backend_stream(self):
+        """Bedrock-style Claude chunks map to the full Messages event sequence."""
+        events = await _collect_claude_events(
+            "anthropic--claude-4-sonnet",
+            [
+                'data: {"contentBlockDelta": {"delta": {"text": "Hel"}}}',
+                'data: {"contentBlockDelta": {"delta": {"text": "lo"}}}',
+                'data: {"contentBlockStop": {"contentBlockIndex": 0}}',
+                'data: {"messageStop": {"stopReason": "max_tokens"}}',
+                'data: {"metadata": {"usage": {"outputTokens": 7}}}',
+            ],
+        )
+
+        assert [name for name, _ in events] == [
+            "message_start",
+            "content_block_start",
+            "content_block_delta",
+            "content_block_delta",
+            "content_block_stop",
+            "message_delta",
+            "message_stop",
+        ]
+        assert events[2][1]["delta"] == {"type": "text_delta", "text": "Hel"}
+        assert events[5][1]["delta"]["stop_reason"] == "max_tokens"
+        assert events[5][1]["usage"] == {"output_tokens": 7}
+
+    @pytest.mark.asyncio
+    async def test_openai_backend_stream(self):
+        """OpenAI chunks are converted and the finish reason is preserved."""
+        events = await _collect_claude_events(
+            "gpt-4.1",
+            [
+                'data: {"choices": [{"delta": {"content": "Hi"}}]}',
+                'data: {"choices": [{"delta": {}, "finish_reason": "length"}]}',
+                'data: {"choices": [{"delta": {}}], "usage": {"total_tokens": 3}}',
+                "data: [DONE]",
+            ],
+        )
+
+        assert [name for name, _ in events] == [
+            "message_start",
+            "content_block_start",
+            "content_block_delta",
+            "content_block_stop",
+            "message_delta",
+            "message_stop",
+        ]
+        assert events[0][1]["message"]["model"] == "gpt-4.1"
+        assert events[2][1]["delta"]["text"] == "Hi"
+        assert events[4][1]["delta"]["stop_reason"] == "max_tokens"
+
+    @pytest.mark.asyncio
+    async def test_gemini_backend_resolved_once_per_stream(self):
+        """The Gemini converter is chosen once, not re-detected per chunk."""
+        chunk = '{"candidates": [{"content": {"parts": [{"text": "Hi"}]}}]}'
+        with patch(
+            "handlers.streaming_generators.Detector.is_gemini_model",
+            return_value=True,
+        ) as mock_is_gemini:
+            events = await _collect_claude_events(
+                "gemini-2.5-pro", [f"data: {chunk}"] * 3
+            )
+
+        assert mock_is_gemini.call_count == 1
+        deltas = [data for name, data in events if name == "content_block_delta"]
+        assert [d["delta"]["text"] for d in deltas] == ["Hi", "Hi", "Hi"]
+
+    @pytest.mark.asyncio
+    async def test_stop_reason_extraction_skipped_once_found(self):
+        """Chunks after the finish reason are not inspected for another one."""
+        from handlers.streaming_handler import get_claude_stop_reason_from_openai_chunk
+
+        with patch(
+            "handlers.streaming_generators.get_claude_stop_reason_from_openai_chunk",
+            wraps=get_claude_stop_reason_from_openai_chunk,
+        ) as mock_get_stop:
+            events = await _collect_claude_events(
+                "gpt-4.1",
+                [
+                    'data: {"choices": [{"delta": {"content": "a"}}]}',
+                    'data: {"choices": [{"delta": {}, "finish_reason": null}]}',
+                    'data: {"choices": [{"delta": {}, "finish_reason": "stop"}]}',
+                    'data: {"choices": [{"delta": {}, "finish_reason": null}]}',
+                    'data: {"choices": [{"delta": {}}], "usage": {}}',
+                ],
+            )
+
+        # Only chunks mentioning finish_reason are inspected, up to the first hit
+        assert mock_get_stop.call_count == 2
+        assert events[-2][1]["delta"]["stop_reason"] == "end_turn"
+
+
+class TestParseClaudeBackendChunk:
+    """Test the Bedrock-style Claude chunk parser."""
+
+    def test_missing_keys_fall_back_to_defaults(self):
+        """Chunks without the optional keys map to the documented defaults."""
+        from handlers.streaming_generators import _parse_claude_backend_chunk
+
+        assert _parse_claude_backend_chunk(
+            {"contentBlockDelta": {"delta": {}}}, ""
+        ) == (
+            None,
+            None,
+            None,
+        )
+        assert _parse_claude_backend_chunk({"messageStop": {}}, "") == (
+            None,
+            "end_turn",
+            None,
+        )
+        assert _parse_claude_backend_chunk({"metadata": {}}, "") == (None, None, 0)
+        assert _parse_claude_backend_chunk({"ping": {}}, "") == (None, None, None)
+
+
+class TestClaudeTextDeltaFastPath:
+    """Parity between the raw contentBlockDelta fast path and full JSON parsing."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Hello",
+            'quote " and backslash \\ inside',
+            "newline\nand\ttab",
+            "unicode é 中文 🚀",
+            "",
+        ],
+    )
+    @pytest.mark.parametrize("with_index", [True, False])
+    def test_fast_path_matches_parsed_frame(self, text, with_index):
+        """Fast-path frames decode to the same event as the parsed path."""
+        from handlers.streaming_generators import (
+            _claude_text_delta_fast_path,
+            _parse_claude_backend_chunk,
+            _text_delta_frame,
+        )
+
+        chunk = {"contentBlockDelta": {"delta": {"text": text}}}
+        if with_index:
+            chunk["contentBlockDelta"]["contentBlockIndex"] = 0
+        for data_content in (
+            json.dumps(chunk, separators=(",", ":")),
+            json.dumps(chunk, separators=(",", ":"), ensure_ascii=False),
+        ):
+            text_json = _claude_text_delta_fast_path(data_content)
+            assert text_json is not None
+
+            delta, _, _ = _parse_claude_backend_chunk(
+                json.loads(data_content), data_content
+            )
+            if not text:
+                assert delta is None and text_json == b""
+                continue
+            fast_frame = _text_delta_frame(text_json)
+            assert json.loads(fast_frame.split(b"\ndata: ")[1]) == delta
+
+    @pytest.mark.parametrize(
+        "data_content",
+        [
+            '{"contentBlockDelta": {"delta": {"text": "spaced"}}}',
+            '{"contentBlockDelta":{"delta":{"text":"a","type":"x"}}}',
+            '{"contentBlockDelta":{"delta":{"text":"a"},"contentBlockIndex":0},"x":1}',
+            '{"messageStop":{"stopReason":"end_turn"}}',
+            "{'contentBlockDelta': {'delta': {'text': 'repr'}}}",
+        ],
+    )
+    def test_other_shapes_fall_back_to_parser(self, data_content):
+        """Anything but the exact compact shape is left to the JSON parser."""
+        from handlers.streaming_generators import _claude_text_delta_fast_path
+
+        assert _claude_text_delta_fast_path(data_content) is None
+
+
+class TestGenerateBedrockStreamingResponse:
+    """Bedrock Claude chunks are passed through as SSE frames."""
+
+    @staticmethod
+    async def _collect(events, **kwargs):
+        from handlers.streaming_generators import generate_bedrock_streaming_response
+
+        return [
+            frame
+            async for frame in generate_bedrock_streaming_response(
+                events, "tid-1", **kwargs
+            )
+        ]
+
+    @staticmethod
+    def _text_delta(text, index=0):
+        return {
+            "chunk": {
+                "bytes": (
+                    '{"type":"content_block_delta","index":%d,'
+                    '"delta":{"type":"text_delta","text":"%s"}}' % (index, text)
+                ).encode()
+            }
+        }
+
+    @staticmethod
+    def _delta_texts(frames):
+        deltas = [
+            json.loads(frame.split(b"\ndata: ")[1])
+            for frame in frames
+            if frame.startswith(b"event: content_block_delta")
+        ]
+        return [
+            (d["index"], d["delta"]["text"])
+            for d in deltas
+            if d["delta"]["type"] == "text_delta"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chunks_pass_through_unchanged(self):
+        """Chunk JSON bytes are forwarded verbatim as the data payload."""
+        raw_chunks = [
+            b'{"type":"message_start","message":{"id":"msg_1"}}',
+            b'{"type":"content_block_delta","index":0,'
+            b'"delta":{"type":"text_delta","text":"Hi \\u00e9"}}',
+            b'{"type":"ping"}',
+            b'{"type":"message_stop"}',
+        ]
+        frames = await self._collect([{"chunk": {"bytes": c}} for c in raw_chunks])
+
+        assert frames == [
+            b"event: message_start\ndata: " + raw_chunks[0] + b"\n\n",
+            b"event: content_block_delta\ndata: " + raw_chunks[1] + b"\n\n",
+            b"event: message_stop\ndata: " + raw_chunks[3] + b"\n\n",
+            b"data: [DONE]\n\n",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_type_read_from_parsed_chunk_when_not_first(self):
+        """Chunks whose type key is not first still get the right event name."""
+        raw = b'{"index":0,"type":"content_block_stop"}'
+        frames = await self._collect([{"chunk": {"bytes": raw}}])
+
+        assert frames == [b"event: content_block_stop\ndata: " + raw + b"\n\n"]
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_yields_error_event(self):
+        """An exception while iterating the stream becomes an SSE error event."""
+
+        def failing_stream():
+            raise RuntimeError("stream broke")
+            yield  # pragma: no cover
+
+        frames = await self._collect(failing_stream())
+
+        assert len(frames) == 1
+        event, data = frames[0].split(b"\ndata: ")
+        assert event == b"event: error"
+        assert json.loads(data)["error"]["message"] == "stream broke"
+
+    @pytest.mark.asyncio
+    async def test_text_deltas_are_coalesced(self):
+        """Small text deltas are merged until the flush threshold is reached."""
+        events = [self._text_delta(c) for c in "abcde"]
+        events.append({"chunk": {"bytes": b'{"type":"message_stop"}'}})
+
+        frames = await self._collect(events, flush_bytes=2, flush_ms=60_000)
+
+        assert self._delta_texts(frames) == [(0, "ab"), (0, "cd"), (0, "e")]
+        assert frames[-2].startswith(b"event: message_stop")
+
+    @pytest.mark.asyncio
+    async def test_pending_text_flushed_before_other_events(self):
+        """Pending text is sent before a new block or a non-text event."""
+        events = [
+            self._text_delta("a"),
+            self._text_delta("b", index=1),
+            {
+                "chunk": {
+                    "bytes": b'{"type":"content_block_delta","index":1,'
+                    b'"delta":{"type":"input_json_delta","partial_json":"{"}}'
+                }
+            },
+        ]
+
+        frames = await self._collect(events, flush_bytes=256, flush_ms=60_000)
+
+        assert self._delta_texts(frames) == [(0, "a"), (1, "b")]
+        assert b"input_json_delta" in frames[-1]
+
+    @pytest.mark.asyncio
+    async def test_coalescing_disabled_forwards_every_delta(self):
+        """flush_bytes=0 forwards each delta as its own frame."""
+        frames = await self._collect(
+            [self._text_delta(c) for c in "abc"], flush_bytes=0
+        )
+
+        assert self._delta_texts(frames) == [(0, "a"), (0, "b"), (0, "c")]
+
+    @pytest.mark.asyncio
+    async def test_pending_text_flushed_when_backend_pauses(self):
+        """Pending text goes out at its deadline, not when the next event arrives."""
+        second_sent = threading.Event()
+
+        def events():
+            yield self._text_delta("a")
+            time.sleep(0.2)
+            second_sent.set()
+            yield self._text_delta("b")
+
+        from handlers.streaming_generators import generate_bedrock_streaming_response
+
+        texts = []
+        async for frame in generate_bedrock_streaming_response(
+            events(), "tid-1", flush_bytes=256, flush_ms=20
+        ):
+            for _, text in self._delta_texts([frame]):
+                texts.append((text, second_sent.is_set()))
+
+        assert texts == [("a", False), ("b", True)]
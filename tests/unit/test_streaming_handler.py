@@ -258,12 +258,13 @@ class TestMakeBackendRequest:
 
         mock_response = mocker.Mock()
         mock_response.text = '{"result": "success"}'
+        mock_response.content = b'{"result": "success"}'
         mock_response.headers = {"content-type": "application/json"}
         mock_response.status_code = 200
         mock_response.raise_for_status = mocker.Mock()
         mock_response.json.return_value = {"result": "success"}
 
-        mock_post = mocker.patch("requests.post", return_value=mock_response)
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
 
         result = make_backend_request(
             url="https://api.example.com/v1/chat",
@@ -276,10 +277,39 @@ class TestMakeBackendRequest:
 
         assert result.success is True
         assert result.response_data == {"result": "success"}
+        assert result.body == b'{"result": "success"}'
         assert result.status_code == 200
         assert result.error_message is None
         mock_post.assert_called_once()
 
+    def test_forwarded_body_is_not_parsed(self, mocker):
+        """Test that parse_json=False returns the raw body without parsing it."""
+        from handlers.streaming_handler import make_backend_request
+
+        mock_response = mocker.Mock()
+        mock_response.text = '{"data": []}'
+        mock_response.content = b'{"data": []}'
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.status_code = 200
+        mock_response.raise_for_status = mocker.Mock()
+
+        mocker.patch("requests.Session.post", return_value=mock_response)
+
+        result = make_backend_request(
+            url="https://api.example.com/v1/embeddings",
+            headers={},
+            payload={"input": "text"},
+            model="text-embedding-3-small",
+            tid="test-trace-id",
+            is_claude_model_fn=lambda m: False,
+            parse_json=False,
+        )
+
+        assert result.success is True
+        assert result.response_data is None
+        assert result.body == b'{"data": []}'
+        mock_response.json.assert_not_called()
+
     def test_http_error_with_json_body(self, mocker):
         """Test HTTP error with JSON error body."""
         import requests
@@ -294,7 +324,7 @@ class TestMakeBackendRequest:
             response=mock_response
         )
 
-        mocker.patch("requests.post", return_value=mock_response)
+        mocker.patch("requests.Session.post", return_value=mock_response)
 
         result = make_backend_request(
             url="https://api.example.com/v1/chat",
@@ -311,13 +341,43 @@ class TestMakeBackendRequest:
         # When JSON body is returned, error_message is None - error info is in response_data
         assert result.error_message is None
 
+    def test_http_error_keeps_status_of_real_response(self, mocker):
+        """Test that a real 429 response is relayed as 429, not 500.
+
+        requests.Response is falsy for error statuses, so the error path must
+        not test the response object's truthiness.
+        """
+        import requests
+        from handlers.streaming_handler import make_backend_request
+
+        response = requests.Response()
+        response.status_code = 429
+        response.headers["Retry-After"] = "3"
+        response._content = b'{"error": "Too many requests"}'
+
+        mocker.patch("requests.Session.post", return_value=response)
+
+        result = make_backend_request(
+            url="https://api.example.com/v1/chat",
+            headers={},
+            payload={},
+            model="gpt-4",
+            tid="test-trace-id",
+            is_claude_model_fn=lambda m: False,
+        )
+
+        assert result.success is False
+        assert result.status_code == 429
+        assert result.response_data == {"error": "Too many requests"}
+        assert result.headers["Retry-After"] == "3"
+
     def test_connection_timeout(self, mocker):
         """Test connection timeout handling."""
         import requests
         from handlers.streaming_handler import make_backend_request
 
         mocker.patch(
-            "requests.post",
+            "requests.Session.post",
             side_effect=requests.exceptions.Timeout("Connection timed out"),
         )
 
@@ -348,7 +408,7 @@ data: [DONE]"""
         mock_response.headers = {"content-type": "text/event-stream"}
         mock_response.raise_for_status = mocker.Mock()
 
-        mocker.patch("requests.post", return_value=mock_response)
+        mocker.patch("requests.Session.post", return_value=mock_response)
 
         result = make_backend_request(
             url="https://api.example.com/v1/chat",
@@ -370,13 +430,14 @@ data: [DONE]"""
 
         mock_response = mocker.Mock()
         mock_response.text = '{"choices": [{"message": {"content": "Hello"}}]}'
+        mock_response.content = mock_response.text.encode()
         mock_response.headers = {"content-type": "application/json"}
         mock_response.raise_for_status = mocker.Mock()
         mock_response.json.return_value = {
             "choices": [{"message": {"content": "Hello"}}]
         }
 
-        mocker.patch("requests.post", return_value=mock_response)
+        mocker.patch("requests.Session.post", return_value=mock_response)
 
         result = make_backend_request(
             url="https://api.example.com/v1/chat",
@@ -397,11 +458,12 @@ data: [DONE]"""
 
         mock_response = mocker.Mock()
         mock_response.text = '{"result": "ok"}'
+        mock_response.content = b'{"result": "ok"}'
         mock_response.headers = {"content-type": "application/json"}
         mock_response.raise_for_status = mocker.Mock()
         mock_response.json.return_value = {"result": "ok"}
 
-        mock_post = mocker.patch("requests.post", return_value=mock_response)
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
 
         make_backend_request(
             url="https://api.example.com/v1/chat",
@@ -416,3 +478,48 @@ data: [DONE]"""
         # Verify timeout was passed
         call_kwargs = mock_post.call_args[1]
         assert call_kwargs["timeout"] == 60
+
+    def test_payload_sent_as_orjson_bytes(self, mocker):
+        """Test that the payload is posted as orjson bytes with a JSON type."""
+        import orjson
+        from handlers.streaming_handler import make_backend_request
+
+        mock_response = mocker.Mock()
+        mock_response.text = '{"result": "ok"}'
+        mock_response.content = b'{"result": "ok"}'
+        mock_response.headers = {"content-type": "application/json"}
+        mock_response.raise_for_status = mocker.Mock()
+        mock_response.json.return_value = {"result": "ok"}
+
+        mock_post = mocker.patch("requests.Session.post", return_value=mock_response)
+        headers = {"Authorization": "Bearer token"}
+        payload = {"model": "gpt-4", "messages": [{"role": "user", "content": "é"}]}
+
+        make_backend_request(
+            url="https://api.example.com/v1/chat",
+            headers=headers,
+            payload=payload,
+            model="gpt-4",
+            tid="test-trace-id",
+            is_claude_model_fn=lambda m: False,
+        )
+
+        call_kwargs = mock_post.call_args[1]
+        assert "json" not in call_kwargs
+        assert orjson.loads(call_kwargs["data"]) == payload
+        assert call_kwargs["headers"]["Content-Type"] == "application/json"
+        assert "Content-Type" not in headers
+
+    def test_backend_session_is_shared_and_pooled(self):
+        """Test that backend calls reuse one pooled Session without retries."""
+        from handlers.streaming_handler import (
+            BACKEND_POOL_MAXSIZE,
+            _get_backend_session,
+        )
+
+        session = _get_backend_session()
+        assert _get_backend_session() is session
+
+        adapter = session.get_adapter("https://api.example.com")
+        assert adapter._pool_maxsize == BACKEND_POOL_MAXSIZE
+        assert adapter.max_retries.total == 0
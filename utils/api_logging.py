@@ -1,6 +1,7 @@
 """HTTP request/response logging utilities for transport layer debugging."""
 
 import json
+import logging
 from typing import Dict, Any, Optional
 from logging import Logger
 
@@ -24,6 +25,10 @@ def log_original_request(
         request: Request object containing method, URL, headers, etc.
         payload: Optional request payload (will be JSON serialized if dict/list)
     """
+    # Skip building and pretty-printing the dump when it would be discarded
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     # Sanitize the headers to avoid log of the sensitive information
     log_data = {
         "trace_id": trace_id,
@@ -71,6 +76,9 @@ def dump_http_response(
         payload: Response payload (will be JSON serialized if dict/list)
         url: Optional URL for additional context
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     log_data = {
         "trace_id": trace_id,
         "type": "response",
@@ -32,26 +32,29 @@ def handle_http_429_error(http_err: HTTPError, context: str = "request") -> tupl
         ...     if e.response.status_code == 429:
         ...         return handle_http_429_error(e, "chat completion")
     """
-    logger.error(f"HTTP 429 Rate Limit Error for {context}")
-    logger.error(f"HTTP 429 Response Headers:")
-
-    # Dump all response headers to console for debugging
-    for header_name, header_value in http_err.response.headers.items():
-        logger.error(f"  {header_name}: {header_value}")
+    response = http_err.response
+    # Copy the headers once; the same dict is logged and returned
+    headers = dict(response.headers)
 
     # Log response body if available
     try:
-        response_body = http_err.response.text
-        logger.error(f"HTTP 429 Response Body: {response_body}")
+        response_body = response.text
     except Exception as body_err:
-        logger.error(f"Could not read 429 response body: {body_err}")
+        response_body = f"<unreadable: {body_err}>"
+
+    logger.error(
+        "HTTP 429 Rate Limit Error for %s, headers=%s, body=%s",
+        context,
+        headers,
+        response_body,
+    )
 
     # Return 429 error to client with retry information
     error_response = {
         "error": "Rate limit exceeded",
         "status_code": 429,
         "message": "Too many requests. Please retry after some time.",
-        "headers": dict(http_err.response.headers),
+        "headers": headers,
     }
 
     return error_response, 429
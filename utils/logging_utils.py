@@ -10,12 +10,22 @@ This module sets up a hierarchical logging structure with specialized loggers:
 Child loggers are initialized lazily on first access to avoid creating empty log files.
 """
 
+import functools
 import gzip
+import itertools
+import json
 import logging
 import os
 import shutil
 import threading
+import time
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    from fastapi import Request
 
 DEFAULT_LOG_FOLDER = "logs"
 ARCHIVE_AGE_HOURS = 24  # 1 day in hours
@@ -247,5 +257,130 @@ def get_client_logger(name: str) -> logging.Logger:
     return logging.getLogger("app.client." + name)
 
 
+class LazyJson:
+    """Log argument that serializes an object to JSON only when formatted.
+
+    Pass it as a %-style logging argument so the (potentially large) payload
+    is not serialized when the record is filtered out by level. Serialization
+    uses orjson.
+
+    Args:
+        obj: JSON-serializable object to log
+        limit: Optional maximum number of characters to emit
+        indent: Optional indentation for pretty-printed output
+    """
+
+    __slots__ = ("obj", "limit", "indent")
+
+    def __init__(
+        self, obj: Any, limit: int | None = None, indent: int | None = None
+    ) -> None:
+        self.obj = obj
+        self.limit = limit
+        self.indent = indent
+
+    def __str__(self) -> str:
+        # orjson only pretty-prints with two spaces, so any indent maps to that
+        option = orjson.OPT_NON_STR_KEYS
+        if self.indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            text = orjson.dumps(self.obj, option=option).decode()
+        except TypeError:
+            # Types orjson rejects (e.g. ints beyond 64 bits) still log as before
+            text = json.dumps(self.obj, indent=self.indent)
+        return text if self.limit is None else text[: self.limit]
+
+
+def truncate_body(body: bytes, limit: int) -> str:
+    """Decode a raw HTTP body for logging, keeping at most ``limit`` bytes.
+
+    Args:
+        body: Raw body bytes
+        limit: Maximum number of bytes to keep; 0 keeps the whole body
+
+    Returns:
+        The decoded body, suffixed with "...[truncated]" when cut short
+    """
+    if limit and len(body) > limit:
+        return body[:limit].decode("utf-8", errors="replace") + "...[truncated]"
+    return body.decode("utf-8", errors="replace")
+
+
+@functools.lru_cache(maxsize=1024)
+def truncate_user_id(user_id: str, limit: int = 20) -> str:
+    """Shorten a client credential for usage logs.
+
+    Clients resend the same Authorization value on every request, so results
+    are cached and the truncated string is built once per credential.
+
+    Args:
+        user_id: Raw client identifier (e.g. the Authorization header)
+        limit: Number of leading characters to keep
+
+    Returns:
+        ``user_id`` unchanged if short enough, else its prefix plus "..."
+    """
+    return user_id[:limit] + "..." if len(user_id) > limit else user_id
+
+
+def client_log_identity(request: "Request | None") -> tuple[str, str]:
+    """Return the (user id, client IP) pair written to usage log lines.
+
+    Args:
+        request: Incoming client request, if any
+
+    Returns:
+        Truncated Authorization value (or "unknown") and the client host
+        (or "unknown_ip")
+    """
+    if not request:
+        return "unknown", "unknown_ip"
+    user_id = truncate_user_id(request.headers.get("Authorization", "unknown"))
+    ip_address = request.client.host if request.client else "unknown_ip"
+    return user_id, ip_address
+
+
+# Trace ids only need to be unique across this proxy's logs: a per-process
+# prefix (start time and pid) plus a counter avoids the os.urandom call and
+# string formatting of str(uuid.uuid4()) on every request.
+_trace_id_prefix = f"{time.time_ns():x}-{os.getpid():x}-"
+_trace_id_counter = itertools.count()
+
+
+def new_trace_id() -> str:
+    """Return a new trace id (tid) for correlating a request's log lines."""
+    return f"{_trace_id_prefix}{next(_trace_id_counter):x}"
+
+
+# Unexpected errors still get a traceback, but at most once per exception type
+# per interval: under an upstream outage every request fails the same way and
+# formatting identical tracebacks would dominate CPU.
+TRACEBACK_INTERVAL_SECONDS = 60.0
+_traceback_last_logged: dict[type, float] = {}
+
+
+def traceback_allowed(exc: BaseException) -> bool:
+    """Return whether a traceback for ``exc`` should be logged now.
+
+    Pass the result as ``exc_info`` so repeated failures of the same type log
+    their message every time but their traceback only once per
+    ``TRACEBACK_INTERVAL_SECONDS``.
+
+    Args:
+        exc: The exception being logged
+
+    Returns:
+        True if no traceback for this exception type was logged recently
+    """
+    now = time.monotonic()
+    exc_type = type(exc)
+    last = _traceback_last_logged.get(exc_type)
+    if last is not None and now - last < TRACEBACK_INTERVAL_SECONDS:
+        return False
+    _traceback_last_logged[exc_type] = now
+    return True
+
+
 # Initialize logging when module is imported
 init_logging()
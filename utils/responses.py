@@ -0,0 +1,52 @@
+"""Response classes for the LLM proxy routers.
+
+This module provides a JSON response that serializes with orjson, used on the
+request hot paths where response bodies are large model outputs, and the
+relay of failed backend requests to the client.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+if TYPE_CHECKING:
+    from handlers.streaming_handler import BackendRequestResult
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib json module.
+
+    Output is compact JSON, equivalent to JSONResponse's own rendering.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def backend_error_response(result: "BackendRequestResult") -> OrjsonResponse:
+    """Relay a failed backend request to the client.
+
+    The backend's JSON error body is forwarded with its status code, falling
+    back to the error message. For 429 responses the backend's Retry-After
+    header is passed on so clients can back off.
+
+    Args:
+        result: Unsuccessful result from make_backend_request
+
+    Returns:
+        Error response with the backend status code
+    """
+    headers = None
+    if result.status_code == 429 and result.headers:
+        retry_after = result.headers.get("Retry-After") or result.headers.get(
+            "retry-after"
+        )
+        if retry_after:
+            headers = {"Retry-After": retry_after}
+
+    return OrjsonResponse(
+        result.response_data or {"error": result.error_message or "Unknown error"},
+        status_code=result.status_code,
+        headers=headers,
+    )
@@ -4,12 +4,12 @@ Unified retry logic for rate-limited requests across the proxy.
 This module provides:
 - Centralized retry configuration
 - Single retry_on_rate_limit() function with comprehensive error detection
-- Retry decorator with exponential backoff
+- Retry decorator with jittered exponential backoff
 """
 
 import logging
 from botocore.exceptions import ClientError
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import RetryCallState, retry, stop_after_attempt, wait_random_exponential
 
 logger = logging.getLogger("proxy_server")
 
@@ -21,6 +21,13 @@ RETRY_MULTIPLIER = (
 RETRY_MIN_WAIT = 1  # Minimum wait time in seconds
 RETRY_MAX_WAIT = 16  # Maximum wait time in seconds
 
+# Exponential backoff with full jitter: each wait is drawn uniformly between
+# RETRY_MIN_WAIT and the exponential cap, so clients throttled together do
+# not retry in lockstep.
+RETRY_WAIT = wait_random_exponential(
+    multiplier=RETRY_MULTIPLIER, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT
+)
+
 
 def retry_on_rate_limit(exception) -> bool:
     """
@@ -75,15 +82,21 @@ def retry_on_rate_limit(exception) -> bool:
     )
 
 
-# Create the retry decorator with exponential backoff
+def _log_before_sleep(retry_state: RetryCallState) -> None:
+    """Log a rate-limit retry before tenacity sleeps."""
+    logger.warning(
+        "Rate limit hit, retrying in %s seconds (attempt %s/%s): %s",
+        retry_state.next_action.sleep if retry_state.next_action else "unknown",
+        retry_state.attempt_number,
+        RETRY_MAX_ATTEMPTS,
+        retry_state.outcome.exception() if retry_state.outcome else "unknown error",
+    )
+
+
+# Create the retry decorator once at import; it is shared by all call sites
 unified_retry = retry(
     stop=stop_after_attempt(RETRY_MAX_ATTEMPTS),
-    wait=wait_exponential(
-        multiplier=RETRY_MULTIPLIER, min=RETRY_MIN_WAIT, max=RETRY_MAX_WAIT
-    ),
+    wait=RETRY_WAIT,
     retry=retry_on_rate_limit,
-    before_sleep=lambda retry_state: logger.warning(
-        f"Rate limit hit, retrying in {retry_state.next_action.sleep if retry_state.next_action else 'unknown'} seconds "
-        f"(attempt {retry_state.attempt_number}/{RETRY_MAX_ATTEMPTS}): {str(retry_state.outcome.exception()) if retry_state.outcome else 'unknown error'}"
-    ),
+    before_sleep=_log_before_sleep,
 )
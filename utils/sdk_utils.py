@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import logging
 import os
@@ -164,6 +165,8 @@ def __get_ai_api_client(
     return client
 
 
+# Deployment URLs come from the static config, so each URL is parsed once.
+@functools.lru_cache(maxsize=1024)
 def extract_deployment_id(deployment_url: str) -> str:
     """
     Extract deployment ID from SAP AI Core deployment URL.